@@ -1,15 +1,22 @@
 """skill-issues: Local-first issue tracking and session memory for Claude Code."""
 
 import os
-import subprocess
 import sys
 from pathlib import Path
 
+from skill_issues import gitconfig
+
 __version__ = "0.1.0"
 
 # Override for project root (set via CLI --root or programmatically)
 _project_root_override: Path | None = None
 
+# Roots found by find_project_root(), keyed on (SKILL_ISSUES_ROOT, cwd)
+_project_root_cache: dict[tuple[str, str], Path] = {}
+
+# Number of filesystem probes made while resolving project roots
+root_stat_calls = 0
+
 
 def set_project_root(path: Path | str | None) -> None:
     """Set an explicit project root override.
@@ -21,6 +28,9 @@ def set_project_root(path: Path | str | None) -> None:
         path: Absolute path to use as project root, or None to clear.
     """
     global _project_root_override
+    _project_root_cache.clear()
+    # Repo-local git config depends on the project
+    gitconfig.clear_cache()
     if path is None:
         _project_root_override = None
     else:
@@ -37,6 +47,10 @@ def find_project_root(data_dir_name: str = ".issues") -> Path:
     4. Walk up from cwd looking for .git directory
     5. Fall back to current working directory
 
+    The result is cached per process, keyed on SKILL_ISSUES_ROOT and the
+    cwd, and the cache is cleared by set_project_root(). A data directory
+    created above an already-resolved cwd is only seen after that.
+
     Args:
         data_dir_name: The data directory to look for when walking up.
                       Defaults to ".issues" but can be ".sessions".
@@ -48,8 +62,24 @@ def find_project_root(data_dir_name: str = ".issues") -> Path:
     if _project_root_override is not None:
         return _project_root_override
 
-    # 2. Environment variable
     env_root = os.environ.get("SKILL_ISSUES_ROOT", "").strip()
+    key = (env_root, os.getcwd())
+    root = _project_root_cache.get(key)
+    if root is None:
+        root = _project_root_cache[key] = _resolve_project_root(env_root)
+    return root
+
+
+def _probe(path: Path, want_dir: bool) -> bool:
+    """Check for a directory (or any file), counting the stat call."""
+    global root_stat_calls
+    root_stat_calls += 1
+    return path.is_dir() if want_dir else path.exists()
+
+
+def _resolve_project_root(env_root: str) -> Path:
+    """Resolve the project root from the environment and cwd, uncached."""
+    # 2. Environment variable
     if env_root:
         return Path(env_root).resolve()
 
@@ -59,7 +89,7 @@ def find_project_root(data_dir_name: str = ".issues") -> Path:
     # Check for both .issues and .sessions to find the nearest one
     current = cwd
     while True:
-        if (current / ".issues").is_dir() or (current / ".sessions").is_dir():
+        if _probe(current / ".issues", True) or _probe(current / ".sessions", True):
             return current
         parent = current.parent
         if parent == current:  # Reached filesystem root
@@ -69,7 +99,7 @@ def find_project_root(data_dir_name: str = ".issues") -> Path:
     # 4. Walk up looking for .git
     current = cwd
     while True:
-        if (current / ".git").exists():
+        if _probe(current / ".git", False):
             return current
         parent = current.parent
         if parent == current:  # Reached filesystem root
@@ -83,13 +113,12 @@ def find_project_root(data_dir_name: str = ".issues") -> Path:
 def get_project_root() -> Path:
     """Get the resolved project root.
 
-    This is a convenience wrapper around find_project_root() that
-    caches the result for the lifetime of the process.
+    This is a convenience wrapper around find_project_root(), which
+    caches its result until the override, environment or cwd changes.
 
     Returns:
         Path to the project root directory.
     """
-    # Note: We don't cache because the override might change
     return find_project_root()
 
 
@@ -107,18 +136,7 @@ class PrefixError(Exception):
 
 def _get_git_config(key: str) -> str | None:
     """Get a git config value, returning None if not set or git unavailable."""
-    try:
-        result = subprocess.run(
-            ["git", "config", "--get", key],
-            capture_output=True,
-            text=True,
-            timeout=5,
-        )
-        if result.returncode == 0:
-            return result.stdout.strip()
-    except (subprocess.TimeoutExpired, FileNotFoundError, OSError):
-        pass
-    return None
+    return gitconfig.get(key)
 
 
 def _derive_prefix_from_name(name: str) -> str | None:
@@ -0,0 +1,69 @@
+"""
+Batch mode shared by `issues batch` and `sessions batch`.
+
+Agents often run a string of writes at the start or end of a session. In
+batch mode each stdin line is a JSON command such as
+{"op": "close", "id": "dp-001", "reason": "Done"}, and one JSON result is
+printed per command, as soon as it has run. Every command checks against the
+same in-memory projection, including the effects of earlier commands. The
+resulting events are appended in a single write once stdin is exhausted.
+"""
+
+import json
+from collections.abc import Callable, Iterable
+from typing import Any, TextIO
+
+Handler = Callable[[dict[str, Any]], dict[str, Any]]
+
+
+def list_arg(value: Any) -> list[str] | None:
+    """Accept a list of strings or a comma-separated string, like the CLI flags."""
+    if value is None:
+        return None
+    if isinstance(value, str):
+        return [item.strip() for item in value.split(",") if item.strip()] or None
+    if not isinstance(value, list) or not all(isinstance(item, str) for item in value):
+        raise ValueError(f"Expected a list of strings, got {value!r}")
+    return value
+
+
+def run_batch(
+    lines: Iterable[str],
+    handlers: dict[str, Handler],
+    commit: Callable[[], None],
+    out: TextIO,
+) -> int:
+    """Run JSON-lines commands, printing one JSON result line per command.
+
+    A command that fails prints {"error": ...} and writes nothing; the rest
+    still run. commit() is called once at the end to write every event.
+
+    Returns:
+        Exit code: 0 if every command succeeded, 1 otherwise.
+    """
+    failed = False
+    for line in lines:
+        if not line.strip():
+            continue
+        try:
+            command = json.loads(line)
+            if not isinstance(command, dict):
+                raise ValueError("Each line must be a JSON object")
+            op = command.get("op")
+            if op not in handlers:
+                raise ValueError(f"Unknown op: {op!r} (expected one of {', '.join(handlers)})")
+            result = handlers[op](command)
+        except KeyError as e:
+            result = {"error": f"Missing field: {e.args[0]}"}
+        except (ValueError, TypeError) as e:
+            result = {"error": str(e)}
+        if "error" in result:
+            failed = True
+        out.write(json.dumps(result) + "\n")
+        out.flush()
+    try:
+        commit()
+    except OSError as e:
+        out.write(json.dumps({"error": f"Failed to write events: {e}"}) + "\n")
+        return 1
+    return 1 if failed else 0
@@ -0,0 +1,70 @@
+"""
+Startup context for agents: `issues context`.
+
+Agents starting a session typically run `issues --ready`, `sessions`,
+`sessions --open-questions` and `sessions --next-actions`. build_context()
+gives the same information as one JSON document, loading each store once,
+with a size limit on every list so the document stays small on long-lived
+projects.
+"""
+
+from typing import Any
+
+from skill_issues import get_user_prefix
+from skill_issues.issues import store as issues_store
+from skill_issues.sessions import store as sessions_store
+
+# Defaults for the per-section size limits
+DEFAULT_SESSIONS = 3
+DEFAULT_LIMIT = 20
+
+
+def build_context(
+    user: str | None = "",
+    sessions: int = DEFAULT_SESSIONS,
+    limit: int = DEFAULT_LIMIT,
+) -> dict[str, Any]:
+    """Build the startup context document.
+
+    Args:
+        user: Whose sessions to include: "" for the current user, None for
+            all users, or a user prefix.
+        sessions: Number of most recent sessions to include.
+        limit: Maximum number of ready issues, open questions and next
+            actions to include.
+
+    Returns:
+        A dict with "ready" issues (by priority, then ID), the last
+        "sessions", deduplicated "open_questions" and "next_actions" (most
+        recent kept), and "omitted" counting the items each list left out.
+    """
+    if user == "":
+        user, _ = get_user_prefix()
+
+    ready = sorted(issues_store.query_issues("ready").values(), key=lambda x: (x.get("priority", 2), x["id"]))
+    all_sessions = sessions_store.query_sessions(user)
+    questions = sessions_store.aggregate_open_questions(all_sessions)
+
+    actions = []
+    seen: set[str] = set()
+    for action in sessions_store.aggregate_next_actions(all_sessions):
+        if action["action"] not in seen:
+            seen.add(action["action"])
+            actions.append(action)
+
+    sections = {
+        "ready": (ready, ready[:limit]),
+        "sessions": (all_sessions, all_sessions[-sessions:] if sessions > 0 else []),
+        # Questions are oldest first, so keep the newest
+        "open_questions": (questions, questions[-limit:] if limit > 0 else []),
+        # Actions are newest first already
+        "next_actions": (actions, actions[:limit]),
+    }
+    context: dict[str, Any] = {"user": user}
+    omitted = {}
+    for name, (full, kept) in sections.items():
+        context[name] = kept
+        if len(kept) < len(full):
+            omitted[name] = len(full) - len(kept)
+    context["omitted"] = omitted
+    return context
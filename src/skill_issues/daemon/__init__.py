@@ -0,0 +1,190 @@
+"""
+Opt-in local daemon that keeps projections hot between commands.
+
+`issues daemon start` launches a background process for the current project
+(see skill_issues.daemon.server). It listens on a Unix domain socket and runs
+`issues` and `sessions` command lines in-process, so a query skips most
+imports, and the projections stay in memory, reloaded only when an event
+file's size or mtime changes (see eventlog.memoized()). The console scripts
+forward to the daemon when one is running for the project and run directly
+when it is not.
+
+This module is the client side. It is imported by the CLIs before anything
+else, so it keeps its own imports light.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import socket
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+from skill_issues import find_project_root
+
+# Subcommands that need the client's terminal, stdin or filesystem view
+LOCAL_COMMANDS = {"board", "init", "daemon", "batch"}
+
+# Seconds to wait for a newly started daemon to accept connections
+START_TIMEOUT = 5.0
+
+# Seconds a client waits to connect before running the command directly
+CONNECT_TIMEOUT = 1.0
+
+# Set in the daemon process, so commands it runs never forward to itself
+_serving = False
+
+
+def is_supported() -> bool:
+    """Check whether this platform has Unix domain sockets."""
+    return hasattr(socket, "AF_UNIX")
+
+
+def get_socket_path(root: Path) -> Path:
+    """Get the daemon socket path for a project root.
+
+    Sockets live in the per-user runtime directory (or the temp directory),
+    named after a hash of the root so each project gets its own daemon.
+    """
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if not runtime_dir:
+        import tempfile
+
+        runtime_dir = tempfile.gettempdir()
+    digest = hashlib.sha1(str(root).encode()).hexdigest()[:16]
+    return Path(runtime_dir) / f"skill-issues-{os.getuid()}-{digest}.sock"
+
+
+# --- Client ---
+
+class DaemonError(Exception):
+    """Raised when the daemon accepted a request but did not answer it."""
+
+
+def _connect(root: Path) -> socket.socket | None:
+    """Connect to the project's daemon, or return None if none is running."""
+    if not is_supported():
+        return None
+    path = get_socket_path(root)
+    if not path.exists():
+        return None
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(CONNECT_TIMEOUT)
+    try:
+        sock.connect(str(path))
+    except OSError:
+        sock.close()
+        return None
+    # Commands such as `issues index` can take a while, so don't time out the answer
+    sock.settimeout(None)
+    return sock
+
+
+def _request(root: Path, message: dict[str, Any]) -> dict[str, Any] | None:
+    """Send one request to the daemon and return its response.
+
+    Returns None if no daemon is running. Raises DaemonError if the daemon
+    went away after receiving the request, since it may have run it.
+    """
+    sock = _connect(root)
+    if sock is None:
+        return None
+    with sock:
+        try:
+            sock.sendall(json.dumps(message).encode() + b"\n")
+            with sock.makefile("rb") as f:
+                line = f.readline()
+        except OSError as e:
+            raise DaemonError(str(e)) from e
+    if not line:
+        raise DaemonError("daemon closed the connection")
+    return json.loads(line)
+
+
+def _split_root(argv: list[str]) -> tuple[Path, list[str]]:
+    """Return the project root a command line targets and its other arguments."""
+    parser = argparse.ArgumentParser(add_help=False)
+    parser.add_argument("--root")
+    args, rest = parser.parse_known_args(argv)
+    if args.root:
+        return (Path(args.root).resolve(), rest)
+    return (find_project_root(), rest)
+
+
+def forward(prog: str, argv: list[str]) -> int | None:
+    """Run a command line through the project's daemon, if one is running.
+
+    Args:
+        prog: "issues" or "sessions".
+        argv: Command-line arguments, without the program name.
+
+    Returns:
+        The command's exit code, or None if it should run directly.
+    """
+    if _serving or not is_supported():
+        return None
+    root, rest = _split_root(argv)
+    positionals = [arg for arg in rest if not arg.startswith("-")]
+    if positionals and positionals[0] in LOCAL_COMMANDS:
+        return None
+    try:
+        response = _request(root, {
+            "op": "run",
+            "prog": prog,
+            # The daemon's cwd differs, so pass the root already resolved
+            "argv": ["--root", str(root), *rest],
+            "prefix": os.environ.get("SKILL_ISSUES_PREFIX"),
+        })
+    except DaemonError as e:
+        print(f"Error: skill-issues daemon failed: {e}", file=sys.stderr)
+        return 1
+    if response is None:
+        return None
+    sys.stdout.write(response["stdout"])
+    sys.stderr.write(response["stderr"])
+    return response["code"]
+
+
+def status(root: Path) -> dict[str, Any] | None:
+    """Return the running daemon's pid and root, or None if there is none."""
+    try:
+        return _request(root, {"op": "ping"})
+    except DaemonError:
+        return None
+
+
+def start(root: Path) -> dict[str, Any]:
+    """Start a daemon for a project in the background, if none is running.
+
+    Returns the daemon's status. Raises DaemonError if it did not come up.
+    """
+    running = status(root)
+    if running is not None:
+        return running
+    import subprocess
+
+    subprocess.Popen(
+        [sys.executable, "-m", "skill_issues.daemon.server", str(root)],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+    deadline = time.monotonic() + START_TIMEOUT
+    while time.monotonic() < deadline:
+        running = status(root)
+        if running is not None:
+            return running
+        time.sleep(0.05)
+    raise DaemonError(f"daemon did not start within {START_TIMEOUT:g}s")
+
+
+def stop(root: Path) -> bool:
+    """Stop the project's daemon. Returns False if none was running."""
+    try:
+        return _request(root, {"op": "stop"}) is not None
+    except DaemonError:
+        return False
@@ -0,0 +1,132 @@
+"""
+Daemon process: serves CLI command lines for one project over a Unix socket.
+
+Run as `python -m skill_issues.daemon.server ROOT`; `issues daemon start`
+does this in the background. Requests are handled one at a time, so
+commands never race each other.
+"""
+
+import contextlib
+import io
+import json
+import os
+import signal
+import socketserver
+import sys
+import threading
+import traceback
+from pathlib import Path
+from typing import Any
+
+from skill_issues import daemon, eventlog, set_project_root
+
+
+def _cli_main(prog: str) -> Any:
+    if prog == "issues":
+        from skill_issues.issues.cli import main
+    elif prog == "sessions":
+        from skill_issues.sessions.cli import main
+    else:
+        raise ValueError(f"Unknown program: {prog}")
+    return main
+
+
+def run_command(root: Path, prog: str, argv: list[str], prefix: str | None = None) -> dict[str, Any]:
+    """Run a CLI command line in this process, capturing its output.
+
+    The environment and project root the command may change are restored
+    afterwards, so one command cannot leak state into the next.
+    """
+    stdout = io.StringIO()
+    stderr = io.StringIO()
+    saved_argv = sys.argv
+    saved_prefix = os.environ.get("SKILL_ISSUES_PREFIX")
+    sys.argv = [prog, *argv]
+    if prefix is None:
+        os.environ.pop("SKILL_ISSUES_PREFIX", None)
+    else:
+        os.environ["SKILL_ISSUES_PREFIX"] = prefix
+    # Also drops cached git config, picking up edits made since the last command
+    set_project_root(root)
+    try:
+        with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+            try:
+                code = _cli_main(prog)()
+            except SystemExit as e:
+                if isinstance(e.code, str):
+                    print(e.code, file=sys.stderr)
+                    code = 1
+                else:
+                    code = e.code
+            except Exception:
+                traceback.print_exc()
+                code = 1
+    finally:
+        sys.argv = saved_argv
+        if saved_prefix is None:
+            os.environ.pop("SKILL_ISSUES_PREFIX", None)
+        else:
+            os.environ["SKILL_ISSUES_PREFIX"] = saved_prefix
+        set_project_root(root)
+    return {"code": code or 0, "stdout": stdout.getvalue(), "stderr": stderr.getvalue()}
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    """Handle one JSON-line request per connection."""
+
+    server: "DaemonServer"
+
+    def handle(self) -> None:
+        line = self.rfile.readline()
+        if not line:
+            return
+        request = json.loads(line)
+        op = request.get("op")
+        if op == "run":
+            response = run_command(self.server.root, request["prog"], request["argv"], request.get("prefix"))
+        elif op == "ping":
+            response = {"pid": os.getpid(), "root": str(self.server.root)}
+        elif op == "stop":
+            response = {"stopped": os.getpid()}
+            # shutdown() waits for serve_forever() to return, so it can't run on this thread
+            threading.Thread(target=self.server.shutdown).start()
+        else:
+            response = {"error": f"Unknown op: {op}"}
+        self.wfile.write(json.dumps(response).encode() + b"\n")
+
+
+class DaemonServer(socketserver.UnixStreamServer):
+    """Socket server bound to one project root."""
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+        self.socket_path = daemon.get_socket_path(root)
+        # A socket left behind by a daemon that was killed would block bind()
+        self.socket_path.unlink(missing_ok=True)
+        old_umask = os.umask(0o177)
+        try:
+            super().__init__(str(self.socket_path), _Handler)
+        finally:
+            os.umask(old_umask)
+
+    def server_close(self) -> None:
+        super().server_close()
+        self.socket_path.unlink(missing_ok=True)
+
+
+def serve(root: Path) -> None:
+    """Serve commands for a project root until stopped."""
+    # Commands run here must not forward to the daemon themselves
+    daemon._serving = True
+    eventlog.enable_memo()
+    set_project_root(root)
+    server = DaemonServer(root)
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    serve(Path(sys.argv[1]).resolve())
@@ -0,0 +1,427 @@
+"""
+Event log helpers shared by the issues and sessions stores.
+
+Both stores keep their data in append-only JSONL files, one per user. This
+module holds the file-level plumbing: appending records, reading records
+from a byte offset, merging per-user files into one ordered stream,
+fingerprinting files so cached projections and change-feed cursors can
+detect rewrites, and the gitignored cache directory those projections are
+written to.
+"""
+
+import base64
+import functools
+import hashlib
+import heapq
+import json
+import os
+import threading
+from collections.abc import Callable, Iterable, Iterator
+from pathlib import Path
+from typing import Any, BinaryIO, TypeVar
+
+T = TypeVar("T")
+
+# Number of bytes hashed at the start of a file and before a saved offset
+FINGERPRINT_BYTES = 256
+
+# Fingerprint characters kept per file in change-feed cursors
+CURSOR_FINGERPRINT_CHARS = 16
+
+# Loaded projections, kept between calls by long-running processes (see
+# enable_memo()). None means memoization is off, as in one-shot commands.
+_memo: dict[str, tuple[Any, Any]] | None = None
+
+
+def get_cache_dir(data_dir: Path) -> Path:
+    """Get the cache directory for a data directory (e.g. .issues/.cache)."""
+    return data_dir / ".cache"
+
+
+def ensure_cache_dir(data_dir: Path) -> Path:
+    """Create the cache directory if missing and return its path.
+
+    The directory contains its own .gitignore so derived files never end up
+    in the repo alongside the event logs.
+    """
+    cache_dir = get_cache_dir(data_dir)
+    if not cache_dir.exists():
+        cache_dir.mkdir(parents=True, exist_ok=True)
+    gitignore = cache_dir / ".gitignore"
+    if not gitignore.exists():
+        gitignore.write_text("*\n")
+    return cache_dir
+
+
+def append_records(filepath: Path, records: list[dict[str, Any]]) -> None:
+    """Append JSON records to a file with a single O_APPEND write.
+
+    Only the final byte of the file is read, to check whether a newline is
+    needed before the new records, so the cost does not depend on file size.
+    """
+    if not records:
+        return
+    data = "".join(json.dumps(r, separators=(",", ":")) + "\n" for r in records).encode()
+    flags = os.O_RDWR | os.O_APPEND | os.O_CREAT | getattr(os, "O_BINARY", 0)
+    fd = os.open(filepath, flags, 0o644)
+    try:
+        if os.fstat(fd).st_size > 0:
+            os.lseek(fd, -1, os.SEEK_END)
+            if os.read(fd, 1) != b"\n":
+                data = b"\n" + data
+        written = os.write(fd, data)
+        # Regular files don't short-write in practice, but finish the job if one does
+        while written < len(data):
+            written += os.write(fd, data[written:])
+    finally:
+        os.close(fd)
+
+
+def read_records(filepath: Path, start: int = 0) -> tuple[list[dict[str, Any]], int]:
+    """Read JSONL records from a byte offset to the end of a file.
+
+    Args:
+        filepath: The JSONL file to read.
+        start: Byte offset to start reading from.
+
+    Returns:
+        Tuple of (records, end_offset) where end_offset is the number of
+        bytes consumed, suitable for passing back in as `start` later.
+    """
+    if not filepath.exists():
+        return ([], 0)
+    with open(filepath, "rb") as f:
+        f.seek(start)
+        data = f.read()
+    records = []
+    for line in data.splitlines():
+        if not line.strip():
+            continue
+        records.append(json.loads(line))
+    return (records, start + len(data))
+
+
+def iter_records(filepath: Path, start: int = 0, end: int | None = None) -> Iterator[dict[str, Any]]:
+    """Stream JSONL records from a byte range of a file, one line at a time.
+
+    Args:
+        filepath: The JSONL file to read.
+        start: Byte offset to start reading from.
+        end: Byte offset to stop at, or None to read to the end of the file.
+    """
+    for record, _, _ in iter_located_records(filepath, start, end):
+        yield record
+
+
+def iter_located_records(
+    filepath: Path, start: int = 0, end: int | None = None
+) -> Iterator[tuple[dict[str, Any], int, int]]:
+    """Like iter_records(), but yield (record, offset, length) for each line.
+
+    The offset and length cover the line including its newline, so the record
+    can be read back later with read_record_at().
+    """
+    if not filepath.exists():
+        return
+    with open(filepath, "rb") as f:
+        f.seek(start)
+        offset = start
+        remaining = end - start if end is not None else -1
+        for line in f:
+            if remaining >= 0:
+                if remaining == 0:
+                    break
+                line = line[:remaining]
+                remaining -= len(line)
+            if line.strip():
+                yield (json.loads(line), offset, len(line))
+            offset += len(line)
+
+
+def read_record_at(f: BinaryIO, offset: int, length: int) -> dict[str, Any]:
+    """Read the record stored at a byte range of an open file."""
+    f.seek(offset)
+    return json.loads(f.read(length))
+
+
+class OutOfOrderError(Exception):
+    """Raised when a log file's records turn out not to be in key order."""
+
+    def __init__(self, path: Path) -> None:
+        super().__init__(f"{path} is not in order")
+        self.path = path
+
+
+def _check_order(records: Iterable[T], key: Callable[[T], Any], path: Path) -> Iterator[T]:
+    """Pass records through, raising OutOfOrderError on the first regression."""
+    previous = None
+    for record in records:
+        current = key(record)
+        if previous is not None and current < previous:
+            raise OutOfOrderError(path)
+        previous = current
+        yield record
+
+
+def is_sorted(records: list[dict[str, Any]], key: Callable[[dict[str, Any]], Any]) -> bool:
+    """Check whether a list of records is already in key order."""
+    return all(key(a) <= key(b) for a, b in zip(records, records[1:]))
+
+
+def _iter_located(path: Path, start: int, end: int | None) -> Iterator[tuple[dict[str, Any], Path, int, int]]:
+    """Yield (record, path, offset, length) for the records of one file."""
+    for record, offset, length in iter_located_records(path, start, end):
+        yield (record, path, offset, length)
+
+
+def merge_files(
+    ranges: dict[Path, tuple[int, int | None]],
+    key: Callable[[dict[str, Any]], Any],
+    unsorted: set[Path] | frozenset[Path] = frozenset(),
+    located: bool = False,
+) -> Iterator[Any]:
+    """Merge per-file record streams into one stream ordered by key.
+
+    Append-only logs are normally already in order, so this is a heap merge
+    holding one pending record per file. Files listed in `unsorted` are read
+    and sorted in memory first; any other file that turns out to be out of
+    order raises OutOfOrderError part way through (see replay()). Ties are
+    broken by file order, then by position within the file.
+
+    Args:
+        ranges: Maps each file to the (start, end) byte range to read.
+        key: Sort key for records.
+        unsorted: Files known to be out of order.
+        located: Yield (record, path, offset, length) tuples instead of
+            bare records.
+    """
+    item_key: Callable[[Any], Any] = (lambda item: key(item[0])) if located else key
+    streams: list[Iterable[Any]] = []
+    for path, (start, end) in ranges.items():
+        records: Iterable[Any]
+        if located:
+            records = _iter_located(path, start, end)
+        else:
+            records = iter_records(path, start, end)
+        if path in unsorted:
+            streams.append(sorted(records, key=item_key))
+        else:
+            streams.append(_check_order(records, item_key, path))
+    return heapq.merge(*streams, key=item_key)
+
+
+def replay(
+    ranges: dict[Path, tuple[int, int | None]],
+    key: Callable[[dict[str, Any]], Any],
+    build: Callable[[Iterator[Any]], T],
+    located: bool = False,
+) -> T:
+    """Run build() over the merged record stream of several files.
+
+    If a file turns out to be out of order, build() is run again from
+    scratch with that file sorted in memory, so build() must not depend on
+    state left over from an earlier call. See merge_files() for `located`.
+    """
+    unsorted: set[Path] = set()
+    while True:
+        try:
+            return build(merge_files(ranges, key, unsorted, located))
+        except OutOfOrderError as e:
+            unsorted.add(e.path)
+
+
+def fingerprint(filepath: Path, offset: int) -> str:
+    """Fingerprint a file's content up to a byte offset.
+
+    Hashes the first bytes of the file and the bytes just before the offset.
+    A file that was rewritten (checkout, rebase, manual edit) rather than
+    appended to will almost always change one of the two.
+    """
+    h = hashlib.sha1()
+    with open(filepath, "rb") as f:
+        h.update(f.read(min(offset, FINGERPRINT_BYTES)))
+        tail_start = max(0, offset - FINGERPRINT_BYTES)
+        f.seek(tail_start)
+        h.update(f.read(offset - tail_start))
+    return h.hexdigest()
+
+
+def file_unchanged_since(filepath: Path, offset: int, saved_fingerprint: str) -> bool:
+    """Check whether a file still starts with the content seen at `offset`.
+
+    Returns False if the file shrank or its content up to `offset` differs,
+    meaning any projection built from it must be rebuilt from scratch.
+    """
+    try:
+        if filepath.stat().st_size < offset:
+            return False
+        return fingerprint(filepath, offset) == saved_fingerprint
+    except OSError:
+        return False
+
+
+def encode_cursor(positions: dict[str, tuple[int, str]]) -> str:
+    """Encode per-file (offset, fingerprint) positions as an opaque cursor."""
+    data = json.dumps({name: [offset, fp] for name, (offset, fp) in positions.items()}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(data.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> dict[str, tuple[int, str]]:
+    """Decode a cursor from encode_cursor(). Raises ValueError if it is malformed."""
+    try:
+        data = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        return {str(name): (int(offset), str(fp)) for name, (offset, fp) in data.items()}
+    except (ValueError, TypeError, AttributeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor!r}") from e
+
+
+def ranges_since(files: list[Path], cursor: str) -> tuple[dict[Path, tuple[int, int | None]], str, bool]:
+    """Work out which bytes of some files were appended since a cursor.
+
+    A cursor records the size each file had and a fingerprint of its content,
+    so a poll only reads the files' tails. An empty cursor means "from the
+    beginning".
+
+    Returns:
+        The byte range to read per file, the cursor for the end of those
+        ranges, and whether the cursor was reset: a file it covers was
+        rewritten or removed, so its ranges restart at 0 and consumers
+        should resync rather than apply a diff.
+    """
+    seen = decode_cursor(cursor) if cursor else {}
+    ranges: dict[Path, tuple[int, int | None]] = {}
+    positions: dict[str, tuple[int, str]] = {}
+    reset = any(name not in {path.name for path in files} for name in seen)
+    for path in files:
+        size = path.stat().st_size
+        start = 0
+        if path.name in seen:
+            offset, saved = seen[path.name]
+            if offset <= size and fingerprint(path, offset)[:len(saved)] == saved:
+                start = offset
+            else:
+                reset = True
+        ranges[path] = (start, size)
+        positions[path.name] = (size, fingerprint(path, size)[:CURSOR_FINGERPRINT_CHARS])
+    return (ranges, encode_cursor(positions), reset)
+
+
+def high_water_mark(
+    files: list[Path],
+    index_file: Path,
+    key: str,
+    number: Callable[[dict[str, Any]], int | None],
+) -> int:
+    """Return the highest number() over all records in some files.
+
+    The result is cached in index_file under `key` (typically a user
+    prefix) with the offset reached in each file, so later calls only scan
+    bytes appended since. A file that was rewritten is scanned again from
+    the start.
+
+    Args:
+        files: Files to scan. Missing files are skipped.
+        index_file: JSON cache file holding the high-water marks.
+        key: Cache key, so different number() functions don't collide.
+        number: Returns the number a record contributes, or None.
+    """
+    index = read_json_cache(index_file) or {}
+    entries: dict[str, dict[str, Any]] = index.get(key, {})
+    max_num = 0
+    changed = False
+    for path in files:
+        if not path.exists():
+            continue
+        entry = entries.get(path.name)
+        if entry is None or not file_unchanged_since(path, entry["offset"], entry["fingerprint"]):
+            entry = {"offset": 0, "max": 0}
+        if path.stat().st_size > entry["offset"]:
+            records, offset = read_records(path, entry["offset"])
+            numbers = [n for n in map(number, records) if n is not None]
+            entry = {
+                "offset": offset,
+                "fingerprint": fingerprint(path, offset),
+                "max": max([entry["max"], *numbers]),
+            }
+            entries[path.name] = entry
+            changed = True
+        max_num = max(max_num, entry["max"])
+    if changed:
+        index[key] = entries
+        write_json_cache(index_file, index)
+    return max_num
+
+
+def read_json_cache(path: Path) -> dict[str, Any] | None:
+    """Read a JSON cache file, returning None if missing or unreadable."""
+    try:
+        return json.loads(path.read_text())
+    except (OSError, ValueError):
+        return None
+
+
+def write_json_cache(path: Path, data: dict[str, Any]) -> None:
+    """Atomically write a JSON cache file, ignoring write failures.
+
+    Caches are an optimization only, so a read-only checkout or full disk
+    must never turn into a failed command.
+    """
+    # Unique per thread, since the TUIs load in worker threads
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        tmp_path.write_text(json.dumps(data, separators=(",", ":")))
+        os.replace(tmp_path, path)
+    except OSError:
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+
+
+def enable_memo() -> None:
+    """Keep projections from @memoized loaders in memory for this process.
+
+    Meant for long-running processes such as the daemon. Loaders return the
+    same objects while their files are unchanged, so callers must treat the
+    results as read-only.
+    """
+    global _memo
+    if _memo is None:
+        _memo = {}
+
+
+def _files_stamp(files: list[Path]) -> tuple[tuple[str, int, int], ...]:
+    stamps = []
+    for path in files:
+        st = path.stat()
+        stamps.append((str(path), st.st_size, st.st_mtime_ns))
+    return tuple(stamps)
+
+
+def memoized(files: Callable[[], list[Path]]) -> Callable[[Callable[[], T]], Callable[[], T]]:
+    """Decorate a loader to reuse its result while `files` are unchanged.
+
+    A file counts as changed when its size or mtime differs, or when files
+    are added or removed. Does nothing unless enable_memo() was called.
+    """
+    def decorate(load: Callable[[], T]) -> Callable[[], T]:
+        key = f"{load.__module__}.{load.__qualname__}"
+
+        @functools.wraps(load)
+        def wrapper() -> T:
+            if _memo is None:
+                return load()
+            try:
+                stamp = _files_stamp(files())
+            except OSError:
+                return load()
+            cached = _memo.get(key)
+            if cached is not None and cached[0] == stamp:
+                return cached[1]
+            value = load()
+            _memo[key] = (stamp, value)
+            return value
+
+        return wrapper
+
+    return decorate
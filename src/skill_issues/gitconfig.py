@@ -0,0 +1,269 @@
+"""
+Git config lookups for the user prefix.
+
+Spawning `git config` costs tens of milliseconds per key, paid on every
+command. The config files git would read are parsed here directly instead,
+and the result is cached per process and on disk, keyed on the files' sizes
+and mtimes. Config this parser does not handle (includes, worktree config,
+config injected through the environment) is left to git.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+# Git config keys read by get_user_prefix(), resolved together and cached
+GIT_CONFIG_KEYS = ("skill-issues.prefix", "user.name")
+
+# Environment variables that inject config git would see but files don't show
+_CONFIG_ENV = ("GIT_CONFIG_PARAMETERS", "GIT_CONFIG_COUNT", "GIT_CONFIG")
+
+# Values of GIT_CONFIG_KEYS for this process (see _load())
+_values: dict[str, str | None] | None = None
+
+
+class _UnsupportedConfig(Exception):
+    """Raised for config git must resolve itself (includes, worktree config)."""
+
+
+def _run_git_config(key: str) -> str | None:
+    """Get a git config value by running git, or None if unset or git is missing."""
+    import subprocess
+
+    try:
+        result = subprocess.run(
+            ["git", "config", "--get", key],
+            capture_output=True,
+            text=True,
+            timeout=5,
+        )
+        if result.returncode == 0:
+            return result.stdout.strip()
+    except (subprocess.TimeoutExpired, FileNotFoundError, OSError):
+        pass
+    return None
+
+
+def _find_git_dir() -> Path | None:
+    """Find the git directory for the cwd, the way git does."""
+    env_dir = os.environ.get("GIT_DIR")
+    if env_dir:
+        return Path(env_dir).resolve()
+    current = Path.cwd().resolve()
+    while True:
+        dot_git = current / ".git"
+        if dot_git.is_dir():
+            return dot_git
+        if dot_git.is_file():
+            # Worktrees and submodules point at their git directory
+            content = dot_git.read_text().strip()
+            if not content.startswith("gitdir:"):
+                return None
+            return (current / content[len("gitdir:"):].strip()).resolve()
+        parent = current.parent
+        if parent == current:
+            return None
+        current = parent
+
+
+def _config_files() -> list[Path]:
+    """List the config files git reads, lowest precedence first.
+
+    Missing files are included so that creating one changes the cache key.
+    """
+    files = []
+    if not os.environ.get("GIT_CONFIG_NOSYSTEM"):
+        files.append(Path(os.environ.get("GIT_CONFIG_SYSTEM") or "/etc/gitconfig"))
+    if os.environ.get("GIT_CONFIG_GLOBAL"):
+        files.append(Path(os.environ["GIT_CONFIG_GLOBAL"]))
+    else:
+        home = Path.home()
+        xdg_config = os.environ.get("XDG_CONFIG_HOME") or str(home / ".config")
+        files.append(Path(xdg_config) / "git" / "config")
+        files.append(home / ".gitconfig")
+    git_dir = _find_git_dir()
+    if git_dir is not None:
+        commondir = git_dir / "commondir"
+        if commondir.is_file():
+            common = (git_dir / commondir.read_text().strip()).resolve()
+            files.append(common / "config")
+        else:
+            files.append(git_dir / "config")
+        files.append(git_dir / "config.worktree")
+    return files
+
+
+def _unquote_value(raw: str) -> str:
+    """Parse the value part of a config line: quotes, escapes, comments."""
+    value = []
+    quoted = False
+    pending_space = ""
+    i = 0
+    while i < len(raw):
+        c = raw[i]
+        if c == '"':
+            quoted = not quoted
+        elif c == "\\" and i + 1 < len(raw):
+            i += 1
+            value.append(pending_space + {"n": "\n", "t": "\t", "b": "\b"}.get(raw[i], raw[i]))
+            pending_space = ""
+        elif c in "#;" and not quoted:
+            break
+        elif c.isspace() and not quoted:
+            # Inner whitespace is kept, trailing whitespace is dropped
+            if value:
+                pending_space += c
+        else:
+            value.append(pending_space + c)
+            pending_space = ""
+        i += 1
+    if quoted:
+        raise ValueError("unterminated quote")
+    return "".join(value)
+
+
+def _parse_config(text: str, keys: tuple[str, ...]) -> dict[str, str]:
+    """Get the last value of each of `keys` set in one config file's text.
+
+    Raises _UnsupportedConfig for include sections and ValueError for lines
+    this parser does not understand.
+    """
+    found = {}
+    section = None
+    lines = iter(text.splitlines())
+    for line in lines:
+        # Backslash-newline continues a value on the next line
+        while line.endswith("\\") and not line.endswith("\\\\"):
+            line = line[:-1] + next(lines, "")
+        stripped = line.strip()
+        if not stripped or stripped[0] in "#;":
+            continue
+        if stripped.startswith("["):
+            end = stripped.find("]")
+            if end < 0:
+                raise ValueError(f"bad section header: {line}")
+            header = stripped[1:end].strip()
+            name, _, subsection = header.partition(" ")
+            name = name.lower()
+            if name in ("include", "includeif"):
+                raise _UnsupportedConfig(header)
+            if subsection:
+                section = name + "." + subsection.strip().strip('"')
+            else:
+                section = name
+            stripped = stripped[end + 1:].strip()
+            if not stripped or stripped[0] in "#;":
+                continue
+        if section is None:
+            raise ValueError(f"entry outside a section: {line}")
+        name, eq, raw = stripped.partition("=")
+        full_key = f"{section}.{name.strip().lower()}"
+        if full_key in keys:
+            found[full_key] = _unquote_value(raw) if eq else "true"
+    return found
+
+
+def _read_config_files(files: list[Path], keys: tuple[str, ...]) -> dict[str, str | None]:
+    """Resolve `keys` from config files directly, later files winning."""
+    values: dict[str, str | None] = dict.fromkeys(keys)
+    for path in files:
+        if path.name == "config.worktree":
+            # Only read by git when extensions.worktreeConfig is set
+            if path.exists():
+                raise _UnsupportedConfig(str(path))
+            continue
+        try:
+            text = path.read_text(encoding="utf-8")
+        except FileNotFoundError:
+            continue
+        values.update(_parse_config(text, keys))
+    return values
+
+
+def _stamp(files: list[Path]) -> list[Any]:
+    """Describe config files and env by path, size and mtime, for the cache."""
+    stamp: list[Any] = [[name, os.environ.get(name)] for name in _CONFIG_ENV]
+    for path in files:
+        try:
+            st = path.stat()
+            stamp.append([str(path), st.st_size, st.st_mtime_ns])
+        except OSError:
+            stamp.append([str(path), None, None])
+    return stamp
+
+
+def _get_cache_file() -> Path | None:
+    """Get the on-disk git config cache, or None if the project has no data dir."""
+    from skill_issues import get_project_root
+
+    root = get_project_root()
+    for name in (".issues", ".sessions"):
+        if (root / name).is_dir():
+            return root / name / ".cache" / "git-config.json"
+    return None
+
+
+def _load() -> dict[str, str | None]:
+    """Resolve GIT_CONFIG_KEYS once per process.
+
+    Config files are parsed directly rather than by spawning git, and the
+    result is also cached on disk, keyed on the config files' sizes and
+    mtimes. Anything the parser can't handle (such as includes) falls back
+    to running git, and that result is not cached on disk, since the stamp
+    can't see the files git read.
+    """
+    global _values
+    if _values is not None:
+        return _values
+
+    try:
+        files = _config_files()
+        stamp = _stamp(files)
+    except OSError:
+        files, stamp = None, None
+
+    cache_file = _get_cache_file() if stamp is not None else None
+    if cache_file is not None:
+        try:
+            cached = json.loads(cache_file.read_text())
+            if cached["stamp"] == stamp:
+                _values = cached["values"]
+                return _values
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+
+    values = None
+    if files is not None and not any(os.environ.get(name) for name in _CONFIG_ENV):
+        try:
+            values = _read_config_files(files, GIT_CONFIG_KEYS)
+        except (_UnsupportedConfig, ValueError, OSError, UnicodeDecodeError):
+            values = None
+    if values is None:
+        values = {key: _run_git_config(key) for key in GIT_CONFIG_KEYS}
+        cache_file = None
+
+    if cache_file is not None:
+        from skill_issues.eventlog import ensure_cache_dir
+
+        try:
+            ensure_cache_dir(cache_file.parent.parent)
+            cache_file.write_text(json.dumps({"stamp": stamp, "values": values}))
+        except OSError:
+            pass
+    _values = values
+    return values
+
+
+def clear_cache() -> None:
+    """Forget this process's git config values, so the next lookup re-reads them."""
+    global _values
+    _values = None
+
+
+def get(key: str) -> str | None:
+    """Get a git config value, returning None if not set or git unavailable."""
+    values = _load()
+    if key in values:
+        return values[key]
+    return _run_git_config(key)
@@ -3,9 +3,11 @@
 import argparse
 import json
 import sys
+from collections.abc import Callable
+from typing import Any
 
-from skill_issues import maybe_show_prefix_hint, set_project_root
-from . import store
+from skill_issues import daemon, get_project_root, maybe_show_prefix_hint, set_project_root
+from skill_issues.output import add_output_arguments, non_negative_int, parse_fields, write_items
 
 
 def parse_list_arg(value: str) -> list[str] | None:
@@ -33,8 +35,61 @@ def looks_like_issue_id(arg: str) -> bool:
     return False
 
 
+def batch_handlers(batch: Any) -> dict[str, Callable[[dict[str, Any]], dict[str, Any]]]:
+    """Map `issues batch` ops to an IssueBatch, with the same results as the subcommands."""
+    from skill_issues.batch import list_arg
+
+    def create(command: dict[str, Any]) -> dict[str, Any]:
+        issue_type = command.get("type", "task")
+        priority = command.get("priority", 2)
+        if issue_type not in ("bug", "feature", "task"):
+            raise ValueError(f"Invalid issue type: {issue_type!r}")
+        if priority not in (0, 1, 2, 3, 4) or isinstance(priority, bool):
+            raise ValueError(f"Invalid priority: {priority!r}")
+        new_id = batch.create(
+            title=command["title"],
+            issue_type=issue_type,
+            priority=priority,
+            description=command.get("description", ""),
+            depends_on=list_arg(command.get("depends_on")),
+            labels=list_arg(command.get("labels")),
+        )
+        return {"created": new_id}
+
+    def close(command: dict[str, Any]) -> dict[str, Any]:
+        batch.close(command["id"], command["reason"])
+        return {"closed": command["id"]}
+
+    def note(command: dict[str, Any]) -> dict[str, Any]:
+        batch.note(command["id"], command["content"])
+        return {"noted": command["id"]}
+
+    def add_dep(command: dict[str, Any]) -> dict[str, Any]:
+        dep_ids = list_arg(command["dep_ids"])
+        if not dep_ids:
+            raise ValueError("No dependency IDs provided")
+        return {"issue": command["id"], "added_deps": batch.add_dependency(command["id"], dep_ids)}
+
+    def remove_dep(command: dict[str, Any]) -> dict[str, Any]:
+        dep_ids = list_arg(command["dep_ids"])
+        if not dep_ids:
+            raise ValueError("No dependency IDs provided")
+        return {"issue": command["id"], "removed_deps": batch.remove_dependency(command["id"], dep_ids)}
+
+    return {"create": create, "close": close, "note": note, "add-dep": add_dep, "remove-dep": remove_dep}
+
+
 def main() -> int:
     """Entry point for the issues command."""
+    # Let a running daemon answer, if there is one for this project
+    forwarded = daemon.forward("issues", sys.argv[1:])
+    if forwarded is not None:
+        return forwarded
+
+    # Imported only now so commands answered by the daemon skip these imports
+    from skill_issues.records import IssueHeader, to_json
+    from . import store
+
     # Parse --root early before any store operations
     # This allows overriding project root resolution
     root_parser = argparse.ArgumentParser(add_help=False)
@@ -106,6 +161,24 @@ def main() -> int:
 
         show_parser = subparsers.add_parser("show", help="Show details of an issue")
         show_parser.add_argument("id", help="Issue ID to show")
+
+        index_parser = subparsers.add_parser("index", help="Build or refresh the SQLite read model for fast queries")
+        index_parser.add_argument("--drop", action="store_true", help="Delete the read model and go back to log replay")
+
+        subparsers.add_parser("batch", help="Run JSON-lines write commands from stdin in one process")
+
+        context_parser = subparsers.add_parser(
+            "context", help="Ready issues and recent session memory as one JSON document (for agent startup)")
+        context_parser.add_argument("--sessions", type=non_negative_int, default=3, metavar="N",
+                                    help="Number of recent sessions to include (default: 3)")
+        # Own dest, so it doesn't clash with the top-level output --limit
+        context_parser.add_argument("--limit", type=non_negative_int, default=20, metavar="N", dest="context_limit",
+                                    help="Maximum ready issues, open questions and next actions (default: 20)")
+        context_parser.add_argument("--user", metavar="PREFIX",
+                                    help="Whose sessions to include (default: current user, 'all' for everyone)")
+
+        daemon_parser = subparsers.add_parser("daemon", help="Start, stop or check the background query daemon")
+        daemon_parser.add_argument("action", choices=["start", "stop", "status"], help="Daemon action")
     else:
         # Positional argument for issue ID(s) (implicit --show)
         # Only add when subparsers are NOT present to avoid argparse conflicts
@@ -118,6 +191,9 @@ def main() -> int:
     query_group.add_argument("--closed", action="store_true", help="Show closed issues")
     query_group.add_argument("--ready", action="store_true", help="Show open issues not blocked")
     query_group.add_argument("--show", metavar="ID", help="Show details of a single issue")
+    query_group.add_argument("--since", nargs="?", const="", metavar="CURSOR",
+                             help="Events and touched issues since a cursor from a previous --since "
+                                  "(omit CURSOR to start from the beginning)")
     query_group.add_argument("--diagram", nargs="?", const="mermaid", choices=["mermaid", "ascii"],
                              metavar="FORMAT", help="Generate dependency diagram (mermaid or ascii, default: mermaid)")
 
@@ -128,6 +204,12 @@ def main() -> int:
     parser.add_argument("--add-dep", nargs=2, metavar=("ID", "DEP_IDS"), help="Add dependencies to an issue (comma-separated IDs)")
     parser.add_argument("--remove-dep", nargs=2, metavar=("ID", "DEP_IDS"), help="Remove dependencies from an issue (comma-separated IDs)")
 
+    # Query options
+    parser.add_argument("--label", metavar="LABEL", help="Only show issues with this label")
+
+    # List output options
+    add_output_arguments(parser)
+
     # Diagram options
     parser.add_argument("--include-closed", action="store_true",
                         help="Include closed issues in diagram (only used with --diagram)")
@@ -225,11 +307,52 @@ def main() -> int:
         return 0
 
     if subcommand == "show":
-        all_issues = store.load_issues()
-        if args.id not in all_issues:
+        issue = store.get_issue(args.id)
+        if issue is None:
             print(json.dumps({"error": f"Issue {args.id} not found"}), file=sys.stderr)
             return 1
-        print(json.dumps(all_issues[args.id], indent=2))
+        print(json.dumps(issue, indent=2, default=to_json))
+        return 0
+
+    if subcommand == "index":
+        model_file = store.get_read_model_file()
+        if args.drop:
+            model_file.unlink(missing_ok=True)
+            print(json.dumps({"dropped": str(model_file)}))
+            return 0
+        from skill_issues import readmodel
+        print(json.dumps({"indexed": readmodel.build_issues_model(), "path": str(model_file)}))
+        return 0
+
+    if subcommand == "batch":
+        from skill_issues.batch import run_batch
+        batch = store.IssueBatch()
+        return run_batch(sys.stdin, batch_handlers(batch), batch.commit, sys.stdout)
+
+    if subcommand == "context":
+        from skill_issues.context import build_context
+        user = None if args.user == "all" else (args.user or "")
+        context = build_context(user, sessions=args.sessions, limit=args.context_limit)
+        print(json.dumps(context, indent=2, default=to_json))
+        return 0
+
+    if subcommand == "daemon":
+        if not daemon.is_supported():
+            print(json.dumps({"error": "The daemon needs Unix domain sockets"}), file=sys.stderr)
+            return 1
+        root = get_project_root()
+        if args.action == "start":
+            try:
+                running = daemon.start(root)
+            except daemon.DaemonError as e:
+                print(json.dumps({"error": str(e)}), file=sys.stderr)
+                return 1
+            print(json.dumps({"running": running["pid"], "socket": str(daemon.get_socket_path(root))}))
+        elif args.action == "stop":
+            print(json.dumps({"stopped": daemon.stop(root)}))
+        else:
+            running = daemon.status(root)
+            print(json.dumps({"running": running["pid"] if running else None}))
         return 0
 
     # Handle write commands (flag syntax - kept for backward compatibility)
@@ -300,56 +423,72 @@ def main() -> int:
         return 0
 
     # Handle query commands
-    all_issues = store.load_issues()
 
     # Handle --show (single issue)
     if args.show:
-        if args.show not in all_issues:
+        issue = store.get_issue(args.show)
+        if issue is None:
             print(json.dumps({"error": f"Issue {args.show} not found"}), file=sys.stderr)
             return 1
-        print(json.dumps(all_issues[args.show], indent=2))
+        print(json.dumps(issue, indent=2, default=to_json))
         return 0
 
     # Handle positional issue IDs (one or more)
     issue_ids = getattr(args, "issue_ids", None)
     if issue_ids:
+        found = store.get_issues(issue_ids)
         # Check all IDs exist first
-        missing = [id for id in issue_ids if id not in all_issues]
+        missing = [id for id in issue_ids if id not in found]
         if missing:
             print(json.dumps({"error": f"Issue(s) not found: {', '.join(missing)}"}), file=sys.stderr)
             return 1
         # Single ID: return object (backward compatible)
         if len(issue_ids) == 1:
-            print(json.dumps(all_issues[issue_ids[0]], indent=2))
+            print(json.dumps(found[issue_ids[0]], indent=2, default=to_json))
         else:
             # Multiple IDs: return array
-            results = [all_issues[id] for id in issue_ids]
-            print(json.dumps(results, indent=2))
+            results = [found[id] for id in issue_ids]
+            print(json.dumps(results, indent=2, default=to_json))
+        return 0
+
+    # Handle change feed
+    if args.since is not None:
+        try:
+            changes = store.changes_since(args.since)
+        except ValueError as e:
+            print(json.dumps({"error": str(e)}), file=sys.stderr)
+            return 1
+        print(json.dumps(changes, indent=2, default=to_json))
         return 0
 
     # Handle diagram output
     if args.diagram:
+        all_issues, index = store.load_headers()
         include_closed = getattr(args, 'include_closed', False)
         if args.diagram == "ascii":
-            print(store.generate_ascii_diagram(all_issues, all_issues, include_closed=include_closed))
+            print(store.generate_ascii_diagram(all_issues, all_issues, include_closed=include_closed, index=index))
         else:
             print(store.generate_mermaid_diagram(all_issues, all_issues, include_closed=include_closed))
         return 0
 
     if args.all:
-        output = all_issues
+        view = "all"
     elif args.closed:
-        output = store.filter_closed(all_issues)
+        view = "closed"
     elif args.ready:
-        output = store.filter_ready(all_issues, all_issues)
+        view = "ready"
     else:
         # Default (no flags or --open): show open issues
-        output = store.filter_open(all_issues)
+        view = "open"
+    # Headers are enough when only header fields were asked for
+    fields = parse_fields(args.fields)
+    headers = fields is not None and set(fields) <= set(IssueHeader.KEYS)
+    output = store.query_issues(view, label=args.label, headers=headers)
 
     # Sort by priority, then by id
     sorted_issues = sorted(output.values(), key=lambda x: (x.get("priority", 2), x["id"]))
 
-    print(json.dumps(sorted_issues, indent=2))
+    write_items(sorted_issues, args, sys.stdout, default=to_json)
     return 0
 
 
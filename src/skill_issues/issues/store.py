@@ -5,13 +5,35 @@ This module handles all data persistence and querying for issues.
 It can be imported independently of the CLI.
 """
 
-import json
+import os
 import re
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import replace
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO, TypeVar
 
 from skill_issues import get_project_root, get_user_prefix
+from skill_issues.eventlog import (
+    CURSOR_FINGERPRINT_CHARS,
+    append_records,
+    encode_cursor,
+    ensure_cache_dir,
+    file_unchanged_since,
+    fingerprint,
+    get_cache_dir,
+    high_water_mark,
+    iter_located_records,
+    memoized,
+    ranges_since,
+    read_json_cache,
+    read_record_at,
+    replay,
+    write_json_cache,
+)
+from skill_issues.records import Change, Issue, IssueHeader, Note, Update, intern
+
+T = TypeVar("T")
 
 
 def get_issues_dir() -> Path:
@@ -54,105 +76,641 @@ def get_timestamp() -> str:
 
 def append_event(event: dict[str, Any]) -> None:
     """Append a JSON event to the current user's events file."""
-    events_file = ensure_user_events_file()
-    # Ensure file ends with newline before appending
-    content = events_file.read_text()
-    needs_newline = content and not content.endswith("\n")
-    with open(events_file, "a") as f:
-        if needs_newline:
-            f.write("\n")
-        f.write(json.dumps(event, separators=(",", ":")) + "\n")
-        f.flush()
-
-
-def _load_events_from_file(filepath: Path) -> list[dict[str, Any]]:
-    """Load events from a single JSONL file."""
-    if not filepath.exists():
-        return []
-    events = []
-    for line in filepath.read_text().splitlines():
-        if not line.strip():
-            continue
-        events.append(json.loads(line))
-    return events
+    append_events([event])
+
+
+def append_events(events: list[dict[str, Any]]) -> None:
+    """Append several events to the current user's events file in one write."""
+    if not events:
+        return
+    append_records(ensure_user_events_file(), events)
+
+
+def _event_files() -> list[Path]:
+    """Return all event files: per-user files first, then the legacy file."""
+    files = sorted(get_issues_dir().glob("events-*.jsonl"))
+    legacy_file = get_legacy_events_file()
+    if legacy_file.exists():
+        files.append(legacy_file)
+    return files
+
+
+def _event_ts(event: dict[str, Any]) -> str:
+    """Sort key for events."""
+    return event.get("ts", "")
+
+
+def _replay_events(
+    build: Callable[[Iterator[Any]], T],
+    ranges: dict[Path, tuple[int, int | None]] | None = None,
+    located: bool = False,
+) -> T:
+    """Feed events from all user files and legacy file to build(), by timestamp.
 
+    Each per-user file is already in timestamp order, so the files are
+    stream-merged with a heap rather than concatenated and sorted. Only a
+    file found to be out of order is sorted in memory, in which case build()
+    is called again from scratch.
 
-def _load_all_events() -> list[dict[str, Any]]:
-    """Load events from all user files and legacy file, sorted by timestamp."""
+    Args:
+        build: Consumes the event stream and returns the projection.
+        ranges: (start, end) byte range to read per file. Defaults to the
+            whole of every event file.
+        located: Feed (event, path, offset, length) tuples instead of events.
+    """
     ensure_data_dir()
-    all_events: list[dict[str, Any]] = []
+    if ranges is None:
+        ranges = {f: (0, None) for f in _event_files()}
+    return replay(ranges, _event_ts, build, located)
 
-    issues_dir = get_issues_dir()
 
-    # Load from per-user files (events-*.jsonl)
-    for events_file in issues_dir.glob("events-*.jsonl"):
-        all_events.extend(_load_events_from_file(events_file))
+def _replay_position(mark: tuple[str, str], files: list[Path]) -> tuple[str, int]:
+    """Where an event stamped (ts, file name) falls in a full replay.
 
-    # Load from legacy shared file (events.jsonl)
-    all_events.extend(_load_events_from_file(get_legacy_events_file()))
+    A full replay breaks timestamp ties by file order, so how far a
+    projection has got is marked by the last event's timestamp and file.
+    """
+    ts, name = mark
+    names = [f.name for f in files]
+    return (ts, names.index(name) if name in names else -1)
 
-    # Sort by timestamp to ensure correct event ordering
-    all_events.sort(key=lambda e: e.get("ts", ""))
 
-    return all_events
+class DependencyIndex:
+    """Reverse-dependency index kept alongside the issues projection.
 
+    Tracks the issues that depend on each issue ID, and for every open issue
+    how many of its dependencies are still open. Closing an issue then only
+    touches its dependents, and the ready set is a lookup rather than a scan.
+    A dependency on an ID that doesn't exist (yet) counts as satisfied, as in
+    filter_ready().
+    """
+
+    def __init__(self) -> None:
+        self.dependents: dict[str, set[str]] = {}
+        self.unsatisfied: dict[str, int] = {}
+        self.ready: set[str] = set()
+
+    @classmethod
+    def build(cls, issues: dict[str, Issue]) -> "DependencyIndex":
+        """Build the index for a whole projection."""
+        index = cls()
+        for issue_id, issue in issues.items():
+            for dep_id in set(issue.get("depends_on", [])):
+                index.dependents.setdefault(dep_id, set()).add(issue_id)
+        for issue_id, issue in issues.items():
+            if issue["status"] == "open":
+                index._recount(issues, issue_id)
+        return index
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "DependencyIndex":
+        """Restore an index saved with to_dict()."""
+        index = cls()
+        index.dependents = {k: set(v) for k, v in data["dependents"].items()}
+        index.unsatisfied = data["unsatisfied"]
+        index.ready = set(data["ready"])
+        return index
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return a JSON-serializable form of the index."""
+        return {
+            "dependents": {k: sorted(v) for k, v in self.dependents.items()},
+            "unsatisfied": self.unsatisfied,
+            "ready": sorted(self.ready),
+        }
+
+    def is_blocked(self, issue_id: str) -> bool:
+        """Check whether an open issue has unsatisfied dependencies."""
+        return self.unsatisfied.get(issue_id, 0) > 0
+
+    def _set_count(self, issue_id: str, count: int) -> None:
+        self.unsatisfied[issue_id] = count
+        if count == 0:
+            self.ready.add(issue_id)
+        else:
+            self.ready.discard(issue_id)
+
+    def _recount(self, issues: dict[str, Issue], issue_id: str) -> None:
+        deps = set(issues[issue_id].get("depends_on", []))
+        count = sum(1 for dep_id in deps if dep_id in issues and issues[dep_id]["status"] == "open")
+        self._set_count(issue_id, count)
+
+    def issue_created(self, issues: dict[str, Issue], issue_id: str, old_deps: list[str]) -> None:
+        """Update the index after an issue was created.
+
+        old_deps are the dependencies of an earlier issue with the same ID
+        that this one replaces (empty if there was none). IDs can repeat
+        because allocation is not locked across writers.
+        """
+        self.deps_changed(issues, issue_id, old_deps)
+        self._recount(issues, issue_id)
+        # Issues that already named this ID as a dependency are now blocked by it
+        for dependent_id in self.dependents.get(issue_id, ()):
+            if dependent_id in self.unsatisfied:
+                self._recount(issues, dependent_id)
+
+    def deps_changed(self, issues: dict[str, Issue], issue_id: str, old_deps: list[str]) -> None:
+        """Update the index after an issue's dependencies were replaced."""
+        for dep_id in set(old_deps):
+            dependents = self.dependents.get(dep_id)
+            if dependents is not None:
+                dependents.discard(issue_id)
+                if not dependents:
+                    del self.dependents[dep_id]
+        for dep_id in set(issues[issue_id].get("depends_on", [])):
+            self.dependents.setdefault(dep_id, set()).add(issue_id)
+        if issue_id in self.unsatisfied:
+            self._recount(issues, issue_id)
+
+    def issue_closed(self, issue_id: str) -> None:
+        """Update the index after an open issue was closed."""
+        self.unsatisfied.pop(issue_id, None)
+        self.ready.discard(issue_id)
+        for dependent_id in self.dependents.get(issue_id, ()):
+            if dependent_id in self.unsatisfied:
+                self._set_count(dependent_id, self.unsatisfied[dependent_id] - 1)
+
+
+def _created_fields(event: dict[str, Any]) -> dict[str, Any]:
+    """Return the header fields of an issue from its "created" event."""
+    return {
+        "id": event["id"],
+        "title": event["title"],
+        "type": event.get("issue_type", "task"),
+        "priority": event.get("priority", 2),
+        # Support both old "blocked_by" and new "depends_on" field names
+        "depends_on": event.get("depends_on", event.get("blocked_by", [])),
+        "labels": event.get("labels", []),
+        "created": event["ts"],
+    }
 
-def load_issues() -> dict[str, dict[str, Any]]:
-    """Read events and reconstruct current state of all issues."""
-    issues: dict[str, dict[str, Any]] = {}
-
-    for event in _load_all_events():
-        issue_id = event["id"]
-        event_type = event["type"]
-
-        if event_type == "created":
-            # Support both old "blocked_by" and new "depends_on" field names
-            depends_on = event.get("depends_on", event.get("blocked_by", []))
-            issues[issue_id] = {
-                "id": issue_id,
-                "title": event["title"],
-                "type": event.get("issue_type", "task"),
-                "priority": event.get("priority", 2),
-                "description": event.get("description", ""),
-                "depends_on": depends_on,
-                "labels": event.get("labels", []),
-                "created": event["ts"],
-                "status": "open",
-                "notes": [],
-                "updates": [],
-            }
-        elif event_type == "updated":
-            if issue_id in issues:
-                # Track the update in history
-                update_record: dict[str, Any] = {"ts": event["ts"]}
-                if "reason" in event:
-                    update_record["reason"] = event["reason"]
-                # Apply mutable field changes
-                for field in ["priority", "labels"]:
-                    if field in event:
-                        update_record[field] = {"from": issues[issue_id].get(field), "to": event[field]}
-                        issues[issue_id][field] = event[field]
-                # Handle depends_on (support old "blocked_by" name for backwards compatibility)
-                dep_value = event.get("depends_on", event.get("blocked_by"))
-                if dep_value is not None:
-                    update_record["depends_on"] = {"from": issues[issue_id].get("depends_on"), "to": dep_value}
-                    issues[issue_id]["depends_on"] = dep_value
-                issues[issue_id]["updates"].append(update_record)
-        elif event_type == "note":
-            if issue_id in issues:
-                issues[issue_id]["notes"].append({
-                    "ts": event["ts"],
-                    "content": event.get("content", ""),
-                })
-        elif event_type == "closed":
-            if issue_id in issues:
-                issues[issue_id]["status"] = "closed"
-                issues[issue_id]["closed_reason"] = event.get("reason", "")
-                issues[issue_id]["closed_at"] = event["ts"]
 
+def _updated_deps(event: dict[str, Any]) -> list[str] | None:
+    """Return the new dependencies set by an "updated" event, if any."""
+    # Support old "blocked_by" name for backwards compatibility
+    return event.get("depends_on", event.get("blocked_by"))
+
+
+def _apply_event(
+    issues: dict[str, Issue],
+    event: dict[str, Any],
+    index: DependencyIndex | None = None,
+) -> None:
+    """Apply a single event to the issues projection in place.
+
+    If a dependency index is given, it is kept in step with the projection.
+    """
+    issue_id = event["id"]
+    event_type = event["type"]
+
+    if event_type == "created":
+        old_deps = issues[issue_id].depends_on if issue_id in issues else []
+        issues[issue_id] = Issue(**_created_fields(event), description=event.get("description", ""))
+        if index is not None:
+            index.issue_created(issues, issue_id, old_deps)
+    elif event_type == "updated":
+        if issue_id in issues:
+            issue = issues[issue_id]
+            # Track the update in history
+            update = Update(ts=event["ts"], reason=event.get("reason"))
+            # Apply mutable field changes
+            if "priority" in event:
+                update.priority = Change(issue.priority, event["priority"])
+                issue.priority = event["priority"]
+            if "labels" in event:
+                labels = [intern(label) for label in event["labels"]]
+                update.labels = Change(issue.labels, labels)
+                issue.labels = labels
+            dep_value = _updated_deps(event)
+            if dep_value is not None:
+                old_deps = issue.depends_on
+                issue.depends_on = [intern(d) for d in dep_value]
+                update.depends_on = Change(old_deps, issue.depends_on)
+                if index is not None:
+                    index.deps_changed(issues, issue_id, old_deps)
+            issue.updates.append(update)
+    elif event_type == "note":
+        if issue_id in issues:
+            issues[issue_id].notes.append(Note(event["ts"], event.get("content", "")))
+    elif event_type == "closed":
+        if issue_id in issues:
+            issue = issues[issue_id]
+            was_open = issue.status == "open"
+            issue.status = "closed"
+            issue.closed_reason = event.get("reason", "")
+            issue.closed_at = event["ts"]
+            if index is not None and was_open:
+                index.issue_closed(issue_id)
+
+
+def _apply_header_event(
+    headers: dict[str, IssueHeader],
+    item: tuple[dict[str, Any], Path, int, int],
+    index: DependencyIndex | None = None,
+) -> None:
+    """Apply a located event (see eventlog.merge_files()) to the headers projection.
+
+    Mirrors _apply_event() for the header fields, and records where the event
+    lives so load_issue_detail() can fold the rest in later.
+    """
+    event, path, offset, length = item
+    issue_id = event["id"]
+    event_type = event["type"]
+
+    if event_type == "created":
+        old_deps = headers[issue_id].depends_on if issue_id in headers else []
+        headers[issue_id] = IssueHeader(**_created_fields(event))
+        if index is not None:
+            index.issue_created(headers, issue_id, old_deps)
+    header = headers.get(issue_id)
+    if header is None:
+        return
+    header.events.append((intern(path.name), offset, length))
+
+    if event_type == "updated":
+        if "priority" in event:
+            header.priority = event["priority"]
+        if "labels" in event:
+            header.labels = [intern(label) for label in event["labels"]]
+        dep_value = _updated_deps(event)
+        if dep_value is not None:
+            old_deps = header.depends_on
+            header.depends_on = [intern(d) for d in dep_value]
+            if index is not None:
+                index.deps_changed(headers, issue_id, old_deps)
+    elif event_type == "closed":
+        was_open = header.status == "open"
+        header.status = "closed"
+        header.closed_at = event["ts"]
+        if index is not None and was_open:
+            index.issue_closed(issue_id)
+
+
+# --- Projection snapshot ---
+#
+# Replaying every event on every command gets slow on long-lived repos, so each
+# projection (full issues, or headers only) is cached in .issues/.cache/
+# together with the byte offset reached in each event file. Loading then only
+# replays the bytes appended since. A snapshot is discarded whenever a file
+# shrinks, is rewritten (git checkout, rebase), disappears, or gains events
+# older than the snapshot (e.g. another user's events arriving via git pull),
+# since replaying those out of order could give a different result than a
+# full replay.
+
+SNAPSHOT_VERSION = 4
+
+
+def get_snapshot_file() -> Path:
+    """Get the projection snapshot file path."""
+    return get_cache_dir(get_issues_dir()) / "issues-snapshot.json"
+
+
+def get_headers_snapshot_file() -> Path:
+    """Get the headers projection snapshot file path."""
+    return get_cache_dir(get_issues_dir()) / "headers-snapshot.json"
+
+
+def _write_snapshot(
+    snapshot_file: Path,
+    issues: dict[str, dict[str, Any]],
+    index: DependencyIndex,
+    offsets: dict[Path, int],
+    mark: tuple[str, str],
+) -> None:
+    """Persist a projection with the offset reached in each event file."""
+    try:
+        ensure_cache_dir(get_issues_dir())
+        files = {
+            path.name: {"offset": offset, "fingerprint": fingerprint(path, offset)}
+            for path, offset in offsets.items()
+        }
+    except OSError:
+        return
+    write_json_cache(snapshot_file, {
+        "version": SNAPSHOT_VERSION,
+        "max_ts": mark[0],
+        "max_file": mark[1],
+        "files": files,
+        "issues": issues,
+        "index": index.to_dict(),
+    })
+
+
+def _read_snapshot(
+    snapshot_file: Path, files: list[Path]
+) -> tuple[dict[str, Any], dict[Path, int], dict[Path, tuple[int, int | None]]] | None:
+    """Read a snapshot if it is still valid for the event files.
+
+    Returns (snapshot, offsets, ranges), where offsets are the saved offsets
+    and ranges the bytes appended since, or None if a full replay is needed.
+    """
+    snapshot = read_json_cache(snapshot_file)
+    if not snapshot or snapshot.get("version") != SNAPSHOT_VERSION:
+        return None
+
+    saved_files: dict[str, dict[str, Any]] = snapshot["files"]
+    if set(saved_files) - {f.name for f in files}:
+        return None  # An event file was deleted
+
+    offsets: dict[Path, int] = {}
+    ranges: dict[Path, tuple[int, int | None]] = {}
+    for events_file in files:
+        saved = saved_files.get(events_file.name)
+        start = 0
+        if saved is not None:
+            start = saved["offset"]
+            if not file_unchanged_since(events_file, start, saved["fingerprint"]):
+                return None
+            offsets[events_file] = start
+        size = events_file.stat().st_size
+        if size > start:
+            ranges[events_file] = (start, size)
+    return (snapshot, offsets, ranges)
+
+
+def _load_cached(
+    snapshot_file: Path,
+    decode: Callable[[dict[str, Any]], T],
+    encode: Callable[[T], dict[str, Any]],
+    apply: Callable[[dict[str, T], Any, DependencyIndex | None], None],
+    located: bool = False,
+) -> tuple[dict[str, T], DependencyIndex, dict[Path, int], tuple[str, str]]:
+    """Load a projection and its dependency index through a snapshot.
+
+    Only events appended since the snapshot are replayed when it is still
+    valid; otherwise every event is replayed and a fresh snapshot written.
+    Also returns the offset reached in each event file and the (timestamp,
+    file name) of the last event replayed, so callers can carry on from
+    there (see LiveHeaders).
+
+    Args:
+        snapshot_file: Where this projection's snapshot lives.
+        decode: Turns a snapshot entry back into a record.
+        encode: Turns a record into a snapshot entry.
+        apply: Applies one stream item to the projection in place.
+        located: Replay located events (see eventlog.merge_files()).
+    """
+    ensure_data_dir()
+    files = _event_files()
+
+    # Always replay located events, to know which file each one came from
+    def feed(item: tuple[dict[str, Any], Path, int, int]) -> Any:
+        return item if located else item[0]
+
+    def item_mark(item: tuple[dict[str, Any], Path, int, int]) -> tuple[str, str]:
+        return (_event_ts(item[0]), item[1].name)
+
+    def write(issues: dict[str, T], index: DependencyIndex, offsets: dict[Path, int], mark: tuple[str, str]) -> None:
+        _write_snapshot(snapshot_file, {k: encode(v) for k, v in issues.items()}, index, offsets, mark)
+
+    cached = _read_snapshot(snapshot_file, files)
+    if cached is not None:
+        snapshot, offsets, ranges = cached
+        issues = {k: decode(v) for k, v in snapshot["issues"].items()}
+        index = DependencyIndex.from_dict(snapshot["index"])
+        mark: tuple[str, str] = (snapshot["max_ts"], snapshot["max_file"])
+        if not ranges:
+            return (issues, index, offsets, mark)
+        new_items = _replay_events(list, ranges, located=True)
+        if not new_items or (
+            _replay_position(item_mark(new_items[0]), files) >= _replay_position(mark, files)
+        ):
+            for item in new_items:
+                apply(issues, feed(item), index)
+            offsets.update({f: end for f, (_, end) in ranges.items()})
+            if new_items:
+                mark = item_mark(new_items[-1])
+            write(issues, index, offsets, mark)
+            return (issues, index, offsets, mark)
+
+    def build(items: Iterator[Any]) -> tuple[dict[str, T], tuple[str, str]]:
+        issues: dict[str, T] = {}
+        mark = ("", "")
+        for item in items:
+            apply(issues, feed(item), None)
+            mark = item_mark(item)
+        return (issues, mark)
+
+    # Pin each file's end so the snapshot offsets match what was replayed
+    ranges = {f: (0, f.stat().st_size) for f in files}
+    issues, mark = _replay_events(build, ranges, located=True)
+    index = DependencyIndex.build(issues)
+    offsets = {f: end for f, (_, end) in ranges.items()}
+    write(issues, index, offsets, mark)
+    return (issues, index, offsets, mark)
+
+
+def _build_issues(
+    items: Iterable[tuple[dict[str, Any], Path, int, int]],
+) -> tuple[dict[str, Issue], tuple[str, str]]:
+    """Fold a located event stream into issues, with the (timestamp, file name) of the last event."""
+    issues: dict[str, Issue] = {}
+    mark = ("", "")
+    for event, path, _, _ in items:
+        _apply_event(issues, event)
+        mark = (_event_ts(event), path.name)
+    return (issues, mark)
+
+
+@memoized(_event_files)
+def load_projection() -> tuple[dict[str, Issue], DependencyIndex]:
+    """Reconstruct all issues together with their dependency index.
+
+    Uses the projection snapshot when valid, otherwise replays every event
+    and writes a fresh snapshot.
+    """
+    issues, index, _, _ = _load_cached(get_snapshot_file(), Issue.from_dict, Issue.to_dict, _apply_event)
+    return (issues, index)
+
+
+def load_issues() -> dict[str, Issue]:
+    """Read events and reconstruct current state of all issues."""
+    issues, _ = load_projection()
     return issues
 
 
+def _encode_header(header: IssueHeader) -> dict[str, Any]:
+    return {**header.to_dict(), "events": header.events}
+
+
+@memoized(_event_files)
+def load_headers() -> tuple[dict[str, IssueHeader], DependencyIndex]:
+    """Reconstruct issue headers (no descriptions, notes or history) and the dependency index.
+
+    Memory and snapshot size scale with the number of issues rather than
+    the volume of notes; use load_issue_detail() for the full record.
+    """
+    headers, index, _, _ = _load_cached(
+        get_headers_snapshot_file(), IssueHeader.from_dict, _encode_header, _apply_header_event, located=True
+    )
+    return (headers, index)
+
+
+class LiveHeaders:
+    """Issue headers kept current by reading only what was appended since.
+
+    For long-running viewers such as the board. The headers and index are
+    updated in place by refresh(), so they must not be shared with a
+    memoized projection.
+    """
+
+    def __init__(self) -> None:
+        self.headers: dict[str, IssueHeader] = {}
+        self.index = DependencyIndex()
+        self._cursor = ""
+        self._mark = ("", "")
+        self.reload()
+
+    def reload(self) -> None:
+        """Load the headers from scratch (through the snapshot)."""
+        self.headers, self.index, offsets, self._mark = _load_cached(
+            get_headers_snapshot_file(), IssueHeader.from_dict, _encode_header, _apply_header_event, located=True
+        )
+        self._cursor = encode_cursor({
+            path.name: (offset, fingerprint(path, offset)[:CURSOR_FINGERPRINT_CHARS])
+            for path, offset in offsets.items()
+        })
+
+    def refresh(self) -> set[str] | None:
+        """Apply events appended since the last load or refresh.
+
+        Returns:
+            The IDs of the issues whose header or blocked state may have
+            changed, or None if the files were rewritten or gained events
+            older than those already applied, in which case everything was
+            reloaded.
+        """
+        files = _event_files()
+        ranges, cursor, reset = ranges_since(files, self._cursor)
+        ranges = {path: (start, end) for path, (start, end) in ranges.items() if end != start}
+        if reset:
+            self.reload()
+            return None
+        items = _replay_events(list, ranges, located=True) if ranges else []
+        if items and (
+            _replay_position((_event_ts(items[0][0]), items[0][1].name), files)
+            < _replay_position(self._mark, files)
+        ):
+            # Replaying these after newer events could disagree with a full replay
+            self.reload()
+            return None
+
+        changed: set[str] = set()
+        for item in items:
+            _apply_header_event(self.headers, item, self.index)
+            issue_id = item[0]["id"]
+            changed.add(issue_id)
+            # Closing or creating an issue can block or unblock its dependents
+            changed.update(self.index.dependents.get(issue_id, ()))
+        if items:
+            self._mark = (_event_ts(items[-1][0]), items[-1][1].name)
+        self._cursor = cursor
+        return changed
+
+
+def load_issue_detail(header: IssueHeader) -> Issue | None:
+    """Build the full issue for a header by reading only its own events.
+
+    Falls back to a full replay if the header's byte offsets no longer
+    point at its events (e.g. a file was rewritten since it was loaded).
+    """
+    issues: dict[str, Issue] = {}
+    issues_dir = get_issues_dir()
+    handles: dict[str, BinaryIO] = {}
+    try:
+        for name, offset, length in header.events:
+            if name not in handles:
+                handles[name] = open(issues_dir / name, "rb")
+            event = read_record_at(handles[name], offset, length)
+            if event.get("id") != header.id:
+                return load_issues().get(header.id)
+            _apply_event(issues, event)
+    except (OSError, ValueError):
+        return load_issues().get(header.id)
+    finally:
+        for f in handles.values():
+            f.close()
+    return issues.get(header.id)
+
+
+# --- Event offset index ---
+#
+# `issues show` and positional IDs only need one issue's events. A sidecar in
+# .issues/.cache/ maps each issue ID to the (offset, length) of its events in
+# every event file, so lookups read just those lines. Each file's entry is
+# trusted while the file's size and mtime match; a file that only grew is
+# indexed from where the entry left off, and a rewritten one from scratch.
+# Appends leave the index alone, so they stay a single write; the next
+# lookup catches up on the new bytes.
+
+OFFSET_INDEX_VERSION = 1
+
+
+def get_offset_index_file() -> Path:
+    """Get the event offset index path."""
+    return get_cache_dir(get_issues_dir()) / "event-offsets.json"
+
+
+def _index_entry(path: Path, st: os.stat_result, ids: dict[str, list[list[int]]]) -> dict[str, Any]:
+    return {
+        "size": st.st_size,
+        "mtime_ns": st.st_mtime_ns,
+        "fingerprint": fingerprint(path, st.st_size),
+        "ids": ids,
+    }
+
+
+def _load_offset_index(files: list[Path]) -> dict[str, dict[str, Any]]:
+    """Return the offset index entry of each event file, updating stale ones."""
+    index = read_json_cache(get_offset_index_file())
+    if not index or index.get("version") != OFFSET_INDEX_VERSION:
+        index = {"version": OFFSET_INDEX_VERSION, "files": {}}
+    saved: dict[str, dict[str, Any]] = index["files"]
+    entries: dict[str, dict[str, Any]] = {}
+    changed = set(saved) != {f.name for f in files}
+    for path in files:
+        st = path.stat()
+        entry = saved.get(path.name)
+        if entry is not None and entry["size"] == st.st_size and entry["mtime_ns"] == st.st_mtime_ns:
+            entries[path.name] = entry
+            continue
+        start = 0
+        ids: dict[str, list[list[int]]] = {}
+        if entry is not None and file_unchanged_since(path, entry["size"], entry["fingerprint"]):
+            start, ids = entry["size"], entry["ids"]
+        for event, offset, length in iter_located_records(path, start, st.st_size):
+            ids.setdefault(event.get("id", ""), []).append([offset, length])
+        entries[path.name] = _index_entry(path, st, ids)
+        changed = True
+    if changed:
+        ensure_cache_dir(get_issues_dir())
+        write_json_cache(get_offset_index_file(), {"version": OFFSET_INDEX_VERSION, "files": entries})
+    return entries
+
+
+def _read_issue_events(issue_ids: list[str]) -> dict[str, list[dict[str, Any]]] | None:
+    """Read the events of some issues via the offset index, in replay order.
+
+    Returns None if the index turns out not to match the files.
+    """
+    files = _event_files()
+    entries = _load_offset_index(files)
+    found: dict[str, list[dict[str, Any]]] = {}
+    for path in files:
+        ids = entries[path.name]["ids"]
+        locations = [(issue_id, loc) for issue_id in issue_ids for loc in ids.get(issue_id, ())]
+        if not locations:
+            continue
+        with open(path, "rb") as f:
+            for issue_id, (offset, length) in locations:
+                event = read_record_at(f, offset, length)
+                if event.get("id") != issue_id:
+                    return None
+                found.setdefault(issue_id, []).append(event)
+    # Stable sort of (file order, position) by timestamp = the order of a full replay
+    return {issue_id: sorted(events, key=_event_ts) for issue_id, events in found.items()}
+
+
 def parse_issue_id(issue_id: str) -> tuple[str | None, int | None]:
     """Parse an issue ID into (prefix, number).
 
@@ -175,7 +733,7 @@ def parse_issue_id(issue_id: str) -> tuple[str | None, int | None]:
     return (None, None)
 
 
-def next_id(issues: dict[str, dict[str, Any]], prefix: str | None = None) -> str:
+def next_id(issues: dict[str, Issue], prefix: str | None = None) -> str:
     """Return next available issue ID for the current user.
 
     Args:
@@ -198,173 +756,396 @@ def next_id(issues: dict[str, dict[str, Any]], prefix: str | None = None) -> str
     return f"{prefix}-{max_num + 1:03d}"
 
 
+def get_id_index_file() -> Path:
+    """Get the per-prefix ID high-water-mark index path."""
+    return get_cache_dir(get_issues_dir()) / "issue-ids.json"
+
+
+def allocate_id(prefix: str | None = None) -> str:
+    """Return the next issue ID for a user without loading every issue.
+
+    A user's IDs can only be created in their own events file (or the
+    legacy file, after migration), so only those are scanned, and only
+    from the offset reached last time.
+
+    Args:
+        prefix: User prefix to use. If None, uses get_user_prefix().
+
+    Returns:
+        Next issue ID in format "prefix-NNN" (e.g., "dp-001").
+    """
+    if prefix is None:
+        prefix, _ = get_user_prefix()
+
+    def number(event: dict[str, Any]) -> int | None:
+        if event.get("type") != "created":
+            return None
+        parsed_prefix, num = parse_issue_id(event.get("id", ""))
+        return num if parsed_prefix == prefix else None
+
+    ensure_cache_dir(get_issues_dir())
+    files = [get_user_events_file(prefix), get_legacy_events_file()]
+    max_num = high_water_mark(files, get_id_index_file(), prefix, number)
+    return f"{prefix}-{max_num + 1:03d}"
+
+
 # --- Filter functions ---
 
-def filter_open(issues: dict[str, dict[str, Any]]) -> dict[str, dict[str, Any]]:
+def filter_open(issues: dict[str, Issue]) -> dict[str, Issue]:
     """Return only open issues."""
     return {k: v for k, v in issues.items() if v["status"] == "open"}
 
 
-def filter_closed(issues: dict[str, dict[str, Any]]) -> dict[str, dict[str, Any]]:
+def filter_closed(issues: dict[str, Issue]) -> dict[str, Issue]:
     """Return only closed issues."""
     return {k: v for k, v in issues.items() if v["status"] == "closed"}
 
 
-def filter_ready(issues: dict[str, dict[str, Any]], all_issues: dict[str, dict[str, Any]]) -> dict[str, dict[str, Any]]:
-    """Return open issues with no unsatisfied dependencies."""
-    open_ids = set(filter_open(all_issues).keys())
-    ready = {}
-    for k, v in issues.items():
-        if v["status"] != "open":
-            continue
-        deps = set(v.get("depends_on", []))
-        unsatisfied_deps = deps & open_ids
-        if not unsatisfied_deps:
-            ready[k] = v
-    return ready
+def filter_by_label(issues: dict[str, Issue], label: str) -> dict[str, Issue]:
+    """Return issues carrying a label."""
+    return {k: v for k, v in issues.items() if label in v.get("labels", [])}
 
 
-# --- Write operations ---
+def filter_ready(
+    issues: dict[str, Issue],
+    all_issues: dict[str, Issue],
+    index: DependencyIndex | None = None,
+) -> dict[str, Issue]:
+    """Return open issues with no unsatisfied dependencies.
 
-def create_issue(
-    title: str,
-    issue_type: str = "task",
-    priority: int = 2,
-    description: str = "",
-    depends_on: list[str] | None = None,
-    labels: list[str] | None = None,
-) -> str:
-    """Create a new issue and return its ID."""
-    issues = load_issues()
-    prefix, _ = get_user_prefix()
-    new_id = next_id(issues, prefix)
-
-    event: dict[str, Any] = {
-        "ts": get_timestamp(),
-        "type": "created",
-        "id": new_id,
-        "title": title,
-        "issue_type": issue_type,
-        "priority": priority,
-    }
+    Args:
+        issues: Issues to filter.
+        all_issues: All issues, used to decide whether dependencies are open.
+        index: Dependency index for all_issues. Built on the fly if omitted.
+    """
+    if index is None:
+        index = DependencyIndex.build(all_issues)
+    return {k: v for k, v in issues.items() if k in index.ready}
 
-    if description:
-        event["description"] = description
-    if depends_on:
-        event["depends_on"] = depends_on
-    if labels:
-        event["labels"] = labels
 
-    append_event(event)
-    return new_id
+# --- Queries ---
+#
+# Query functions answer from the optional SQLite read model (see
+# skill_issues.readmodel) when the project has opted in with `issues index`,
+# and from the replayed event logs otherwise.
 
+def get_read_model_file() -> Path:
+    """Get the SQLite read model path."""
+    return get_cache_dir(get_issues_dir()) / "readmodel.sqlite"
 
-def close_issue(issue_id: str, reason: str) -> None:
-    """Close an issue with a reason."""
-    issues = load_issues()
-
-    if issue_id not in issues:
-        raise ValueError(f"Issue {issue_id} not found")
-    if issues[issue_id]["status"] == "closed":
-        raise ValueError(f"Issue {issue_id} is already closed")
-
-    event = {
-        "ts": get_timestamp(),
-        "type": "closed",
-        "id": issue_id,
-        "reason": reason,
-    }
 
-    append_event(event)
+def _open_read_model() -> Any:
+    """Return the synced read model if this project opted in to one, else None."""
+    if not get_read_model_file().exists():
+        return None
+    from skill_issues import readmodel
+    return readmodel.open_issues_model()
 
 
-def add_note(issue_id: str, content: str) -> None:
-    """Add a note to an issue."""
-    issues = load_issues()
+def query_issues(
+    view: str = "open", label: str | None = None, headers: bool = False
+) -> dict[str, Issue] | dict[str, IssueHeader]:
+    """Return issues for a view, optionally restricted to a label.
+
+    Args:
+        view: One of "all", "open", "closed" or "ready".
+        label: Only return issues carrying this label.
+        headers: Allow returning IssueHeaders, for callers that only need
+            header fields. Saves loading descriptions, notes and history.
+    """
+    model = _open_read_model()
+    if model is not None:
+        with model:
+            return model.query(view, label)
+
+    all_issues, index = load_headers() if headers else load_projection()
+    if view == "all":
+        issues = all_issues
+    elif view == "closed":
+        issues = filter_closed(all_issues)
+    elif view == "ready":
+        issues = {k: all_issues[k] for k in index.ready}
+    else:
+        issues = filter_open(all_issues)
+    if label:
+        issues = filter_by_label(issues, label)
+    return issues
+
 
-    if issue_id not in issues:
-        raise ValueError(f"Issue {issue_id} not found")
+def get_issues(issue_ids: list[str]) -> dict[str, Issue]:
+    """Return the requested issues that exist, keyed by ID."""
+    model = _open_read_model()
+    if model is not None:
+        with model:
+            found = {issue_id: model.get(issue_id) for issue_id in issue_ids}
+        return {k: v for k, v in found.items() if v is not None}
+    try:
+        events = _read_issue_events(issue_ids)
+    except (OSError, ValueError):
+        events = None
+    if events is None:
+        all_issues = load_issues()
+        return {issue_id: all_issues[issue_id] for issue_id in issue_ids if issue_id in all_issues}
+    issues: dict[str, Issue] = {}
+    for issue_id in issue_ids:
+        for event in events.get(issue_id, ()):
+            _apply_event(issues, event)
+    return issues
+
+
+def changes_since(cursor: str) -> dict[str, Any]:
+    """Return what changed since a cursor, for consumers that poll.
+
+    Only the bytes appended to each events file since the cursor are read,
+    and the touched issues are looked up through the offset index, so a
+    poll costs a seek and a read of each file's tail.
+
+    Args:
+        cursor: A cursor from an earlier call, or "" to start from scratch.
+
+    Returns:
+        A dict with the new "cursor", the new "events" in replay order, the
+        current state of the "issues" they touch (by ID), and "reset", which
+        is True if the cursor no longer matched the files (e.g. after a
+        rebase) and the events restart from the beginning of a file.
 
-    event = {
-        "ts": get_timestamp(),
-        "type": "note",
-        "id": issue_id,
-        "content": content,
+    Raises:
+        ValueError: If the cursor is malformed.
+    """
+    ensure_data_dir()
+    ranges, new_cursor, reset = ranges_since(_event_files(), cursor)
+    events = _replay_events(list, ranges)
+    ids = sorted({event["id"] for event in events if "id" in event})
+    found = get_issues(ids)
+    return {
+        "cursor": new_cursor,
+        "reset": reset,
+        "events": events,
+        "issues": [found[issue_id] for issue_id in ids if issue_id in found],
     }
 
-    append_event(event)
 
+def get_issue(issue_id: str) -> Issue | None:
+    """Return a single issue, or None if it doesn't exist."""
+    return get_issues([issue_id]).get(issue_id)
 
-def add_dependency(issue_id: str, dep_ids: list[str]) -> list[str]:
-    """Add dependencies to an issue. Returns list of added dependency IDs."""
-    issues = load_issues()
 
-    if issue_id not in issues:
-        raise ValueError(f"Issue {issue_id} not found")
-    if issues[issue_id]["status"] == "closed":
-        raise ValueError(f"Issue {issue_id} is already closed")
+# --- Write operations ---
 
-    # Validate dependency IDs exist
-    for dep_id in dep_ids:
-        if dep_id not in issues:
-            raise ValueError(f"Dependency issue {dep_id} not found")
+def _apply_pending_event(issues: dict[str, IssueHeader], event: dict[str, Any]) -> None:
+    """Reflect an event that hasn't been written yet in a copy of the headers.
 
-    current_deps = set(issues[issue_id].get("depends_on", []))
-    new_deps = set(dep_ids)
-    added = new_deps - current_deps
+    Changed headers are replaced rather than mutated, since the originals may
+    be shared with a memoized projection.
+    """
+    issue_id = event["id"]
+    if event["type"] == "created":
+        issues[issue_id] = IssueHeader(**_created_fields(event))
+    elif event["type"] == "closed":
+        issues[issue_id] = replace(issues[issue_id], status="closed", closed_at=event["ts"])
+    elif event["type"] == "updated" and "depends_on" in event:
+        issues[issue_id] = replace(issues[issue_id], depends_on=list(event["depends_on"]))
+
+
+class IssueBatch:
+    """Write operations checked against one projection and appended together.
+
+    Each operation validates against the issues as they stand after the
+    operations before it, so a batch can e.g. create an issue and then close
+    it. Nothing is written until commit(), which appends every event in a
+    single write.
+    """
 
-    if not added:
-        raise ValueError(f"Issue {issue_id} already depends on {dep_ids}")
+    def __init__(self) -> None:
+        self.events: list[dict[str, Any]] = []
+        self._issues: dict[str, IssueHeader] | None = None
+        self._next_number: int | None = None
+
+    @property
+    def issues(self) -> dict[str, IssueHeader]:
+        """Issue headers including this batch's pending events."""
+        if self._issues is None:
+            headers, _ = load_headers()
+            self._issues = dict(headers)
+            for event in self.events:
+                _apply_pending_event(self._issues, event)
+        return self._issues
+
+    def _add(self, event: dict[str, Any]) -> None:
+        self.events.append(event)
+        if self._issues is not None:
+            _apply_pending_event(self._issues, event)
+
+    def _open_issue(self, issue_id: str) -> IssueHeader:
+        issue = self.issues.get(issue_id)
+        if issue is None:
+            raise ValueError(f"Issue {issue_id} not found")
+        if issue["status"] == "closed":
+            raise ValueError(f"Issue {issue_id} is already closed")
+        return issue
 
-    updated_deps = sorted(current_deps | new_deps)
+    def _allocate_id(self) -> str:
+        prefix, _ = get_user_prefix()
+        if self._next_number is None:
+            _, self._next_number = parse_issue_id(allocate_id(prefix))
+        new_id = f"{prefix}-{self._next_number:03d}"
+        self._next_number += 1
+        return new_id
+
+    def create(
+        self,
+        title: str,
+        issue_type: str = "task",
+        priority: int = 2,
+        description: str = "",
+        depends_on: list[str] | None = None,
+        labels: list[str] | None = None,
+    ) -> str:
+        """Create a new issue and return its ID."""
+        ensure_data_dir()
+        new_id = self._allocate_id()
+
+        event: dict[str, Any] = {
+            "ts": get_timestamp(),
+            "type": "created",
+            "id": new_id,
+            "title": title,
+            "issue_type": issue_type,
+            "priority": priority,
+        }
+
+        if description:
+            event["description"] = description
+        if depends_on:
+            event["depends_on"] = depends_on
+        if labels:
+            event["labels"] = labels
+
+        self._add(event)
+        return new_id
+
+    def close(self, issue_id: str, reason: str) -> None:
+        """Close an issue with a reason."""
+        self._open_issue(issue_id)
+        self._add({
+            "ts": get_timestamp(),
+            "type": "closed",
+            "id": issue_id,
+            "reason": reason,
+        })
+
+    def note(self, issue_id: str, content: str) -> None:
+        """Add a note to an issue."""
+        if issue_id not in self.issues:
+            raise ValueError(f"Issue {issue_id} not found")
+        self._add({
+            "ts": get_timestamp(),
+            "type": "note",
+            "id": issue_id,
+            "content": content,
+        })
+
+    def add_dependency(self, issue_id: str, dep_ids: list[str]) -> list[str]:
+        """Add dependencies to an issue. Returns list of added dependency IDs."""
+        issue = self._open_issue(issue_id)
+
+        # Validate dependency IDs exist
+        for dep_id in dep_ids:
+            if dep_id not in self.issues:
+                raise ValueError(f"Dependency issue {dep_id} not found")
+
+        current_deps = set(issue.get("depends_on", []))
+        new_deps = set(dep_ids)
+        added = new_deps - current_deps
+
+        if not added:
+            raise ValueError(f"Issue {issue_id} already depends on {dep_ids}")
+
+        self._add({
+            "ts": get_timestamp(),
+            "type": "updated",
+            "id": issue_id,
+            "depends_on": sorted(current_deps | new_deps),
+            "reason": f"Added dependencies: {', '.join(sorted(added))}",
+        })
+        return sorted(added)
+
+    def remove_dependency(self, issue_id: str, dep_ids: list[str]) -> list[str]:
+        """Remove dependencies from an issue. Returns list of removed dependency IDs."""
+        issue = self._open_issue(issue_id)
+
+        current_deps = set(issue.get("depends_on", []))
+        to_remove = set(dep_ids)
+        removed = to_remove & current_deps
+
+        if not removed:
+            raise ValueError(f"Issue {issue_id} does not depend on any of {dep_ids}")
+
+        self._add({
+            "ts": get_timestamp(),
+            "type": "updated",
+            "id": issue_id,
+            "depends_on": sorted(current_deps - to_remove),
+            "reason": f"Removed dependencies: {', '.join(sorted(removed))}",
+        })
+        return sorted(removed)
+
+    def commit(self) -> None:
+        """Append the batch's events to the current user's events file."""
+        append_events(self.events)
+        self.events = []
 
-    event = {
-        "ts": get_timestamp(),
-        "type": "updated",
-        "id": issue_id,
-        "depends_on": updated_deps,
-        "reason": f"Added dependencies: {', '.join(sorted(added))}",
-    }
 
-    append_event(event)
-    return sorted(added)
+def create_issue(
+    title: str,
+    issue_type: str = "task",
+    priority: int = 2,
+    description: str = "",
+    depends_on: list[str] | None = None,
+    labels: list[str] | None = None,
+) -> str:
+    """Create a new issue and return its ID."""
+    batch = IssueBatch()
+    new_id = batch.create(title, issue_type, priority, description, depends_on, labels)
+    batch.commit()
+    return new_id
 
 
-def remove_dependency(issue_id: str, dep_ids: list[str]) -> list[str]:
-    """Remove dependencies from an issue. Returns list of removed dependency IDs."""
-    issues = load_issues()
+def close_issue(issue_id: str, reason: str) -> None:
+    """Close an issue with a reason."""
+    batch = IssueBatch()
+    batch.close(issue_id, reason)
+    batch.commit()
 
-    if issue_id not in issues:
-        raise ValueError(f"Issue {issue_id} not found")
-    if issues[issue_id]["status"] == "closed":
-        raise ValueError(f"Issue {issue_id} is already closed")
 
-    current_deps = set(issues[issue_id].get("depends_on", []))
-    to_remove = set(dep_ids)
-    removed = to_remove & current_deps
+def add_note(issue_id: str, content: str) -> None:
+    """Add a note to an issue."""
+    batch = IssueBatch()
+    batch.note(issue_id, content)
+    batch.commit()
 
-    if not removed:
-        raise ValueError(f"Issue {issue_id} does not depend on any of {dep_ids}")
 
-    updated_deps = sorted(current_deps - to_remove)
+def add_dependency(issue_id: str, dep_ids: list[str]) -> list[str]:
+    """Add dependencies to an issue. Returns list of added dependency IDs."""
+    batch = IssueBatch()
+    added = batch.add_dependency(issue_id, dep_ids)
+    batch.commit()
+    return added
 
-    event = {
-        "ts": get_timestamp(),
-        "type": "updated",
-        "id": issue_id,
-        "depends_on": updated_deps,
-        "reason": f"Removed dependencies: {', '.join(sorted(removed))}",
-    }
 
-    append_event(event)
-    return sorted(removed)
+def remove_dependency(issue_id: str, dep_ids: list[str]) -> list[str]:
+    """Remove dependencies from an issue. Returns list of removed dependency IDs."""
+    batch = IssueBatch()
+    removed = batch.remove_dependency(issue_id, dep_ids)
+    batch.commit()
+    return removed
 
 
 # --- Diagram generation ---
 
 def generate_mermaid_diagram(
-    issues: dict[str, dict[str, Any]],
-    all_issues: dict[str, dict[str, Any]],
+    issues: dict[str, Issue],
+    all_issues: dict[str, Issue],
     include_closed: bool = False,
 ) -> str:
     """Generate Mermaid flowchart showing issue dependencies."""
@@ -422,9 +1203,10 @@ def generate_mermaid_diagram(
 
 
 def generate_ascii_diagram(
-    issues: dict[str, dict[str, Any]],
-    all_issues: dict[str, dict[str, Any]],
+    issues: dict[str, Issue],
+    all_issues: dict[str, Issue],
     include_closed: bool = False,
+    index: DependencyIndex | None = None,
 ) -> str:
     """Generate ASCII diagram showing issue dependencies."""
     if include_closed:
@@ -435,7 +1217,9 @@ def generate_ascii_diagram(
     if not display_issues:
         return "No issues to display"
 
-    open_ids = set(k for k, v in all_issues.items() if v["status"] == "open")
+    if index is None:
+        index = DependencyIndex.build(all_issues)
+    display_ids = set(display_issues.keys())
 
     lines = []
     lines.append("Issue Dependency Diagram")
@@ -455,7 +1239,7 @@ def generate_ascii_diagram(
         at_this_depth: set[str] = set()
         for issue_id in remaining:
             deps = set(display_issues[issue_id].get("depends_on", []))
-            deps_in_display = deps & set(display_issues.keys())
+            deps_in_display = deps & display_ids
             deps_remaining = deps_in_display & remaining
             if not deps_remaining:
                 at_this_depth.add(issue_id)
@@ -487,7 +1271,7 @@ def generate_ascii_diagram(
 
             if issue["status"] == "closed":
                 marker = "{CLOSED}"
-            elif set(issue.get("depends_on", [])) & open_ids:
+            elif index.is_blocked(issue_id):
                 marker = "(BLOCKED)"
             else:
                 marker = "[READY]"
@@ -1,12 +1,43 @@
 """Issues Board TUI - Kanban board using Textual."""
 
+from typing import Any
+
+from textual import work
 from textual.app import App, ComposeResult
 from textual.binding import Binding
 from textual.containers import Horizontal, ScrollableContainer, Vertical
 from textual.widgets import Footer, Header, Static
+from textual.worker import get_current_worker
+
+from skill_issues.watch import DirectoryWatcher
 
 from . import store
 
+# Seconds between checks for events written by other processes
+WATCH_INTERVAL = 0.25
+
+# Columns mount only the cards in view, so every card has the same height.
+# CARD_PITCH is the distance between the tops of neighbouring cards: the
+# height plus the one-row margin between cards (see IssueCard in the CSS).
+CARD_HEIGHT = 7
+CARD_PITCH = CARD_HEIGHT + 1
+
+# Cards mounted beyond each edge of a column's visible area
+CARD_BUFFER = 3
+
+
+def categorize_issues(headers: dict[str, dict], index: store.DependencyIndex) -> dict[str, list[dict]]:
+    """Sort issues into the board's columns, each by priority and then ID."""
+    columns: dict[str, list[dict]] = {"ready": [], "blocked": [], "closed": []}
+    for issue_id, issue in sorted(headers.items(), key=lambda x: (x[1].get("priority", 2), x[0])):
+        if issue["status"] == "closed":
+            columns["closed"].append(issue)
+        elif index.is_blocked(issue_id):
+            columns["blocked"].append(issue)
+        else:
+            columns["ready"].append(issue)
+    return columns
+
 
 class NonFocusableScrollableContainer(ScrollableContainer):
     """ScrollableContainer that cannot receive focus."""
@@ -27,10 +58,13 @@ PRIORITY_BADGES = {
 class IssueCard(Static):
     """A card representing an issue in the Kanban board."""
 
-    def __init__(self, issue: dict, is_selected: bool = False) -> None:
-        super().__init__()
+    def __init__(self, issue: dict, is_selected: bool = False, version: Any = None) -> None:
+        super().__init__(classes="selected" if is_selected else None)
         self.issue = issue
         self.is_selected = is_selected
+        # Changes whenever the issue does, so unchanged cards can be left alone
+        self.version = version
+        self.styles.height = CARD_HEIGHT
 
     def compose(self) -> ComposeResult:
         issue = self.issue
@@ -62,6 +96,12 @@ class IssueCard(Static):
 
         yield Static(content)
 
+    def set_issue(self, issue: dict, version: Any = None) -> None:
+        """Show a changed version of the card's issue."""
+        self.issue = issue
+        self.version = version
+        self.refresh(recompose=True)
+
     def update_selection(self, selected: bool) -> None:
         """Update the visual selection state."""
         self.is_selected = selected
@@ -72,23 +112,156 @@ class IssueCard(Static):
 
 
 class KanbanColumn(Vertical):
-    """A column in the Kanban board."""
+    """A column in the Kanban board.
+
+    Only the cards in view, plus CARD_BUFFER on either side, are mounted.
+    Spacers above and below them stand in for the rest, and the window of
+    mounted cards follows the column's scroll position.
+    """
 
     def __init__(self, title: str, column_id: str, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
         self.column_title = title
         self.column_id = column_id
         self.issues: list[dict] = []
+        self.versions: dict[str, Any] = {}
+        # Mounted cards keyed by issue ID, and in display order
+        self.cards: dict[str, IssueCard] = {}
+        self.card_order: list[IssueCard] = []
+        self.selected_id: str | None = None
+        self.top_spacer = Static(classes="spacer")
+        self.bottom_spacer = Static(classes="spacer")
 
     def compose(self) -> ComposeResult:
         yield Static(f"[bold]{self.column_title}[/] ({len(self.issues)})", classes="column-header")
         with NonFocusableScrollableContainer(classes="column-content"):
-            for issue in self.issues:
-                yield IssueCard(issue)
+            yield self.top_spacer
+            yield self.bottom_spacer
+
+    def on_mount(self) -> None:
+        self.watch(self.content, "scroll_y", lambda: self._render_window(), init=False)
+
+    def on_resize(self) -> None:
+        self._render_window()
+
+    @property
+    def content(self) -> ScrollableContainer:
+        return self.query_one(".column-content", ScrollableContainer)
 
-    def set_issues(self, issues: list[dict]) -> None:
-        """Set the issues for this column."""
+    def set_issues(self, issues: list[dict], versions: dict[str, Any]) -> None:
+        """Show `issues` in order, touching only the mounted cards that differ."""
         self.issues = issues
+        self.versions = versions
+        if self.selected_id is not None and self.selected_id not in versions:
+            self.selected_id = None
+        self._render_window()
+
+    def select(self, index: int | None) -> None:
+        """Highlight the card at `index` and scroll it into view, or clear the highlight."""
+        old = self.cards.get(self.selected_id) if self.selected_id is not None else None
+        if index is None or not 0 <= index < len(self.issues):
+            self.selected_id = None
+            if old is not None:
+                old.update_selection(False)
+            return
+        self.selected_id = self.issues[index]["id"]
+        if old is not None and old.issue["id"] != self.selected_id:
+            old.update_selection(False)
+        self.scroll_to_index(index)
+        self.cards[self.selected_id].update_selection(True)
+
+    def scroll_to_index(self, index: int) -> None:
+        """Scroll the card at `index` into view, mounting it right away."""
+        content = self.content
+        height = content.size.height or self.app.size.height
+        # Card tops sit one margin row below each pitch boundary
+        top = CARD_PITCH * index
+        bottom = top + CARD_PITCH + 1
+        scroll_y = content.scroll_y
+        if top < scroll_y:
+            scroll_y = top
+        elif bottom > scroll_y + height:
+            scroll_y = bottom - height
+        self._render_window(scroll_y)
+        if scroll_y != content.scroll_y:
+            # Positions beyond the laid-out height wait for the spacers' new size
+            content.scroll_to(y=scroll_y, animate=False, immediate=scroll_y <= content.max_scroll_y)
+
+    def _render_window(self, scroll_y: float | None = None) -> None:
+        """Mount the cards visible at `scroll_y` (the current position by default)."""
+        content = self.content
+        if scroll_y is None:
+            scroll_y = content.scroll_y
+        height = content.size.height or self.app.size.height
+        first = max(0, int(scroll_y) // CARD_PITCH - CARD_BUFFER)
+        last = min(len(self.issues), (int(scroll_y) + height) // CARD_PITCH + 1 + CARD_BUFFER)
+        first = min(first, last)
+        self.top_spacer.styles.height = first * CARD_PITCH
+        self.bottom_spacer.styles.height = (len(self.issues) - last) * CARD_PITCH
+        self._reconcile(self.issues[first:last])
+
+    def _reconcile(self, issues: list[dict]) -> None:
+        """Make the mounted cards show `issues`, touching only the cards that differ.
+
+        Cards are keyed by issue ID. Cards for issues that left the window
+        are removed, cards for new issues mounted, cards whose version
+        changed redrawn, and the rest moved only if they are out of place.
+        """
+        content = self.content
+        versions = self.versions
+
+        wanted = {issue["id"] for issue in issues}
+        stale = [card for issue_id, card in self.cards.items() if issue_id not in wanted]
+        if stale:
+            content.remove_children(stale)
+            for card in stale:
+                del self.cards[card.issue["id"]]
+
+        # Kept cards in their current order; removed cards may linger in the
+        # DOM until pruned, so positions are tracked here rather than by index
+        current = [card for card in self.card_order if card.issue["id"] in wanted]
+        order: list[IssueCard] = []
+        pending: list[IssueCard] = []  # New cards waiting to be mounted together
+
+        def place(cards: list[IssueCard], mount: bool) -> None:
+            """Put cards right after the last placed card."""
+            position = len(order)
+            if order:
+                anchor = {"after": order[-1]}
+            elif position < len(current):
+                anchor = {"before": current[position]}
+            else:
+                anchor = {"before": self.bottom_spacer}
+            if mount:
+                content.mount(*cards, **anchor)
+            else:
+                content.move_child(cards[0], **anchor)
+                current.remove(cards[0])
+            current[position:position] = cards
+            order.extend(cards)
+
+        for issue in issues:
+            issue_id = issue["id"]
+            version = versions.get(issue_id)
+            card = self.cards.get(issue_id)
+            if card is None:
+                card = self.cards[issue_id] = IssueCard(issue, issue_id == self.selected_id, version)
+                pending.append(card)
+                continue
+            if pending:
+                place(pending, mount=True)
+                pending = []
+            if card.version != version or (card.issue is not issue and card.issue != issue):
+                card.set_issue(issue, version)
+            else:
+                card.issue = issue
+            if len(order) < len(current) and current[len(order)] is card:
+                order.append(card)
+            else:
+                place([card], mount=False)
+        if pending:
+            place(pending, mount=True)
+        self.card_order = order
 
 
 class IssueDetail(Static):
@@ -209,6 +382,10 @@ class IssuesBoardApp(App):
         padding: 1;
     }
 
+    .spacer {
+        height: 0;
+    }
+
     IssueCard {
         margin: 1 0;
         padding: 1;
@@ -259,13 +436,21 @@ class IssuesBoardApp(App):
         Binding("K", "scroll_detail_up", "Detail↑", show=False),
     ]
 
-    def __init__(self) -> None:
+    def __init__(self, auto_reload: bool = True) -> None:
         super().__init__()
+        self.auto_reload = auto_reload
+        self.live: store.LiveHeaders | None = None
+        self.watcher: DirectoryWatcher | None = None
         self.all_issues: dict[str, dict] = {}
         self.columns: list[str] = ["ready", "blocked", "closed"]
         self.column_issues: dict[str, list[dict]] = {"ready": [], "blocked": [], "closed": []}
+        self.versions: dict[str, Any] = {}
+        # Full issues for the detail panel, by (issue ID, version)
+        self.details: dict[tuple[str, Any], dict | None] = {}
+        self.loading_issues = False
         self.current_column = 0
         self.current_index: dict[str, int] = {"ready": 0, "blocked": 0, "closed": 0}
+        self.selected_column: KanbanColumn | None = None
 
     def compose(self) -> ComposeResult:
         yield Header(show_clock=True)
@@ -279,35 +464,71 @@ class IssuesBoardApp(App):
         yield Footer()
 
     def on_mount(self) -> None:
-        """Load issues and populate columns on start."""
+        """Start loading issues; the columns fill in as they arrive."""
+        for column in self.query(KanbanColumn):
+            column.loading = True
         self._load_issues()
+        if self.auto_reload:
+            self.watcher = DirectoryWatcher(store.get_issues_dir(), "events*.jsonl")
+            self.set_interval(WATCH_INTERVAL, self._check_for_changes)
+
+    def on_unmount(self) -> None:
+        if self.watcher is not None:
+            self.watcher.close()
+
+    def _check_for_changes(self) -> None:
+        """Apply events other processes appended since the last check."""
+        # Changes made during a load are left for the first check after it
+        if self.watcher is None or self.live is None or self.loading_issues or not self.watcher.changed():
+            return
+        changed = self.live.refresh()
+        if changed is not None and not changed:
+            return
+        if changed is None:
+            # Reloaded from scratch, so versions may repeat with other events
+            self.details = {}
+        self._categorize()
         self._update_columns()
         self._update_selection()
 
     def _load_issues(self) -> None:
-        """Load issues from store and categorize them."""
-        self.all_issues = store.load_issues()
-
-        # Categorize issues
-        open_issues = store.filter_open(self.all_issues)
-        open_ids = set(open_issues.keys())
-
-        ready = []
-        blocked = []
-        closed = []
-
-        for issue_id, issue in sorted(self.all_issues.items(), key=lambda x: (x[1].get("priority", 2), x[0])):
-            if issue["status"] == "closed":
-                closed.append(issue)
-            else:
-                deps = set(issue.get("depends_on", []))
-                unsatisfied_deps = deps & open_ids
-                if unsatisfied_deps:
-                    blocked.append(issue)
-                else:
-                    ready.append(issue)
-
-        self.column_issues = {"ready": ready, "blocked": blocked, "closed": closed}
+        """Reload issues from the store in the background."""
+        self.loading_issues = True
+        self._load_issues_worker()
+
+    @work(thread=True, exclusive=True)
+    def _load_issues_worker(self) -> None:
+        """Load the issue headers off the UI thread, then show them column by column."""
+        # Cards only need headers; the detail panel loads the full issue on demand
+        live = store.LiveHeaders()
+        column_issues = categorize_issues(live.headers, live.index)
+        if get_current_worker().is_cancelled:
+            return
+        self.call_from_thread(self._set_live, live, column_issues)
+        # Ready issues are what people open the board for, so they come first
+        for col_id in self.columns:
+            self.call_from_thread(self._update_columns, [col_id])
+            if col_id == self.columns[self.current_column]:
+                self.call_from_thread(self._update_selection)
+        self.call_from_thread(self._finish_loading)
+
+    def _finish_loading(self) -> None:
+        self.loading_issues = False
+
+    def _set_live(self, live: store.LiveHeaders, column_issues: dict[str, list[dict]]) -> None:
+        """Switch to freshly loaded headers, already sorted into columns."""
+        self.live = live
+        self.details = {}
+        self._categorize(column_issues)
+
+    def _categorize(self, column_issues: dict[str, list[dict]] | None = None) -> None:
+        """Sort the loaded issues into the board's columns, unless given them sorted."""
+        self.all_issues = self.live.headers
+        if column_issues is None:
+            column_issues = categorize_issues(self.all_issues, self.live.index)
+        self.column_issues = column_issues
+        # An issue's header gains an event reference with every change
+        self.versions = {issue_id: len(getattr(issue, "events", ())) for issue_id, issue in self.all_issues.items()}
 
         # Reset indices if needed
         for col in self.columns:
@@ -315,54 +536,41 @@ class IssuesBoardApp(App):
             if self.current_index[col] > max_idx:
                 self.current_index[col] = max(0, max_idx)
 
-    def _update_columns(self) -> None:
-        """Update the visual column widgets."""
+    def _update_columns(self, col_ids: list[str] | None = None) -> None:
+        """Update the visual column widgets (all of them by default)."""
         column_map = {
             "ready": "#ready-column",
             "blocked": "#blocked-column",
             "closed": "#closed-column",
         }
 
-        for col_id, selector in column_map.items():
-            column = self.query_one(selector, KanbanColumn)
-            issues = self.column_issues[col_id]
-            column.set_issues(issues)
+        with self.batch_update():
+            for col_id in col_ids or self.columns:
+                column = self.query_one(column_map[col_id], KanbanColumn)
+                issues = self.column_issues[col_id]
+                column.set_issues(issues, self.versions)
+                column.loading = False
 
-            # Update header with count
-            header = column.query_one(".column-header", Static)
-            title = {"ready": "Ready", "blocked": "Blocked", "closed": "Closed"}[col_id]
-            header.update(f"[bold]{title}[/] ({len(issues)})")
-
-            # Rebuild cards
-            content = column.query_one(".column-content", ScrollableContainer)
-            content.remove_children()
-            for i, issue in enumerate(issues):
-                card = IssueCard(issue)
-                content.mount(card)
+                # Update header with count
+                header = column.query_one(".column-header", Static)
+                title = {"ready": "Ready", "blocked": "Blocked", "closed": "Closed"}[col_id]
+                header.update(f"[bold]{title}[/] ({len(issues)})")
 
     def _update_selection(self) -> None:
-        """Update visual selection across all columns."""
+        """Move the selection highlight to the current card."""
         column_map = {
             "ready": "#ready-column",
             "blocked": "#blocked-column",
             "closed": "#closed-column",
         }
 
-        selected_card = None
-        for col_idx, col_id in enumerate(self.columns):
-            column = self.query_one(column_map[col_id], KanbanColumn)
-            cards = list(column.query(IssueCard))
-            current_idx = self.current_index[col_id]
-
-            for i, card in enumerate(cards):
-                is_selected = (col_idx == self.current_column) and (i == current_idx)
-                card.update_selection(is_selected)
-                if is_selected:
-                    selected_card = card
-
-        # Scroll the selected card into view
-        if selected_card is not None:
-            selected_card.scroll_visible()
+        # Only the previously selected card and the new one change
+        col_id = self.columns[self.current_column]
+        column = self.query_one(column_map[col_id], KanbanColumn)
+        if self.selected_column is not None and self.selected_column is not column:
+            self.selected_column.select(None)
+        self.selected_column = column
+        column.select(self.current_index[col_id])
 
         # Update detail panel
         self._update_detail()
@@ -374,8 +582,15 @@ class IssuesBoardApp(App):
         issues = self.column_issues[col_id]
         idx = self.current_index[col_id]
 
+        issue = None
         if issues and 0 <= idx < len(issues):
-            detail.show_issue(issues[idx])
+            header = issues[idx]
+            key = (header["id"], self.versions.get(header["id"]))
+            if key not in self.details:
+                self.details[key] = store.load_issue_detail(header)
+            issue = self.details[key]
+        if issue is not None:
+            detail.show_issue(issue)
         else:
             detail.clear()
 
@@ -427,8 +642,6 @@ class IssuesBoardApp(App):
     def action_refresh(self) -> None:
         """Reload issues from disk."""
         self._load_issues()
-        self._update_columns()
-        self._update_selection()
 
     def action_scroll_detail_down(self) -> None:
         """Scroll the detail panel down (Shift+j)."""
@@ -0,0 +1,74 @@
+"""
+List output shared by the issues and sessions CLIs.
+
+By default lists are printed as one indented JSON array, as they always
+were. `--format ndjson` streams one compact object per line instead, which
+consumers can process without parsing the whole document. `--fields`
+projects each object onto some of its keys, and `--offset`/`--limit`
+paginate.
+"""
+
+import argparse
+import itertools
+import json
+from collections.abc import Callable, Iterable, Mapping
+from typing import Any, TextIO
+
+
+def non_negative_int(value: str) -> int:
+    """Parse a count argument, rejecting negative numbers."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}")
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"must not be negative: {value}")
+    return number
+
+
+def add_output_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add --format, --fields, --limit and --offset to a CLI parser."""
+    parser.add_argument("--format", choices=["json", "ndjson"], default="json",
+                        help="Output format for lists: json (default) or ndjson (one object per line)")
+    parser.add_argument("--fields", metavar="FIELDS",
+                        help="Comma-separated fields to output (e.g. id,title,priority)")
+    parser.add_argument("--limit", type=non_negative_int, metavar="N", help="Output at most N items")
+    parser.add_argument("--offset", type=non_negative_int, default=0, metavar="N", help="Skip the first N items")
+
+
+def parse_fields(value: str | None) -> list[str] | None:
+    """Parse a --fields value into a list of field names."""
+    if not value:
+        return None
+    return [field.strip() for field in value.split(",") if field.strip()] or None
+
+
+def project(item: Any, fields: list[str] | None) -> Any:
+    """Keep only `fields` of a record, in the order given; other items pass through."""
+    if fields is None or not isinstance(item, Mapping):
+        return item
+    return {field: item[field] for field in fields if field in item}
+
+
+def write_items(
+    items: Iterable[Any],
+    args: argparse.Namespace,
+    out: TextIO,
+    default: Callable[[Any], Any] | None = None,
+) -> None:
+    """Write a list of items as the output arguments ask.
+
+    Args:
+        items: Items in output order; only the requested page is consumed.
+        args: Parsed arguments from a parser set up by add_output_arguments().
+        out: Stream to write to.
+        default: Serializer for non-JSON types, as for json.dumps().
+    """
+    fields = parse_fields(args.fields)
+    stop = None if args.limit is None else args.offset + args.limit
+    page = (project(item, fields) for item in itertools.islice(items, args.offset, stop))
+    if args.format == "ndjson":
+        for item in page:
+            out.write(json.dumps(item, separators=(",", ":"), default=default) + "\n")
+    else:
+        out.write(json.dumps(list(page), indent=2, default=default) + "\n")
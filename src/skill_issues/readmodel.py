@@ -0,0 +1,340 @@
+"""
+Optional SQLite read model for issues and sessions.
+
+The JSONL logs in .issues/ and .sessions/ stay the source of truth. A project
+can opt in to an indexed copy of the current state by running `issues index`
+or `sessions index`, which creates a database in the data directory's
+gitignored .cache/ folder. While that database exists, the stores' query
+functions use it instead of replaying the logs. Before each query it is
+brought up to date from the bytes appended to each log since the last sync,
+and rebuilt from scratch whenever a log was rewritten.
+
+The stores import this module lazily, so projects that don't opt in never
+pay for importing sqlite3.
+"""
+
+import json
+import sqlite3
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any
+
+from skill_issues.eventlog import ensure_cache_dir, file_unchanged_since, fingerprint, iter_records
+from skill_issues.issues import store as issues_store
+from skill_issues.records import Issue, Session
+from skill_issues.sessions import store as sessions_store
+
+SCHEMA_VERSION = 1
+
+_COMMON_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS files (name TEXT PRIMARY KEY, offset INTEGER NOT NULL, fingerprint TEXT NOT NULL);
+"""
+
+
+class _ReadModel(ABC):
+    """Shared plumbing: connection, schema and per-file sync offsets."""
+
+    SCHEMA = ""
+    TABLES: list[str] = []
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.conn = sqlite3.connect(path, timeout=10)
+        self.conn.executescript(_COMMON_SCHEMA + self.SCHEMA)
+        if self._meta("schema_version") != str(SCHEMA_VERSION):
+            with self.conn:
+                self._clear()
+                self._set_meta("schema_version", str(SCHEMA_VERSION))
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def __enter__(self) -> "_ReadModel":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def _meta(self, key: str) -> str | None:
+        row = self.conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _set_meta(self, key: str, value: str) -> None:
+        self.conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
+
+    def _clear(self) -> None:
+        """Delete all projected rows and sync offsets."""
+        for table in ["files", *self.TABLES]:
+            self.conn.execute(f"DELETE FROM {table}")
+        self.conn.execute("DELETE FROM meta WHERE key != 'schema_version'")
+
+    @abstractmethod
+    def _files(self) -> list[Path]:
+        """Return the event files this model projects."""
+
+    def _pending_ranges(self, files: list[Path]) -> dict[Path, tuple[int, int]] | None:
+        """Return the byte range of each file not yet applied.
+
+        Returns None if a file was deleted or rewritten, meaning the model
+        must be rebuilt from scratch.
+        """
+        saved = {
+            name: (offset, fp)
+            for name, offset, fp in self.conn.execute("SELECT name, offset, fingerprint FROM files")
+        }
+        if set(saved) - {f.name for f in files}:
+            return None
+        ranges: dict[Path, tuple[int, int]] = {}
+        for path in files:
+            start = 0
+            if path.name in saved:
+                start, fp = saved[path.name]
+                if not file_unchanged_since(path, start, fp):
+                    return None
+            size = path.stat().st_size
+            if size > start:
+                ranges[path] = (start, size)
+        return ranges
+
+    def _save_offsets(self, ranges: dict[Path, tuple[int, int]]) -> None:
+        for path, (_, end) in ranges.items():
+            self.conn.execute(
+                "INSERT OR REPLACE INTO files (name, offset, fingerprint) VALUES (?, ?, ?)",
+                (path.name, end, fingerprint(path, end)),
+            )
+
+    @abstractmethod
+    def _apply(self, ranges: dict[Path, tuple[int, int]], rebuilding: bool) -> bool:
+        """Apply new records. Returns False if a full rebuild is needed instead."""
+
+    def sync(self) -> None:
+        """Bring the model up to date with the event logs."""
+        with self.conn:
+            # Take the write lock up front so concurrent syncs don't both apply the same bytes
+            self.conn.execute("BEGIN IMMEDIATE")
+            files = self._files()
+            ranges = self._pending_ranges(files)
+            if ranges is not None and not ranges:
+                return
+            if ranges is None or not self._apply(ranges, rebuilding=False):
+                self._clear()
+                ranges = {f: (0, f.stat().st_size) for f in files}
+                self._apply(ranges, rebuilding=True)
+            self._save_offsets(ranges)
+
+
+class IssuesReadModel(_ReadModel):
+    """Indexed projection of the issues event logs."""
+
+    SCHEMA = """
+    CREATE TABLE IF NOT EXISTS issues (
+        id TEXT PRIMARY KEY, status TEXT NOT NULL, priority INTEGER NOT NULL, data TEXT NOT NULL
+    );
+    CREATE INDEX IF NOT EXISTS issues_status ON issues (status, priority, id);
+    CREATE TABLE IF NOT EXISTS deps (issue_id TEXT NOT NULL, dep_id TEXT NOT NULL);
+    CREATE INDEX IF NOT EXISTS deps_issue ON deps (issue_id);
+    CREATE TABLE IF NOT EXISTS labels (issue_id TEXT NOT NULL, label TEXT NOT NULL);
+    CREATE INDEX IF NOT EXISTS labels_label ON labels (label);
+    """
+    TABLES = ["issues", "deps", "labels"]
+
+    def _files(self) -> list[Path]:
+        return issues_store._event_files()
+
+    def _apply(self, ranges: dict[Path, tuple[int, int]], rebuilding: bool) -> bool:
+        if rebuilding:
+            issues, mark = issues_store._replay_events(issues_store._build_issues, dict(ranges), located=True)
+        else:
+            new_items = issues_store._replay_events(list, dict(ranges), located=True)
+            if not new_items:
+                return True
+            files = self._files()
+            first = (issues_store._event_ts(new_items[0][0]), new_items[0][1].name)
+            applied = (self._meta("max_ts") or "", self._meta("max_file") or "")
+            if issues_store._replay_position(first, files) < issues_store._replay_position(applied, files):
+                # Older events (e.g. from a git pull) must be replayed in order
+                return False
+            issues = self._load({item[0]["id"] for item in new_items})
+            for event, _, _, _ in new_items:
+                issues_store._apply_event(issues, event)
+            mark = (issues_store._event_ts(new_items[-1][0]), new_items[-1][1].name)
+        for issue in issues.values():
+            self._write(issue)
+        self._set_meta("max_ts", mark[0])
+        self._set_meta("max_file", mark[1])
+        return True
+
+    def _load(self, issue_ids: set[str]) -> dict[str, Issue]:
+        issues = {}
+        for issue_id in issue_ids:
+            row = self.conn.execute("SELECT data FROM issues WHERE id = ?", (issue_id,)).fetchone()
+            if row:
+                issues[issue_id] = Issue.from_dict(json.loads(row[0]))
+        return issues
+
+    def _write(self, issue: Issue) -> None:
+        issue_id = issue["id"]
+        self.conn.execute(
+            "INSERT OR REPLACE INTO issues (id, status, priority, data) VALUES (?, ?, ?, ?)",
+            (issue_id, issue["status"], issue.get("priority", 2), json.dumps(issue.to_dict())),
+        )
+        self.conn.execute("DELETE FROM deps WHERE issue_id = ?", (issue_id,))
+        self.conn.executemany(
+            "INSERT INTO deps (issue_id, dep_id) VALUES (?, ?)",
+            [(issue_id, dep) for dep in issue.get("depends_on", [])],
+        )
+        self.conn.execute("DELETE FROM labels WHERE issue_id = ?", (issue_id,))
+        self.conn.executemany(
+            "INSERT INTO labels (issue_id, label) VALUES (?, ?)",
+            [(issue_id, label) for label in issue.get("labels", [])],
+        )
+
+    def count(self) -> int:
+        return self.conn.execute("SELECT COUNT(*) FROM issues").fetchone()[0]
+
+    def get(self, issue_id: str) -> Issue | None:
+        row = self.conn.execute("SELECT data FROM issues WHERE id = ?", (issue_id,)).fetchone()
+        return Issue.from_dict(json.loads(row[0])) if row else None
+
+    def query(self, view: str = "open", label: str | None = None) -> dict[str, Issue]:
+        """Return issues for a view ("all", "open", "closed" or "ready")."""
+        where: list[str] = []
+        params: list[Any] = []
+        if view in ("open", "ready"):
+            where.append("i.status = 'open'")
+        elif view == "closed":
+            where.append("i.status = 'closed'")
+        if view == "ready":
+            where.append(
+                "NOT EXISTS (SELECT 1 FROM deps d JOIN issues o ON o.id = d.dep_id"
+                " WHERE d.issue_id = i.id AND o.status = 'open')"
+            )
+        if label:
+            where.append("EXISTS (SELECT 1 FROM labels l WHERE l.issue_id = i.id AND l.label = ?)")
+            params.append(label)
+        sql = "SELECT id, data FROM issues i"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        sql += " ORDER BY i.priority, i.id"
+        return {issue_id: Issue.from_dict(json.loads(data)) for issue_id, data in self.conn.execute(sql, params)}
+
+
+class SessionsReadModel(_ReadModel):
+    """Indexed copy of the sessions logs, with amendments folded in."""
+
+    SCHEMA = """
+    CREATE TABLE IF NOT EXISTS sessions (
+        id TEXT PRIMARY KEY, user TEXT, date TEXT NOT NULL, data TEXT NOT NULL
+    );
+    CREATE INDEX IF NOT EXISTS sessions_order ON sessions (date, id);
+    CREATE INDEX IF NOT EXISTS sessions_user ON sessions (user, date, id);
+    CREATE TABLE IF NOT EXISTS session_issues (session_id TEXT NOT NULL, issue_id TEXT NOT NULL);
+    CREATE INDEX IF NOT EXISTS session_issues_issue ON session_issues (issue_id);
+    """
+    TABLES = ["sessions", "session_issues"]
+
+    def _files(self) -> list[Path]:
+        return sessions_store._session_files()
+
+    def _apply(self, ranges: dict[Path, tuple[int, int]], rebuilding: bool) -> bool:
+        # Amendments refer to sessions earlier in the same file, so apply each
+        # file's records in file order rather than merging across files
+        for path, (start, end) in ranges.items():
+            # Stop at the recorded end; later bytes belong to the next sync
+            for record in iter_records(path, start, end):
+                if record.get("type") == "amended":
+                    session = self.get(record.get("id", ""))
+                    if session is None:
+                        continue
+                    sessions_store._apply_amendment(session, record)
+                else:
+                    session = Session(record)
+                self._write(session)
+        return True
+
+    def _write(self, session: Session) -> None:
+        session_id = session.get("id", "")
+        user = sessions_store.session_user(session)
+        self.conn.execute(
+            "INSERT OR REPLACE INTO sessions (id, user, date, data) VALUES (?, ?, ?, ?)",
+            (session_id, user, session.get("date", ""), json.dumps(session.to_dict())),
+        )
+        self.conn.execute("DELETE FROM session_issues WHERE session_id = ?", (session_id,))
+        self.conn.executemany(
+            "INSERT INTO session_issues (session_id, issue_id) VALUES (?, ?)",
+            [(session_id, issue_id) for issue_id in session.get("issues_worked", [])],
+        )
+
+    def count(self) -> int:
+        return self.conn.execute("SELECT COUNT(*) FROM sessions").fetchone()[0]
+
+    def get(self, session_id: str) -> Session | None:
+        row = self.conn.execute("SELECT data FROM sessions WHERE id = ?", (session_id,)).fetchone()
+        return Session(json.loads(row[0])) if row else None
+
+    def query(self, user: str | None = None, issue: str | None = None) -> list[Session]:
+        """Return sessions in (date, id) order, optionally filtered."""
+        where: list[str] = []
+        params: list[Any] = []
+        if user is not None:
+            where.append("s.user = ?")
+            params.append(user)
+        if issue is not None:
+            where.append("EXISTS (SELECT 1 FROM session_issues si WHERE si.session_id = s.id AND si.issue_id = ?)")
+            params.append(issue)
+        sql = "SELECT data FROM sessions s"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        sql += " ORDER BY s.date, s.id"
+        return [Session(json.loads(data)) for (data,) in self.conn.execute(sql, params)]
+
+
+def open_issues_model() -> IssuesReadModel | None:
+    """Open and sync the issues read model, or return None if it is unusable.
+
+    Query paths fall back to replaying the logs rather than failing when the
+    database is locked, read-only or corrupt.
+    """
+    try:
+        model = IssuesReadModel(issues_store.get_read_model_file())
+    except sqlite3.Error:
+        return None
+    try:
+        model.sync()
+    except sqlite3.Error:
+        model.close()
+        return None
+    return model
+
+
+def open_sessions_model() -> SessionsReadModel | None:
+    """Open and sync the sessions read model, or return None if it is unusable."""
+    try:
+        model = SessionsReadModel(sessions_store.get_read_model_file())
+    except sqlite3.Error:
+        return None
+    try:
+        model.sync()
+    except sqlite3.Error:
+        model.close()
+        return None
+    return model
+
+
+def build_issues_model() -> int:
+    """Create or refresh the issues read model. Returns the number of issues."""
+    issues_store.ensure_data_dir()
+    ensure_cache_dir(issues_store.get_issues_dir())
+    with IssuesReadModel(issues_store.get_read_model_file()) as model:
+        model.sync()
+        return model.count()
+
+
+def build_sessions_model() -> int:
+    """Create or refresh the sessions read model. Returns the number of sessions."""
+    sessions_store.ensure_data_dir()
+    ensure_cache_dir(sessions_store.get_sessions_dir())
+    with SessionsReadModel(sessions_store.get_read_model_file()) as model:
+        model.sync()
+        return model.count()
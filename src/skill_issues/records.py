@@ -0,0 +1,290 @@
+"""
+Compact record types for the issues and sessions projections.
+
+A long-lived repo holds tens of thousands of issues, notes, updates and
+sessions in memory, and plain dicts cost several times the size of the JSONL
+they came from. These classes use __slots__ and intern the strings that repeat
+across records (IDs, labels, types, statuses, users, dates).
+
+Every record is also a mapping with exactly the keys of the dict it replaces,
+so code written against the dict projection keeps working, and to_dict() /
+json.dumps(..., default=to_json) produce the same JSON as before.
+"""
+
+import sys
+from collections.abc import Iterator, Mapping, MutableMapping
+from dataclasses import dataclass, field
+from typing import Any, ClassVar
+
+intern = sys.intern
+
+
+def _plain(value: Any) -> Any:
+    """Convert records (possibly nested in lists) to plain dicts."""
+    if isinstance(value, (Record, Session)):
+        return value.to_dict()
+    if isinstance(value, list):
+        return [_plain(v) for v in value]
+    return value
+
+
+def to_json(obj: Any) -> Any:
+    """`default=` hook for json.dumps that serializes records as dicts."""
+    if isinstance(obj, (Record, Session)):
+        return obj.to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+class Record(Mapping):
+    """Read-only dict-style access over a record's fields.
+
+    KEYS lists the dict keys in output order. A field holding None is treated
+    as absent, matching the dicts, which only had e.g. "closed_at" once an
+    issue was closed.
+    """
+
+    __slots__ = ()
+    KEYS: ClassVar[tuple[str, ...]] = ()
+    # Dict keys whose attribute name differs (e.g. "from" is a keyword)
+    ATTRS: ClassVar[dict[str, str]] = {}
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self.KEYS:
+            value = getattr(self, self.ATTRS.get(key, key))
+            if value is not None:
+                return value
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        return (k for k in self.KEYS if getattr(self, self.ATTRS.get(k, k)) is not None)
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the record as a plain dict, recursively."""
+        return {k: _plain(v) for k, v in self.items()}
+
+
+@dataclass(slots=True, eq=False)
+class Change(Record):
+    """A field change recorded in an issue's update history."""
+
+    KEYS: ClassVar[tuple[str, ...]] = ("from", "to")
+    ATTRS: ClassVar[dict[str, str]] = {"from": "old", "to": "new"}
+
+    old: Any
+    new: Any
+
+
+@dataclass(slots=True, eq=False)
+class Note(Record):
+    """A note attached to an issue."""
+
+    KEYS: ClassVar[tuple[str, ...]] = ("ts", "content")
+
+    ts: str
+    content: str
+
+
+@dataclass(slots=True, eq=False)
+class Update(Record):
+    """An entry in an issue's update history."""
+
+    KEYS: ClassVar[tuple[str, ...]] = ("ts", "reason", "priority", "labels", "depends_on")
+
+    ts: str
+    reason: str | None = None
+    priority: Change | None = None
+    labels: Change | None = None
+    depends_on: Change | None = None
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "Update":
+        changes = {
+            k: Change(data[k]["from"], data[k]["to"])
+            for k in ("priority", "labels", "depends_on")
+            if k in data
+        }
+        return cls(ts=data["ts"], reason=data.get("reason"), **changes)
+
+
+@dataclass(slots=True, eq=False)
+class Issue(Record):
+    """Current state of an issue, as projected from its events."""
+
+    KEYS: ClassVar[tuple[str, ...]] = (
+        "id", "title", "type", "priority", "description", "depends_on", "labels",
+        "created", "status", "notes", "updates", "closed_reason", "closed_at",
+    )
+
+    id: str
+    title: str
+    type: str
+    priority: int
+    description: str
+    depends_on: list[str]
+    labels: list[str]
+    created: str
+    status: str = "open"
+    notes: list[Note] = field(default_factory=list)
+    updates: list[Update] = field(default_factory=list)
+    closed_reason: str | None = None
+    closed_at: str | None = None
+
+    def __post_init__(self) -> None:
+        _intern_issue_fields(self)
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "Issue":
+        return cls(
+            id=data["id"],
+            title=data["title"],
+            type=data["type"],
+            priority=data["priority"],
+            description=data["description"],
+            depends_on=list(data["depends_on"]),
+            labels=list(data["labels"]),
+            created=data["created"],
+            status=data["status"],
+            notes=[Note(n["ts"], n["content"]) for n in data["notes"]],
+            updates=[Update.from_dict(u) for u in data["updates"]],
+            closed_reason=data.get("closed_reason"),
+            closed_at=data.get("closed_at"),
+        )
+
+
+@dataclass(slots=True, eq=False)
+class IssueHeader(Record):
+    """The fields list views need, without descriptions, notes or history.
+
+    `events` holds the (file name, offset, length) of each of the issue's
+    events in replay order, so the full Issue can be rebuilt on demand by
+    reading just those lines (see issues.store.load_issue_detail()).
+    """
+
+    KEYS: ClassVar[tuple[str, ...]] = (
+        "id", "title", "type", "priority", "depends_on", "labels", "created", "status", "closed_at",
+    )
+
+    id: str
+    title: str
+    type: str
+    priority: int
+    depends_on: list[str]
+    labels: list[str]
+    created: str
+    status: str = "open"
+    closed_at: str | None = None
+    events: list[tuple[str, int, int]] = field(default_factory=list)
+
+    def __post_init__(self) -> None:
+        _intern_issue_fields(self)
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "IssueHeader":
+        return cls(
+            id=data["id"],
+            title=data["title"],
+            type=data["type"],
+            priority=data["priority"],
+            depends_on=list(data["depends_on"]),
+            labels=list(data["labels"]),
+            created=data["created"],
+            status=data["status"],
+            closed_at=data.get("closed_at"),
+            events=[(intern(name), offset, length) for name, offset, length in data.get("events", [])],
+        )
+
+
+def _intern_issue_fields(issue: Issue | IssueHeader) -> None:
+    issue.id = intern(issue.id)
+    issue.type = intern(issue.type)
+    issue.status = intern(issue.status)
+    issue.depends_on = [intern(d) for d in issue.depends_on]
+    issue.labels = [intern(label) for label in issue.labels]
+
+
+# Sessions written by different versions of the tool have different key
+# orders; share one tuple per distinct order instead of one per session.
+_KEY_ORDERS: dict[tuple[str, ...], tuple[str, ...]] = {}
+
+
+def _key_order(keys: tuple[str, ...]) -> tuple[str, ...]:
+    return _KEY_ORDERS.setdefault(keys, keys)
+
+
+class Session(MutableMapping):
+    """A session record.
+
+    Unlike issues, sessions are stored as written, so the record keeps the
+    original key order (and any keys it doesn't know about) to serialize back
+    to the same JSON.
+    """
+
+    FIELDS = frozenset({
+        "id", "user", "date", "topic", "learnings", "open_questions", "next_actions", "issues_worked",
+    })
+    _INTERNED = frozenset({"id", "user", "date"})
+
+    __slots__ = (
+        "id", "user", "date", "topic", "learnings", "open_questions", "next_actions", "issues_worked",
+        "_keys", "_extra",
+    )
+
+    def __init__(self, data: Mapping[str, Any]) -> None:
+        self._keys = _key_order(tuple(data))
+        self._extra: dict[str, Any] | None = None
+        for name in self.FIELDS:
+            object.__setattr__(self, name, None)
+        for key, value in data.items():
+            self._store(key, value)
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "Session":
+        return cls(data)
+
+    def _store(self, key: str, value: Any) -> None:
+        if key in self.FIELDS:
+            if key in self._INTERNED and isinstance(value, str):
+                value = intern(value)
+            setattr(self, key, value)
+        else:
+            if self._extra is None:
+                self._extra = {}
+            self._extra[key] = value
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self._keys:
+            raise KeyError(key)
+        if key in self.FIELDS:
+            return getattr(self, key)
+        assert self._extra is not None
+        return self._extra[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if key not in self._keys:
+            self._keys = _key_order(self._keys + (key,))
+        self._store(key, value)
+
+    def __delitem__(self, key: str) -> None:
+        if key not in self._keys:
+            raise KeyError(key)
+        self._keys = _key_order(tuple(k for k in self._keys if k != key))
+        if key in self.FIELDS:
+            setattr(self, key, None)
+        elif self._extra is not None:
+            del self._extra[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._keys)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __repr__(self) -> str:
+        return f"Session({self.to_dict()!r})"
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the session as a plain dict in its original key order."""
+        return {k: self[k] for k in self._keys}
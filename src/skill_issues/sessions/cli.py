@@ -3,13 +3,52 @@
 import argparse
 import json
 import sys
+from collections.abc import Callable
+from typing import Any
 
-from skill_issues import maybe_show_prefix_hint, set_project_root
-from . import store
+from skill_issues import daemon, get_user_prefix, maybe_show_prefix_hint, set_project_root
+from skill_issues.output import add_output_arguments, parse_fields, project, write_items
+
+
+def batch_handlers(batch: Any) -> dict[str, Callable[[dict[str, Any]], dict[str, Any]]]:
+    """Map `sessions batch` ops to a SessionBatch."""
+    from skill_issues.batch import list_arg
+
+    def fields(command: dict[str, Any]) -> dict[str, list[str] | None]:
+        return {
+            name: list_arg(command.get(name))
+            for name in ("learnings", "open_questions", "next_actions", "issues_worked")
+        }
+
+    def create(command: dict[str, Any]) -> dict[str, Any]:
+        return batch.create(command["topic"], **fields(command))
+
+    def amend(command: dict[str, Any]) -> dict[str, Any]:
+        session_id = command.get("id")
+        added = fields(command)
+        if not any(added.values()):
+            raise ValueError("amend requires at least one of learnings, open_questions, next_actions or issues_worked")
+        session = batch.amend(session_id, **added)
+        if session is None:
+            if session_id:
+                raise ValueError(f"Session '{session_id}' not found")
+            raise ValueError("No sessions exist yet. Use create first.")
+        return {"amended": session["id"]}
+
+    return {"create": create, "amend": amend}
 
 
 def main() -> int:
     """Entry point for the sessions command."""
+    # Let a running daemon answer, if there is one for this project
+    forwarded = daemon.forward("sessions", sys.argv[1:])
+    if forwarded is not None:
+        return forwarded
+
+    # Imported only now so commands answered by the daemon skip these imports
+    from skill_issues.records import to_json
+    from . import store
+
     # Parse --root early before any store operations
     # This allows overriding project root resolution
     root_parser = argparse.ArgumentParser(add_help=False)
@@ -34,8 +73,11 @@ Examples:
   sessions --by-issue dp-042       # Sessions that worked on issue dp-042
   sessions --by-topic auth         # Sessions with 'auth' in topic
   sessions --open-questions        # All open questions
+  sessions --all --format ndjson --fields id,topic  # One compact line per session
   sessions --create "feature-x" -l "Learned thing" -i "dp-001,dp-002"
   sessions --amend -l "Another learning"      # Amend last session
+  sessions index                   # Build SQLite read model for fast queries
+  sessions batch < commands.jsonl  # Run several creates/amends in one process
 """
     )
 
@@ -44,9 +86,12 @@ Examples:
                         help="Project root directory (overrides auto-detection)")
 
     # Subcommands
-    parser.add_argument("command", nargs="?", choices=["board", "init"], help="Subcommand: board (TUI), init (setup skill)")
+    parser.add_argument("command", nargs="?", choices=["board", "init", "index", "batch"],
+                        help="Subcommand: board (TUI), init (setup skill), index (build SQLite read model), "
+                             "batch (JSON-lines writes from stdin)")
     parser.add_argument("init_path", nargs="?", help="Project path for init (default: current directory)")
     parser.add_argument("--update", "-u", action="store_true", help="Overwrite existing SKILL.md files (for init)")
+    parser.add_argument("--drop", action="store_true", help="Delete the read model (for index)")
 
     # Query options (mutually exclusive group)
     query = parser.add_mutually_exclusive_group()
@@ -80,6 +125,9 @@ Examples:
     parser.add_argument("-i", "--issues", metavar="IDS",
                         help="Comma-separated list of issue IDs worked on")
 
+    # Output options for queries
+    add_output_arguments(parser)
+
     args = parser.parse_args()
 
     # Handle board subcommand (TUI)
@@ -93,6 +141,23 @@ Examples:
         from .. import init as init_module
         return init_module.run_init(["sessions"], args.init_path, update=args.update)
 
+    # Handle index subcommand
+    if args.command == "index":
+        model_file = store.get_read_model_file()
+        if args.drop:
+            model_file.unlink(missing_ok=True)
+            print(json.dumps({"dropped": str(model_file)}))
+            return 0
+        from skill_issues import readmodel
+        print(json.dumps({"indexed": readmodel.build_sessions_model(), "path": str(model_file)}))
+        return 0
+
+    # Handle batch subcommand
+    if args.command == "batch":
+        from skill_issues.batch import run_batch
+        batch = store.SessionBatch()
+        return run_batch(sys.stdin, batch_handlers(batch), batch.commit, sys.stdout)
+
     # Handle create command
     if args.create:
         issues_worked = args.issues.split(",") if args.issues else None
@@ -151,18 +216,19 @@ Examples:
         return 0
 
     # Query commands
-    all_sessions = store.load_sessions()
 
     # Apply user filtering (default: current user, --user all: everyone, --user X: specific user)
     if args.user == "all":
-        sessions = all_sessions
+        user = None
     elif args.user:
-        sessions = store.filter_by_user(all_sessions, args.user)
+        user = args.user
     else:
-        sessions = store.filter_by_user(all_sessions)
+        user, _ = get_user_prefix()
+    sessions = store.query_sessions(user, issue=args.by_issue)
 
     if not sessions:
-        print("[]")
+        if args.format == "json":
+            print("[]")
         return 0
 
     # Handle markdown output (not JSON)
@@ -180,7 +246,7 @@ Examples:
     elif args.next_actions:
         output = store.aggregate_next_actions(sessions)
     elif args.by_issue:
-        output = store.filter_by_issue(sessions, args.by_issue)
+        output = sessions
     elif args.by_topic:
         output = store.filter_by_topic(sessions, args.by_topic)
     elif args.last:
@@ -189,7 +255,12 @@ Examples:
         # Default: last session
         output = sessions[-1]
 
-    print(json.dumps(output, indent=2))
+    if isinstance(output, list):
+        write_items(output, args, sys.stdout, default=to_json)
+    elif args.format == "ndjson":
+        print(json.dumps(project(output, parse_fields(args.fields)), separators=(",", ":"), default=to_json))
+    else:
+        print(json.dumps(project(output, parse_fields(args.fields)), indent=2, default=to_json))
     return 0
 
 
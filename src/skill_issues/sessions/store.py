@@ -5,13 +5,24 @@ This module handles all data persistence and querying for sessions.
 It can be imported independently of the CLI.
 """
 
-import json
+import heapq
 import re
-from datetime import date
+from collections.abc import Iterator
+from datetime import date, datetime, timezone
 from pathlib import Path
 from typing import Any
 
 from skill_issues import get_project_root, get_user_prefix
+from skill_issues.eventlog import (
+    append_records,
+    ensure_cache_dir,
+    get_cache_dir,
+    high_water_mark,
+    is_sorted,
+    memoized,
+    read_records,
+)
+from skill_issues.records import Session
 
 
 def get_sessions_dir() -> Path:
@@ -76,39 +87,85 @@ def ensure_user_events_file(prefix: str | None = None) -> Path:
     return events_file
 
 
-def _load_sessions_from_file(filepath: Path) -> list[dict[str, Any]]:
-    """Load sessions from a single JSONL file."""
-    if not filepath.exists():
-        return []
-    sessions = []
-    for line in filepath.read_text().splitlines():
-        if not line.strip():
+def _load_sessions_from_file(filepath: Path) -> list[Session]:
+    """Load sessions from a single JSONL file, folding in amendments."""
+    records, _ = read_records(filepath)
+    return _fold_records(records)
+
+
+def _fold_records(records: list[dict[str, Any]]) -> list[Session]:
+    """Turn raw file records into sessions.
+
+    Session records are kept in file order. Amendment records
+    ({"type": "amended", "id": ...}) are applied to the session they name,
+    which always lives earlier in the same user's file.
+    """
+    sessions: list[Session] = []
+    by_id: dict[str, Session] = {}
+    for record in records:
+        if record.get("type") == "amended":
+            session = by_id.get(record.get("id", ""))
+            if session is not None:
+                _apply_amendment(session, record)
             continue
-        sessions.append(json.loads(line))
+        session = Session(record)
+        sessions.append(session)
+        by_id[session.get("id", "")] = session
     return sessions
 
 
-def load_sessions() -> list[dict[str, Any]]:
-    """Read all sessions from all user files and legacy file."""
-    ensure_data_dir()
-    all_sessions: list[dict[str, Any]] = []
+def _apply_amendment(session: Session, amendment: dict[str, Any]) -> None:
+    """Append an amendment's array fields to a session in place."""
+    for field in ["learnings", "open_questions", "next_actions"]:
+        if amendment.get(field):
+            session[field] = session.get(field, []) + amendment[field]
+    if amendment.get("issues_worked"):
+        existing = list(session.get("issues_worked", []))
+        # Avoid duplicates for issue IDs
+        for issue_id in amendment["issues_worked"]:
+            if issue_id not in existing:
+                existing.append(issue_id)
+        session["issues_worked"] = existing
+
+
+def _session_files() -> list[Path]:
+    """Return all session files: per-user files first, then the legacy file."""
+    files = sorted(get_sessions_dir().glob("events-*.jsonl"))
+    legacy_file = get_legacy_events_file()
+    if legacy_file.exists():
+        files.append(legacy_file)
+    return files
+
+
+def _session_key(session: Session) -> tuple[str, str]:
+    """Sort key for sessions: by date and then by ID for consistent ordering."""
+    return (session.get("date", ""), session.get("id", ""))
 
-    sessions_dir = get_sessions_dir()
 
-    # Load from per-user files (events-*.jsonl)
-    for events_file in sessions_dir.glob("events-*.jsonl"):
-        all_sessions.extend(_load_sessions_from_file(events_file))
+def iter_sessions() -> Iterator[Session]:
+    """Stream sessions from all user files and legacy file in date order.
 
-    # Load from legacy shared file (events.jsonl)
-    all_sessions.extend(_load_sessions_from_file(get_legacy_events_file()))
+    Each user's file is already in date order, so the files are merged with
+    a heap instead of concatenated and sorted; only a file found to be out
+    of order is sorted.
+    """
+    ensure_data_dir()
+    streams = []
+    for events_file in _session_files():
+        sessions = _load_sessions_from_file(events_file)
+        if not is_sorted(sessions, _session_key):
+            sessions.sort(key=_session_key)
+        streams.append(sessions)
+    return heapq.merge(*streams, key=_session_key)
 
-    # Sort by date and then by ID for consistent ordering
-    all_sessions.sort(key=lambda s: (s.get("date", ""), s.get("id", "")))
 
-    return all_sessions
+@memoized(_session_files)
+def load_sessions() -> list[Session]:
+    """Read all sessions from all user files and legacy file."""
+    return list(iter_sessions())
 
 
-def load_user_sessions(prefix: str | None = None) -> list[dict[str, Any]]:
+def load_user_sessions(prefix: str | None = None) -> list[Session]:
     """Read sessions from a specific user's file only."""
     if prefix is None:
         prefix, _ = get_user_prefix()
@@ -162,16 +219,159 @@ def next_session_id(sessions: list[dict[str, Any]], prefix: str | None = None) -
     return f"{prefix}-s{max_num + 1:03d}"
 
 
+def get_id_index_file() -> Path:
+    """Get the per-prefix session ID high-water-mark index path."""
+    return get_cache_dir(get_sessions_dir()) / "session-ids.json"
+
+
+def allocate_session_id(prefix: str | None = None) -> str:
+    """Return the next session ID for a user without loading every session.
+
+    Only the user's own file (and the legacy file, after migration) can hold
+    their session IDs, and only bytes appended since the last call are read.
+
+    Args:
+        prefix: User prefix to use. If None, uses get_user_prefix().
+
+    Returns:
+        Next session ID in format "prefix-sNNN" (e.g., "dp-s001").
+    """
+    if prefix is None:
+        prefix, _ = get_user_prefix()
+
+    def number(record: dict[str, Any]) -> int | None:
+        if record.get("type") == "amended":
+            return None
+        parsed_prefix, num = parse_session_id(record.get("id", ""))
+        return num if parsed_prefix == prefix else None
+
+    ensure_cache_dir(get_sessions_dir())
+    files = [get_user_events_file(prefix), get_legacy_events_file()]
+    max_num = high_water_mark(files, get_id_index_file(), prefix, number)
+    return f"{prefix}-s{max_num + 1:03d}"
+
+
 def append_session(session: dict[str, Any]) -> None:
-    """Append a session to the current user's events file."""
-    events_file = ensure_user_events_file()
+    """Append a session to the current user's events file.
+
+    Sessions are an append-only log: the record is written with a single
+    O_APPEND write, so existing history is never rewritten.
+    """
+    append_records(ensure_user_events_file(), [session])
 
-    content = events_file.read_text()
-    if content and not content.endswith("\n"):
-        content += "\n"
 
-    line = json.dumps(session, separators=(",", ":"))
-    events_file.write_text(content + line + "\n")
+class SessionBatch:
+    """Session writes for the current user, appended together by commit().
+
+    Amendments see sessions created earlier in the same batch, so a batch can
+    create a session and then amend it.
+    """
+
+    def __init__(self) -> None:
+        self.records: list[dict[str, Any]] = []
+        self._sessions: list[Session] | None = None
+        self._next_number: int | None = None
+
+    @property
+    def sessions(self) -> list[Session]:
+        """The current user's sessions, including ones created in this batch."""
+        if self._sessions is None:
+            self._sessions = load_user_sessions()
+            for record in self.records:
+                if record.get("type") == "amended":
+                    session = next((s for s in self._sessions if s.get("id") == record["id"]), None)
+                    if session is not None:
+                        _apply_amendment(session, record)
+                else:
+                    self._sessions.append(Session(record))
+        return self._sessions
+
+    def _allocate_id(self, prefix: str) -> str:
+        if self._next_number is None:
+            _, self._next_number = parse_session_id(allocate_session_id(prefix))
+        new_id = f"{prefix}-s{self._next_number:03d}"
+        self._next_number += 1
+        return new_id
+
+    def create(
+        self,
+        topic: str,
+        learnings: list[str] | None = None,
+        open_questions: list[str] | None = None,
+        next_actions: list[str] | None = None,
+        issues_worked: list[str] | None = None,
+    ) -> dict[str, Any]:
+        """Create a new session entry and return it."""
+        ensure_data_dir()
+        prefix, _ = get_user_prefix()
+
+        session = {
+            "id": self._allocate_id(prefix),
+            "user": prefix,
+            "date": date.today().isoformat(),
+            "topic": topic,
+            "learnings": learnings or [],
+            "open_questions": open_questions or [],
+            "next_actions": next_actions or [],
+            "issues_worked": issues_worked or [],
+        }
+
+        self.records.append(session)
+        if self._sessions is not None:
+            self._sessions.append(Session(session))
+        return session
+
+    def amend(
+        self,
+        session_id: str | None = None,
+        learnings: list[str] | None = None,
+        open_questions: list[str] | None = None,
+        next_actions: list[str] | None = None,
+        issues_worked: list[str] | None = None,
+    ) -> Session | None:
+        """Amend a session by appending to its arrays (see amend_session())."""
+        sessions = self.sessions
+        if not sessions:
+            return None
+
+        # Find the session to amend
+        if session_id is None:
+            session = sessions[-1]
+        else:
+            session = next((s for s in sessions if s.get("id") == session_id), None)
+            if session is None:
+                return None
+
+        # Record the amendment as an event rather than rewriting the file
+        amendment: dict[str, Any] = {
+            "type": "amended",
+            "id": session["id"],
+            "ts": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+        }
+        if learnings:
+            amendment["learnings"] = learnings
+        if open_questions:
+            amendment["open_questions"] = open_questions
+        if next_actions:
+            amendment["next_actions"] = next_actions
+        if issues_worked:
+            existing = session.get("issues_worked", [])
+            new_issues = []
+            for issue_id in issues_worked:
+                if issue_id not in existing and issue_id not in new_issues:
+                    new_issues.append(issue_id)
+            if new_issues:
+                amendment["issues_worked"] = new_issues
+
+        self.records.append(amendment)
+        _apply_amendment(session, amendment)
+        return session
+
+    def commit(self) -> None:
+        """Append the batch's records to the current user's events file."""
+        if self.records:
+            append_records(ensure_user_events_file(), self.records)
+        self.records = []
 
 
 def create_session(
@@ -182,21 +382,9 @@ def create_session(
     issues_worked: list[str] | None = None,
 ) -> dict[str, Any]:
     """Create a new session entry and return it."""
-    sessions = load_sessions()
-    prefix, _ = get_user_prefix()
-
-    session = {
-        "id": next_session_id(sessions, prefix),
-        "user": prefix,
-        "date": date.today().isoformat(),
-        "topic": topic,
-        "learnings": learnings or [],
-        "open_questions": open_questions or [],
-        "next_actions": next_actions or [],
-        "issues_worked": issues_worked or [],
-    }
-
-    append_session(session)
+    batch = SessionBatch()
+    session = batch.create(topic, learnings, open_questions, next_actions, issues_worked)
+    batch.commit()
     return session
 
 
@@ -206,10 +394,13 @@ def amend_session(
     open_questions: list[str] | None = None,
     next_actions: list[str] | None = None,
     issues_worked: list[str] | None = None,
-) -> dict[str, Any] | None:
+) -> Session | None:
     """Amend an existing session by appending to its arrays.
 
     Only works on the current user's sessions (in their per-user file).
+    The change is recorded as an appended "amended" event that
+    load_sessions() folds into the session, so existing lines are never
+    rewritten.
 
     Args:
         session_id: Session ID to amend, or None for the most recent session.
@@ -221,53 +412,40 @@ def amend_session(
     Returns:
         The amended session, or None if no sessions exist or ID not found.
     """
-    # Load only current user's sessions
-    sessions = load_user_sessions()
-    if not sessions:
-        return None
+    batch = SessionBatch()
+    session = batch.amend(session_id, learnings, open_questions, next_actions, issues_worked)
+    batch.commit()
+    return session
 
-    # Find the session to amend
-    if session_id is None:
-        target_idx = len(sessions) - 1
-    else:
-        target_idx = None
-        for i, s in enumerate(sessions):
-            if s.get("id") == session_id:
-                target_idx = i
-                break
-        if target_idx is None:
-            return None
 
-    session = sessions[target_idx]
-
-    # Append to array fields
-    if learnings:
-        session["learnings"] = session.get("learnings", []) + learnings
-    if open_questions:
-        session["open_questions"] = session.get("open_questions", []) + open_questions
-    if next_actions:
-        session["next_actions"] = session.get("next_actions", []) + next_actions
-    if issues_worked:
-        existing = session.get("issues_worked", [])
-        # Avoid duplicates for issue IDs
-        for issue_id in issues_worked:
-            if issue_id not in existing:
-                existing.append(issue_id)
-        session["issues_worked"] = existing
+# --- Filter functions ---
 
-    # Rewrite the current user's file
-    _rewrite_user_sessions(sessions)
-    return session
+def session_user(session: dict[str, Any]) -> str | None:
+    """Return the user a session belongs to.
+
+    That is its user field, or for legacy sessions without one, the prefix
+    of its ID (None for old-format IDs).
+    """
+    if "user" in session:
+        return session.get("user")
+    parsed_prefix, _ = parse_session_id(session.get("id", ""))
+    return parsed_prefix
 
 
-def _rewrite_user_sessions(sessions: list[dict[str, Any]], prefix: str | None = None) -> None:
-    """Rewrite the current user's sessions file."""
-    events_file = ensure_user_events_file(prefix)
-    lines = [json.dumps(s, separators=(",", ":")) for s in sessions]
-    events_file.write_text("\n".join(lines) + "\n" if lines else "")
+def group_by_user(sessions: list[dict[str, Any]]) -> dict[str, list[dict[str, Any]]]:
+    """Group sessions by user (see session_user()), keeping their order.
 
+    Sessions with no user are left out. Each legacy session's ID is parsed
+    once, so callers that switch between users should group once and look
+    users up, rather than call filter_by_user() for each.
+    """
+    groups: dict[str, list[dict[str, Any]]] = {}
+    for s in sessions:
+        user = session_user(s)
+        if user:
+            groups.setdefault(user, []).append(s)
+    return groups
 
-# --- Filter functions ---
 
 def filter_by_user(sessions: list[dict[str, Any]], user: str | None = None) -> list[dict[str, Any]]:
     """Return sessions for a specific user.
@@ -282,17 +460,7 @@ def filter_by_user(sessions: list[dict[str, Any]], user: str | None = None) -> l
     if user is None:
         user, _ = get_user_prefix()
 
-    result = []
-    for s in sessions:
-        # Check explicit user field first
-        if s.get("user") == user:
-            result.append(s)
-        # Fall back to parsing ID for legacy sessions
-        elif "user" not in s:
-            parsed_prefix, _ = parse_session_id(s.get("id", ""))
-            if parsed_prefix == user:
-                result.append(s)
-    return result
+    return [s for s in sessions if session_user(s) == user]
 
 
 def filter_by_issue(sessions: list[dict[str, Any]], issue_id: str) -> list[dict[str, Any]]:
@@ -306,6 +474,45 @@ def filter_by_topic(sessions: list[dict[str, Any]], keyword: str) -> list[dict[s
     return [s for s in sessions if keyword in s.get("topic", "").lower()]
 
 
+# --- Queries ---
+#
+# Query functions answer from the optional SQLite read model (see
+# skill_issues.readmodel) when the project has opted in with `sessions index`,
+# and from the session logs otherwise.
+
+def get_read_model_file() -> Path:
+    """Get the SQLite read model path."""
+    return get_cache_dir(get_sessions_dir()) / "readmodel.sqlite"
+
+
+def _open_read_model() -> Any:
+    """Return the synced read model if this project opted in to one, else None."""
+    if not get_read_model_file().exists():
+        return None
+    from skill_issues import readmodel
+    return readmodel.open_sessions_model()
+
+
+def query_sessions(user: str | None = None, issue: str | None = None) -> list[Session]:
+    """Return sessions in date order, optionally filtered.
+
+    Args:
+        user: Only return this user's sessions. None means all users.
+        issue: Only return sessions that worked on this issue ID.
+    """
+    model = _open_read_model()
+    if model is not None:
+        with model:
+            return model.query(user, issue)
+
+    sessions = load_sessions()
+    if user is not None:
+        sessions = filter_by_user(sessions, user)
+    if issue is not None:
+        sessions = filter_by_issue(sessions, issue)
+    return sessions
+
+
 # --- Aggregation functions ---
 
 def aggregate_open_questions(sessions: list[dict[str, Any]]) -> list[str]:
@@ -1,50 +1,201 @@
 """Sessions TUI - Interactive session viewer using Textual."""
 
+from rich.text import Text
+from textual import events, work
 from textual.app import App, ComposeResult
 from textual.binding import Binding
 from textual.containers import Horizontal, ScrollableContainer, Vertical
-from textual.widgets import Footer, Header, Input, ListItem, ListView, Static
+from textual.geometry import Size
+from textual.message import Message
+from textual.scroll_view import ScrollView
+from textual.strip import Strip
+from textual.timer import Timer
+from textual.widgets import Footer, Header, Input, Static
 
 from skill_issues import get_user_prefix
 from . import store
 
 
+# Seconds of typing pause before the filter box's query is applied
+SEARCH_DELAY = 0.15
+
+# Session fields searched besides the topic
+SEARCH_FIELDS = ("learnings", "open_questions", "next_actions")
+
+
+def search_text(s: dict) -> str:
+    """The lowercase text a session is searched by."""
+    parts = [s.get("topic", "")]
+    for field in SEARCH_FIELDS:
+        parts.extend(s.get(field, []))
+    return "\n".join(parts).lower()
+
+
+class SessionSearch:
+    """Substring search over a list of sessions.
+
+    Each session's search text is built once. A query that extends the
+    previous one only rechecks the previous matches, and an unchanged result
+    comes back as the same list object, so callers can skip redrawing.
+    """
+
+    def __init__(self, sessions: list[dict]) -> None:
+        self.sessions = sessions
+        self.texts = [search_text(s) for s in sessions]
+        self._term = ""
+        self._matches: list[int] = list(range(len(sessions)))
+        self._result = sessions
+
+    def search(self, term: str) -> list[dict]:
+        """Return the sessions whose search text contains `term` (case-insensitive)."""
+        term = term.lower()
+        if term.startswith(self._term):
+            candidates = self._matches
+        else:
+            candidates = range(len(self.texts))
+        texts = self.texts
+        matches = [i for i in candidates if term in texts[i]]
+        if candidates is not self._matches or len(matches) != len(candidates):
+            self._result = [self.sessions[i] for i in matches]
+        self._term = term
+        self._matches = matches
+        return self._result
+
+
 class NonFocusableScrollableContainer(ScrollableContainer):
     """ScrollableContainer that cannot receive focus."""
 
     can_focus = False
 
 
-class SessionListItem(ListItem):
-    """A list item representing a session."""
+def format_session_row(s: dict) -> Text:
+    """Format a session as a list row: date | topic (counts)."""
+    stats = []
+    learnings = len(s.get("learnings", []))
+    questions = len(s.get("open_questions", []))
+    actions = len(s.get("next_actions", []))
+    if learnings:
+        stats.append(f"{learnings}L")
+    if questions:
+        stats.append(f"{questions}Q")
+    if actions:
+        stats.append(f"{actions}A")
+    stat_str = f" ({', '.join(stats)})" if stats else ""
 
-    def __init__(self, session: dict) -> None:
-        super().__init__()
-        self.session = session
+    date = s.get("date", "????-??-??")
+    topic = s.get("topic", "untitled")
+    # Truncate topic to fit in list panel (date=10 + space + topic + stats)
+    max_topic = 28
+    if len(topic) > max_topic:
+        topic = topic[:max_topic - 3] + "..."
 
-    def compose(self) -> ComposeResult:
-        s = self.session
-        # Format: date | topic (counts)
-        stats = []
-        learnings = len(s.get("learnings", []))
-        questions = len(s.get("open_questions", []))
-        actions = len(s.get("next_actions", []))
-        if learnings:
-            stats.append(f"{learnings}L")
-        if questions:
-            stats.append(f"{questions}Q")
-        if actions:
-            stats.append(f"{actions}A")
-        stat_str = f" ({', '.join(stats)})" if stats else ""
+    return Text.assemble(" ", (date, "dim"), f" {topic}{stat_str}")
 
-        date = s.get("date", "????-??-??")
-        topic = s.get("topic", "untitled")
-        # Truncate topic to fit in list panel (date=10 + space + topic + stats)
-        max_topic = 28
-        if len(topic) > max_topic:
-            topic = topic[:max_topic - 3] + "..."
 
-        yield Static(f"[dim]{date}[/] {topic}{stat_str}")
+class SessionList(ScrollView, can_focus=True):
+    """A list of sessions, one row each.
+
+    Rows are rendered from the session records as they scroll into view, so
+    the list costs the same however many sessions it holds.
+    """
+
+    COMPONENT_CLASSES = {"session-list--cursor"}
+
+    BINDINGS = [
+        Binding("up", "cursor_up", "Up", show=False),
+        Binding("down", "cursor_down", "Down", show=False),
+        Binding("pageup", "page_up", "Page Up", show=False),
+        Binding("pagedown", "page_down", "Page Down", show=False),
+    ]
+
+    class Highlighted(Message):
+        """Posted when the cursor moves to another session, or the list empties."""
+
+        def __init__(self, session: dict | None) -> None:
+            super().__init__()
+            self.session = session
+
+    def __init__(self, sessions: list[dict], **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.sessions = sessions
+        self.index: int | None = 0 if sessions else None
+
+    def on_mount(self) -> None:
+        self.virtual_size = Size(0, len(self.sessions))
+
+    @property
+    def highlighted_session(self) -> dict | None:
+        """The session under the cursor."""
+        return None if self.index is None else self.sessions[self.index]
+
+    def set_sessions(self, sessions: list[dict], index: int = 0) -> None:
+        """Show a new list of sessions, with the cursor on row `index`."""
+        self.sessions = sessions
+        self.index = None
+        self.virtual_size = Size(0, len(sessions))
+        self.scroll_to(y=0, animate=False, immediate=True)
+        self.refresh()
+        if sessions:
+            self.move_cursor(index)
+        else:
+            self.post_message(self.Highlighted(None))
+
+    def move_cursor(self, index: int) -> None:
+        """Move the cursor to a row, scrolling it into view."""
+        if not self.sessions:
+            return
+        index = max(0, min(index, len(self.sessions) - 1))
+        if index == self.index:
+            return
+        if self.index is not None:
+            self.refresh_line(self.index)
+        self.index = index
+        self.refresh_line(index)
+
+        height = self.scrollable_content_region.height
+        scroll_y = self.scroll_offset.y
+        if index < scroll_y:
+            scroll_y = index
+        elif height and index >= scroll_y + height:
+            scroll_y = index - height + 1
+        if scroll_y != self.scroll_offset.y:
+            # Positions beyond the laid-out height wait for the new virtual size
+            self.scroll_to(y=scroll_y, animate=False, immediate=scroll_y <= self.max_scroll_y)
+        self.post_message(self.Highlighted(self.highlighted_session))
+
+    def render_line(self, y: int) -> Strip:
+        index = self.scroll_offset.y + y
+        width = self.scrollable_content_region.width
+        if index >= len(self.sessions):
+            return Strip.blank(width, self.rich_style)
+        if index == self.index:
+            style = self.rich_style + self.get_component_rich_style("session-list--cursor")
+        else:
+            style = self.rich_style
+        console = self.app.console
+        text = format_session_row(self.sessions[index])
+        text.no_wrap = True
+        line = console.render_lines(text, console.options.update_width(width), style=style, pad=False)[0]
+        return Strip(line).crop_extend(0, width, style)
+
+    def on_click(self, event: events.Click) -> None:
+        self.move_cursor(self.scroll_offset.y + event.y)
+
+    def action_cursor_up(self) -> None:
+        if self.index is not None:
+            self.move_cursor(self.index - 1)
+
+    def action_cursor_down(self) -> None:
+        if self.index is not None:
+            self.move_cursor(self.index + 1)
+
+    def action_page_up(self) -> None:
+        if self.index is not None:
+            self.move_cursor(self.index - max(1, self.scrollable_content_region.height))
+
+    def action_page_down(self) -> None:
+        if self.index is not None:
+            self.move_cursor(self.index + max(1, self.scrollable_content_region.height))
 
 
 class SessionDetail(Static):
@@ -153,16 +304,11 @@ class SessionsApp(App):
         width: 100%;
     }
 
-    ListView {
+    SessionList {
         height: 100%;
     }
 
-    ListView > ListItem {
-        padding: 0 1;
-        height: 1;
-    }
-
-    ListView > ListItem.--highlight {
+    SessionList > .session-list--cursor {
         background: $accent;
     }
     """
@@ -183,11 +329,12 @@ class SessionsApp(App):
 
     def __init__(self, sessions: list[dict] | None = None) -> None:
         super().__init__()
-        # Load sessions if not provided (most recent first)
-        if sessions is None:
-            self.all_sessions = list(reversed(store.load_sessions()))
-        else:
-            self.all_sessions = list(reversed(sessions))
+        # Sessions are kept most recent first; unless given, they are loaded
+        # in the background once the app is up
+        self.all_sessions = [] if sessions is None else list(reversed(sessions))
+        self.loading_sessions = sessions is None
+        # Sessions by user, grouped once per load so tab switches are lookups
+        self.user_sessions = store.group_by_user(self.all_sessions)
 
         # Get current user and build user list
         self.current_user, _ = get_user_prefix()
@@ -198,24 +345,15 @@ class SessionsApp(App):
         self.sessions = self._filter_by_selected_user()
         self.filtered_sessions = self.sessions
         self.search_term = ""
+        # Search indexes by user tab (None for "All"), built on first use
+        self.search_indexes: dict[str | None, SessionSearch] = {}
+        self._search_timer: Timer | None = None
         self._ready_for_tab_changes = False  # Skip tab activations until ready
 
     def _get_user_list(self) -> list[str]:
         """Get list of users, ordered: current user first, others alphabetically."""
-        users_set: set[str] = set()
-        for s in self.all_sessions:
-            user = s.get("user")
-            if user:
-                users_set.add(user)
-            else:
-                # Parse from ID for legacy sessions
-                parsed_prefix, _ = store.parse_session_id(s.get("id", ""))
-                if parsed_prefix:
-                    users_set.add(parsed_prefix)
-
-        # Order: current user first, then others alphabetically
-        others = sorted(u for u in users_set if u != self.current_user)
-        if self.current_user in users_set:
+        others = sorted(u for u in self.user_sessions if u != self.current_user)
+        if self.current_user in self.user_sessions:
             return [self.current_user] + others
         return others
 
@@ -223,19 +361,16 @@ class SessionsApp(App):
         """Filter sessions by currently selected user tab."""
         if self.selected_user is None:  # "All" tab
             return self.all_sessions
-        return store.filter_by_user(self.all_sessions, self.selected_user)
+        return self.user_sessions.get(self.selected_user, [])
 
     def compose(self) -> ComposeResult:
         yield Header(show_clock=True)
         yield Static(self._render_user_bar(), id="user-bar")
         with Vertical(id="search-box"):
-            yield Input(placeholder="Filter by topic...", id="search-input")
+            yield Input(placeholder="Filter by topic, learnings, questions or actions...", id="search-input")
         with Horizontal(id="main-container"):
             with Vertical(id="session-list"):
-                yield ListView(
-                    *[SessionListItem(s) for s in self.filtered_sessions],
-                    id="list-view"
-                )
+                yield SessionList(self.filtered_sessions, id="list-view")
             with NonFocusableScrollableContainer(id="detail-container"):
                 yield SessionDetail(id="session-detail")
         yield Footer()
@@ -262,17 +397,41 @@ class SessionsApp(App):
 
     def on_mount(self) -> None:
         """Focus the list and show first session when app starts."""
-        list_view = self.query_one("#list-view", ListView)
+        list_view = self.query_one("#list-view", SessionList)
         list_view.focus()
-        # Select first item if available
-        if self.filtered_sessions:
-            list_view.index = 0
-            self._show_selected_session()
-        # Force refresh to ensure items are rendered
-        list_view.refresh()
+        if self.loading_sessions:
+            self.query_one("#session-list").loading = True
+            self._load_sessions()
+        self._show_selected_session()
         # Now ready for user-initiated tab changes
         self._ready_for_tab_changes = True
 
+    @work(thread=True)
+    def _load_sessions(self) -> None:
+        """Load sessions off the UI thread: the current user's first, then everyone's."""
+        # The current user's tab is the one shown first, and reading their
+        # file alone is quick
+        own = list(reversed(store.load_user_sessions(self.current_user))) if self.current_user else []
+        self.call_from_thread(self._set_all_sessions, own, store.group_by_user(own))
+        everyone = list(reversed(store.load_sessions()))
+        self.call_from_thread(self._set_all_sessions, everyone, store.group_by_user(everyone))
+
+    def _set_all_sessions(self, sessions: list[dict], user_sessions: dict[str, list[dict]]) -> None:
+        """Show newly loaded sessions, keeping the highlighted one where it is still listed.
+
+        Args:
+            sessions: All sessions, most recent first.
+            user_sessions: The same sessions grouped by user.
+        """
+        self.all_sessions = sessions
+        self.user_sessions = user_sessions
+        self.search_indexes = {}
+        self.users = self._get_user_list()
+        self._update_user_bar()
+        self.sessions = self._filter_by_selected_user()
+        self._apply_filter(keep_selection=True)
+        self.query_one("#session-list").loading = False
+
     def _switch_user(self, new_user: str | None) -> None:
         """Switch to a different user filter."""
         if new_user == self.selected_user:
@@ -286,99 +445,90 @@ class SessionsApp(App):
         self.search_term = ""
         search_input = self.query_one("#search-input", Input)
         search_input.value = ""
-        self._apply_filter()  # This handles deferred selection via call_after_refresh
+        self._apply_filter()
 
-    def on_list_view_selected(self, event: ListView.Selected) -> None:
-        """Handle session selection."""
-        self._show_selected_session()
-
-    def on_list_view_highlighted(self, event: ListView.Highlighted) -> None:
+    def on_session_list_highlighted(self, event: SessionList.Highlighted) -> None:
         """Handle highlight changes (cursor movement)."""
         self._show_selected_session()
 
     def on_input_changed(self, event: Input.Changed) -> None:
-        """Handle search input changes."""
-        if event.input.id == "search-input":
+        """Handle search input changes, filtering once typing pauses."""
+        if event.input.id == "search-input" and event.value != self.search_term:
             self.search_term = event.value
-            self._apply_filter()
+            if self._search_timer is not None:
+                self._search_timer.stop()
+            self._search_timer = self.set_timer(SEARCH_DELAY, self._apply_filter)
 
     def on_input_submitted(self, event: Input.Submitted) -> None:
         """Handle Enter in search input - focus back to list."""
         if event.input.id == "search-input":
+            if self._search_timer is not None:
+                self._apply_filter()
             search_box = self.query_one("#search-box")
             search_box.remove_class("visible")
-            list_view = self.query_one("#list-view", ListView)
+            list_view = self.query_one("#list-view", SessionList)
             list_view.focus()
 
-    def _select_first_item(self) -> None:
-        """Select the first item in the list after a refresh."""
-        list_view = self.query_one("#list-view", ListView)
-        list_view.focus()
-        if self.filtered_sessions and list_view.children:
-            # Reset index to force highlight update
-            list_view.index = None
-            list_view.index = 0
-            # Trigger cursor action to ensure highlight is visible
-            list_view.action_select_cursor()
-            self._show_selected_session()
-
     def _show_selected_session(self) -> None:
         """Update detail view with currently highlighted session."""
-        list_view = self.query_one("#list-view", ListView)
+        list_view = self.query_one("#list-view", SessionList)
         detail = self.query_one("#session-detail", SessionDetail)
 
-        if list_view.highlighted_child is not None:
-            item = list_view.highlighted_child
-            if isinstance(item, SessionListItem):
-                detail.show_session(item.session)
+        session = list_view.highlighted_session
+        if session is not None:
+            detail.show_session(session)
         else:
             detail.clear()
 
-    def _apply_filter(self) -> None:
-        """Apply the current search filter to the session list."""
-        if self.search_term:
-            term = self.search_term.lower()
-            self.filtered_sessions = [
-                s for s in self.sessions
-                if term in s.get("topic", "").lower()
-            ]
-        else:
-            self.filtered_sessions = self.sessions
+    def _apply_filter(self, keep_selection: bool = False) -> None:
+        """Apply the current search filter to the session list.
 
-        # Rebuild the list view using clear() which properly resets ListView state
-        list_view = self.query_one("#list-view", ListView)
-        list_view.clear()
-        for s in self.filtered_sessions:
-            list_view.append(SessionListItem(s))
+        The cursor goes to the first session, or with `keep_selection` stays
+        on the highlighted session if the filtered list still has it.
+        """
+        if self._search_timer is not None:
+            self._search_timer.stop()
+            self._search_timer = None
 
-        # Defer selection until list is fully rebuilt
-        if self.filtered_sessions:
-            self.call_after_refresh(self._select_first_item)
+        if self.search_term:
+            index = self.search_indexes.get(self.selected_user)
+            if index is None:
+                index = self.search_indexes[self.selected_user] = SessionSearch(self.sessions)
+            filtered = index.search(self.search_term)
         else:
-            detail = self.query_one("#session-detail", SessionDetail)
-            detail.clear()
+            filtered = self.sessions
+        if filtered is self.filtered_sessions and not keep_selection:
+            return
+        self.filtered_sessions = filtered
+
+        # Rows are rendered on demand, so there are no widgets to rebuild
+        list_view = self.query_one("#list-view", SessionList)
+        index = 0
+        highlighted = list_view.highlighted_session
+        if keep_selection and highlighted is not None:
+            session_id = highlighted.get("id")
+            index = next((i for i, s in enumerate(self.filtered_sessions) if s.get("id") == session_id), 0)
+        list_view.set_sessions(self.filtered_sessions, index)
 
     def action_cursor_down(self) -> None:
         """Move cursor down (vim j)."""
-        list_view = self.query_one("#list-view", ListView)
+        list_view = self.query_one("#list-view", SessionList)
         list_view.action_cursor_down()
 
     def action_cursor_up(self) -> None:
         """Move cursor up (vim k)."""
-        list_view = self.query_one("#list-view", ListView)
+        list_view = self.query_one("#list-view", SessionList)
         list_view.action_cursor_up()
 
     def action_go_top(self) -> None:
         """Go to first item (vim g)."""
-        list_view = self.query_one("#list-view", ListView)
-        if self.filtered_sessions:
-            list_view.index = 0
+        list_view = self.query_one("#list-view", SessionList)
+        list_view.move_cursor(0)
 
     def action_go_bottom(self) -> None:
         """Go to last item (vim G)."""
-        list_view = self.query_one("#list-view", ListView)
-        if self.filtered_sessions:
-            list_view.index = len(self.filtered_sessions) - 1
+        list_view = self.query_one("#list-view", SessionList)
+        list_view.move_cursor(len(self.filtered_sessions) - 1)
 
     def action_search(self) -> None:
         """Open search/filter input."""
@@ -397,7 +547,7 @@ class SessionsApp(App):
             search_input.value = ""
             self.search_term = ""
             self._apply_filter()
-            list_view = self.query_one("#list-view", ListView)
+            list_view = self.query_one("#list-view", SessionList)
             list_view.focus()
 
     def action_prev_tab(self) -> None:
@@ -0,0 +1,110 @@
+"""
+Change detection for the event files of a data directory.
+
+Long-running viewers such as the board poll DirectoryWatcher.changed() on a
+timer. On Linux it uses inotify, so a poll is a non-blocking read that costs
+nothing while the files are idle; elsewhere (or if inotify can't be set up)
+it compares the files' sizes and mtimes.
+"""
+
+import ctypes
+import ctypes.util
+import fnmatch
+import os
+import struct
+import sys
+from pathlib import Path
+
+# inotify event flags (see inotify(7))
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_NONBLOCK = os.O_NONBLOCK
+IN_CLOEXEC = 0o2000000
+
+_WATCH_MASK = IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF
+_EVENT_HEADER = struct.Struct("iIII")
+
+
+def _inotify_fd(directory: Path) -> int | None:
+    """Set up a non-blocking inotify watch on a directory, or return None."""
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if fd < 0:
+            return None
+        if libc.inotify_add_watch(fd, os.fsencode(directory), _WATCH_MASK) < 0:
+            os.close(fd)
+            return None
+        return fd
+    except (OSError, AttributeError):
+        return None
+
+
+class DirectoryWatcher:
+    """Report changes to the files in a directory that match a pattern."""
+
+    def __init__(self, directory: Path, pattern: str = "*.jsonl") -> None:
+        self.directory = directory
+        self.pattern = pattern
+        self._fd = _inotify_fd(directory)
+        self._stamp = self._files_stamp() if self._fd is None else None
+
+    @property
+    def uses_inotify(self) -> bool:
+        """Whether changes are detected with inotify rather than polling."""
+        return self._fd is not None
+
+    def _files_stamp(self) -> frozenset[tuple[str, int, int]]:
+        stamp = set()
+        for path in self.directory.glob(self.pattern):
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            stamp.add((path.name, st.st_size, st.st_mtime_ns))
+        return frozenset(stamp)
+
+    def _drain_inotify(self) -> bool:
+        assert self._fd is not None
+        changed = False
+        while True:
+            try:
+                data = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                return changed
+            if not data:
+                return changed
+            pos = 0
+            while pos < len(data):
+                _, mask, _, name_len = _EVENT_HEADER.unpack_from(data, pos)
+                name = data[pos + _EVENT_HEADER.size:pos + _EVENT_HEADER.size + name_len].rstrip(b"\0")
+                pos += _EVENT_HEADER.size + name_len
+                if mask & (IN_Q_OVERFLOW | IN_DELETE_SELF | IN_MOVE_SELF):
+                    changed = True
+                elif fnmatch.fnmatch(os.fsdecode(name), self.pattern):
+                    changed = True
+
+    def changed(self) -> bool:
+        """Check whether a matching file changed since the last call. Never blocks."""
+        if self._fd is not None:
+            return self._drain_inotify()
+        stamp = self._files_stamp()
+        if stamp == self._stamp:
+            return False
+        self._stamp = stamp
+        return True
+
+    def close(self) -> None:
+        """Stop watching."""
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
@@ -0,0 +1,16 @@
+"""Shared fixtures."""
+
+import pytest
+
+from skill_issues import set_project_root
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    """Point the issues and sessions stores at an empty project directory."""
+    monkeypatch.setenv("SKILL_ISSUES_PREFIX", "dp")
+    set_project_root(tmp_path)
+    (tmp_path / ".issues").mkdir()
+    (tmp_path / ".sessions").mkdir()
+    yield tmp_path
+    set_project_root(None)
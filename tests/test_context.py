@@ -0,0 +1,59 @@
+"""Tests for the agent startup context document."""
+
+import json
+import sys
+
+import pytest
+
+from skill_issues.context import build_context
+from skill_issues.issues import cli
+from skill_issues.issues import store as issues_store
+from skill_issues.sessions import store as sessions_store
+
+
+@pytest.fixture
+def project(project):
+    """A project with a few issues and sessions."""
+    issues_store.create_issue("low", priority=3)
+    issues_store.create_issue("high", priority=1)
+    issues_store.create_issue("blocked", depends_on=["dp-002"])
+    sessions_store.create_session("one", open_questions=["q1", "q2"], next_actions=["a1"])
+    sessions_store.create_session("two", open_questions=["q2", "q3"], next_actions=["a1", "a2"])
+    (project / ".sessions" / "events-jb.jsonl").write_text(
+        '{"id":"jb-s001","user":"jb","date":"2025-01-01","open_questions":["theirs"]}\n'
+    )
+    return project
+
+
+class TestBuildContext:
+    """Tests for build_context()."""
+
+    def test_combines_ready_issues_and_own_sessions(self, project):
+        context = build_context()
+        assert context["user"] == "dp"
+        assert [i["id"] for i in context["ready"]] == ["dp-002", "dp-001"]
+        assert [s["id"] for s in context["sessions"]] == ["dp-s001", "dp-s002"]
+        assert context["open_questions"] == ["q1", "q2", "q3"]
+        assert [a["action"] for a in context["next_actions"]] == ["a1", "a2"]
+        assert context["next_actions"][0]["session"] == "dp-s002"
+        assert context["omitted"] == {}
+
+    def test_limits_each_section(self, project):
+        context = build_context(sessions=1, limit=1)
+        assert [i["id"] for i in context["ready"]] == ["dp-002"]
+        assert [s["id"] for s in context["sessions"]] == ["dp-s002"]
+        assert context["open_questions"] == ["q3"]
+        assert context["omitted"] == {"ready": 1, "sessions": 1, "open_questions": 2, "next_actions": 1}
+
+    def test_all_users(self, project):
+        context = build_context(user=None)
+        assert "theirs" in context["open_questions"]
+
+    def test_cli_limit_is_separate_from_output_limit(self, project, monkeypatch, capsys):
+        for argv in (["context", "--limit", "1"], ["--limit", "5", "context", "--limit", "1"]):
+            monkeypatch.setattr(sys, "argv", ["issues", *argv])
+            assert cli.main() == 0
+            assert len(json.loads(capsys.readouterr().out)["ready"]) == 1
+        monkeypatch.setattr(sys, "argv", ["issues", "--limit", "1", "context"])
+        assert cli.main() == 0
+        assert len(json.loads(capsys.readouterr().out)["ready"]) == 2
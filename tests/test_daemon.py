@@ -0,0 +1,104 @@
+"""Tests for the opt-in daemon and memoized projections."""
+
+import json
+import os
+import threading
+
+import pytest
+
+from skill_issues import daemon, eventlog
+from skill_issues.daemon.server import DaemonServer, run_command
+from skill_issues.issues import store
+
+pytestmark = pytest.mark.skipif(not daemon.is_supported(), reason="needs Unix domain sockets")
+
+
+@pytest.fixture
+def project(project):
+    """A project with one issue."""
+    store.create_issue("First")
+    return project
+
+
+@pytest.fixture
+def memo(monkeypatch):
+    """Turn on projection memoization for one test."""
+    monkeypatch.setattr(eventlog, "_memo", None)
+    eventlog.enable_memo()
+
+
+class TestRunCommand:
+    """Tests for run_command()."""
+
+    def test_captures_output_and_exit_code(self, project, capsys):
+        result = run_command(project, "issues", ["dp-001"], "dp")
+        assert result["code"] == 0
+        assert json.loads(result["stdout"])["title"] == "First"
+        assert capsys.readouterr().out == ""
+
+    def test_reports_errors_on_stderr(self, project):
+        result = run_command(project, "issues", ["dp-999"], "dp")
+        assert result["code"] == 1
+        assert "dp-999" in result["stderr"]
+
+    def test_restores_prefix(self, project):
+        run_command(project, "issues", ["--create", "Second"], "xy")
+        assert os.environ["SKILL_ISSUES_PREFIX"] == "dp"
+        assert (project / ".issues" / "events-xy.jsonl").exists()
+
+
+class TestForward:
+    """Tests for forward() and the socket server."""
+
+    def test_runs_directly_without_daemon(self, project):
+        assert daemon.forward("issues", ["--root", str(project)]) is None
+
+    def test_board_always_runs_locally(self, project):
+        assert daemon.forward("issues", ["board"]) is None
+
+    def test_relative_root_resolved_against_client_cwd(self, project, monkeypatch, capsys):
+        for sub in ["sub", "daemon-cwd/sub"]:
+            (project / sub).mkdir(parents=True)
+        monkeypatch.chdir(project / "sub")
+
+        def request(root, message):
+            # Run it as the daemon would, from a different cwd
+            monkeypatch.setattr(daemon, "_serving", True)
+            monkeypatch.chdir(project / "daemon-cwd" / "sub")
+            return run_command(root, message["prog"], message["argv"], message["prefix"])
+
+        monkeypatch.setattr(daemon, "_request", request)
+        assert daemon.forward("issues", ["--root", "..", "--all"]) == 0
+        assert [issue["id"] for issue in json.loads(capsys.readouterr().out)] == ["dp-001"]
+        assert not (project / "daemon-cwd" / ".issues").exists()
+
+    def test_server_answers_requests(self, project, monkeypatch):
+        # The handler runs in this process, so its commands must not forward
+        monkeypatch.setattr(daemon, "_serving", True)
+        server = DaemonServer(project)
+        thread = threading.Thread(target=server.serve_forever)
+        thread.start()
+        try:
+            assert daemon.status(project)["pid"] == os.getpid()
+            response = daemon._request(project, {"op": "run", "prog": "issues", "argv": ["dp-001"], "prefix": "dp"})
+            assert json.loads(response["stdout"])["id"] == "dp-001"
+            assert daemon.stop(project)
+        finally:
+            thread.join(timeout=5)
+            server.server_close()
+        assert not server.socket_path.exists()
+
+
+class TestMemoized:
+    """Tests for memoized loaders."""
+
+    def test_off_by_default(self, project):
+        assert store.load_headers() is not store.load_headers()
+
+    def test_reuses_result_until_files_change(self, project, memo):
+        first = store.load_headers()
+        assert store.load_headers() is first
+        store.create_issue("Second")
+        second = store.load_headers()
+        assert second is not first
+        assert len(second) == 2
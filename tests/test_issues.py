@@ -1,15 +1,33 @@
 """Tests for issues store with multi-user support."""
 
+import io
+import json
+import os
+import random
 from unittest.mock import patch
 
 import pytest
 
+from skill_issues.eventlog import read_records
+from skill_issues.issues import store
 from skill_issues.issues.store import (
     next_id,
     parse_issue_id,
 )
 
 
+def write_events(path, events, mode="a"):
+    """Write events to a JSONL file."""
+    with open(path, mode) as f:
+        for event in events:
+            f.write(json.dumps(event) + "\n")
+
+
+def created(issue_id, ts, **fields):
+    """Build a created event."""
+    return {"ts": ts, "type": "created", "id": issue_id, "title": f"Issue {issue_id}", **fields}
+
+
 class TestParseIssueId:
     """Tests for parse_issue_id()."""
 
@@ -105,3 +123,489 @@ class TestNextId:
         }
         with patch("skill_issues.issues.store.get_user_prefix", return_value=("dp", True)):
             assert next_id(issues) == "dp-001"
+
+
+class TestProjectionSnapshot:
+    """Tests for the cached projection snapshot used by load_issues()."""
+
+    def test_snapshot_written_on_first_load(self, project):
+        write_events(project / ".issues" / "events-dp.jsonl", [created("dp-001", "2025-01-01T00:00:00Z")])
+        issues = store.load_issues()
+        assert list(issues) == ["dp-001"]
+        assert store.get_snapshot_file().exists()
+        assert (project / ".issues" / ".cache" / ".gitignore").read_text() == "*\n"
+
+    def test_appended_events_replayed_from_snapshot(self, project):
+        events_file = project / ".issues" / "events-dp.jsonl"
+        write_events(events_file, [created("dp-001", "2025-01-01T00:00:00Z")])
+        store.load_issues()
+        write_events(events_file, [{"ts": "2025-01-02T00:00:00Z", "type": "closed", "id": "dp-001", "reason": "done"}])
+        with patch.object(store, "_apply_event", wraps=store._apply_event) as apply:
+            issues = store.load_issues()
+        assert apply.call_count == 1
+        assert issues["dp-001"]["status"] == "closed"
+
+    def test_new_user_file_picked_up(self, project):
+        write_events(project / ".issues" / "events-dp.jsonl", [created("dp-001", "2025-01-01T00:00:00Z")])
+        store.load_issues()
+        write_events(project / ".issues" / "events-jb.jsonl", [created("jb-001", "2025-01-02T00:00:00Z")])
+        assert set(store.load_issues()) == {"dp-001", "jb-001"}
+
+    def test_rewritten_file_triggers_rebuild(self, project):
+        events_file = project / ".issues" / "events-dp.jsonl"
+        write_events(events_file, [created("dp-001", "2025-01-01T00:00:00Z")])
+        store.load_issues()
+        # Same size, different content (e.g. after a rebase)
+        write_events(events_file, [created("dp-002", "2025-01-01T00:00:00Z")], mode="w")
+        assert list(store.load_issues()) == ["dp-002"]
+
+    def test_shrunk_file_triggers_rebuild(self, project):
+        events_file = project / ".issues" / "events-dp.jsonl"
+        write_events(events_file, [
+            created("dp-001", "2025-01-01T00:00:00Z"),
+            created("dp-002", "2025-01-02T00:00:00Z"),
+        ])
+        store.load_issues()
+        write_events(events_file, [created("dp-001", "2025-01-01T00:00:00Z")], mode="w")
+        assert list(store.load_issues()) == ["dp-001"]
+
+    def test_older_events_trigger_full_replay(self, project):
+        write_events(project / ".issues" / "events-dp.jsonl", [
+            created("dp-001", "2025-01-01T00:00:00Z"),
+            {"ts": "2025-01-03T00:00:00Z", "type": "updated", "id": "dp-001", "priority": 0},
+        ])
+        store.load_issues()
+        # Another user's earlier update arrives via git pull
+        write_events(project / ".issues" / "events-jb.jsonl", [
+            {"ts": "2025-01-02T00:00:00Z", "type": "updated", "id": "dp-001", "priority": 4},
+        ])
+        assert store.load_issues()["dp-001"]["priority"] == 0
+
+    def test_same_time_events_in_earlier_file_trigger_full_replay(self, project):
+        write_events(project / ".issues" / "events-dp.jsonl", [
+            created("dp-001", "2025-01-01T00:00:00Z"),
+            {"ts": "2025-01-03T00:00:00Z", "type": "updated", "id": "dp-001", "priority": 0},
+        ])
+        store.load_issues()
+        # A full replay puts events-ab.jsonl's update first on the tie
+        write_events(project / ".issues" / "events-ab.jsonl", [
+            {"ts": "2025-01-03T00:00:00Z", "type": "updated", "id": "dp-001", "priority": 4},
+        ])
+        assert store.load_issues()["dp-001"]["priority"] == 0
+
+    def test_same_time_events_in_later_file_replayed_from_snapshot(self, project):
+        write_events(project / ".issues" / "events-dp.jsonl", [created("dp-001", "2025-01-01T00:00:00Z")])
+        store.load_issues()
+        write_events(project / ".issues" / "events-jb.jsonl", [
+            {"ts": "2025-01-01T00:00:00Z", "type": "updated", "id": "dp-001", "priority": 4},
+        ])
+        with patch.object(store, "_apply_event", wraps=store._apply_event) as apply:
+            issues = store.load_issues()
+        assert apply.call_count == 1
+        assert issues["dp-001"]["priority"] == 4
+
+
+class TestAppendEvents:
+    """Tests for append_event() and append_events()."""
+
+    def test_adds_missing_trailing_newline(self, project):
+        events_file = project / ".issues" / "events-dp.jsonl"
+        events_file.write_text(json.dumps(created("dp-001", "2025-01-01T00:00:00Z")))
+        store.append_event(created("dp-002", "2025-01-02T00:00:00Z"))
+        lines = events_file.read_text().splitlines()
+        assert [json.loads(line)["id"] for line in lines] == ["dp-001", "dp-002"]
+
+    def test_batch_written_in_one_call(self, project):
+        events = [created(f"dp-{n:03d}", "2025-01-01T00:00:00Z") for n in range(1, 4)]
+        with patch("skill_issues.eventlog.os.write", wraps=os.write) as write:
+            store.append_events(events)
+        assert write.call_count == 1
+        assert set(store.load_issues()) == {"dp-001", "dp-002", "dp-003"}
+
+    def test_empty_batch_is_noop(self, project):
+        store.append_events([])
+        assert not (project / ".issues" / "events-dp.jsonl").exists()
+
+
+class TestEventMerge:
+    """Tests for merging per-user event files by timestamp."""
+
+    def test_interleaved_files_replayed_in_timestamp_order(self, project):
+        write_events(project / ".issues" / "events-dp.jsonl", [
+            created("dp-001", "2025-01-01T00:00:00Z"),
+            {"ts": "2025-01-03T00:00:00Z", "type": "updated", "id": "dp-001", "priority": 0},
+        ])
+        write_events(project / ".issues" / "events-jb.jsonl", [
+            {"ts": "2025-01-02T00:00:00Z", "type": "updated", "id": "dp-001", "priority": 4},
+        ])
+        issue = store.load_issues()["dp-001"]
+        assert issue["priority"] == 0
+        assert [u["priority"]["to"] for u in issue["updates"]] == [4, 0]
+
+    def test_out_of_order_file_is_sorted(self, project):
+        write_events(project / ".issues" / "events-dp.jsonl", [
+            {"ts": "2025-01-02T00:00:00Z", "type": "note", "id": "dp-001", "content": "late"},
+            created("dp-001", "2025-01-01T00:00:00Z"),
+        ])
+        write_events(project / ".issues" / "events-jb.jsonl", [created("jb-001", "2025-01-01T12:00:00Z")])
+        issues = store.load_issues()
+        assert [n["content"] for n in issues["dp-001"]["notes"]] == ["late"]
+        assert set(issues) == {"dp-001", "jb-001"}
+
+
+class TestAllocateId:
+    """Tests for allocate_id() and create_issue() ID allocation."""
+
+    def test_first_id(self, project):
+        assert store.allocate_id() == "dp-001"
+
+    def test_scans_only_own_and_legacy_files(self, project):
+        issues_dir = project / ".issues"
+        write_events(issues_dir / "events-dp.jsonl", [created("dp-002", "2025-01-01T00:00:00Z")])
+        write_events(issues_dir / "events.jsonl", [created("dp-007", "2024-01-01T00:00:00Z")])
+        write_events(issues_dir / "events-jb.jsonl", [created("jb-050", "2025-01-01T00:00:00Z")])
+        assert store.allocate_id() == "dp-008"
+        assert store.allocate_id("jb") == "jb-051"
+
+    def test_create_issue_does_not_load_projection(self, project):
+        with patch.object(store, "load_issues") as load:
+            assert store.create_issue("one") == "dp-001"
+            assert store.create_issue("two") == "dp-002"
+        load.assert_not_called()
+
+    def test_unchanged_file_not_reread(self, project):
+        store.create_issue("one")
+        store.create_issue("two")
+        assert store.allocate_id() == "dp-003"
+        with patch("skill_issues.eventlog.read_records", wraps=read_records) as read:
+            assert store.allocate_id() == "dp-003"
+        read.assert_not_called()
+
+    def test_rewritten_file_rescanned(self, project):
+        store.create_issue("one")
+        store.create_issue("two")
+        assert store.allocate_id() == "dp-003"
+        write_events(project / ".issues" / "events-dp.jsonl", [created("dp-001", "2025-01-01T00:00:00Z")], mode="w")
+        assert store.allocate_id() == "dp-002"
+
+
+class TestDependencyIndex:
+    """Tests for DependencyIndex maintenance and ready lookups."""
+
+    def replay(self, events):
+        issues = {}
+        index = store.DependencyIndex()
+        for event in events:
+            store._apply_event(issues, event, index)
+        return issues, index
+
+    def test_incremental_matches_full_build(self):
+        issues, index = self.replay([
+            created("dp-002", "t1", depends_on=["dp-001", "dp-003"]),  # deps created later
+            created("dp-001", "t2"),
+            created("dp-003", "t3"),
+            created("dp-004", "t4", depends_on=["dp-002"]),
+            {"ts": "t5", "type": "closed", "id": "dp-001", "reason": "done"},
+            {"ts": "t6", "type": "updated", "id": "dp-002", "depends_on": ["dp-001"]},
+            {"ts": "t7", "type": "closed", "id": "dp-002", "reason": "done"},
+            {"ts": "t8", "type": "closed", "id": "dp-002", "reason": "again"},
+        ])
+        rebuilt = store.DependencyIndex.build(issues)
+        assert index.to_dict() == rebuilt.to_dict()
+        assert index.ready == {"dp-003", "dp-004"}
+
+    def test_recreated_issue_drops_old_dependencies(self):
+        issues, index = self.replay([
+            created("dp-002", "t1"),
+            created("dp-003", "t2"),
+            created("dp-001", "t3", depends_on=["dp-002"]),
+            # Another writer allocated the same ID
+            created("dp-001", "t4", depends_on=["dp-003"]),
+            {"ts": "t5", "type": "closed", "id": "dp-002", "reason": "done"},
+        ])
+        assert index.to_dict() == store.DependencyIndex.build(issues).to_dict()
+        assert index.is_blocked("dp-001")
+
+    def test_random_streams_match_full_build(self):
+        rng = random.Random(0)
+        ids = [f"dp-{n:03d}" for n in range(1, 6)]
+        for _ in range(500):
+            events = []
+            for n in range(20):
+                issue_id, ts = rng.choice(ids), f"t{n:02d}"
+                kind = rng.choice(["created", "updated", "closed"])
+                if kind == "created":
+                    events.append(created(issue_id, ts, depends_on=rng.sample(ids, 2)))
+                elif kind == "updated":
+                    events.append({"ts": ts, "type": "updated", "id": issue_id, "depends_on": rng.sample(ids, 2)})
+                else:
+                    events.append({"ts": ts, "type": "closed", "id": issue_id, "reason": "x"})
+            issues, index = self.replay(events)
+            assert index.to_dict() == store.DependencyIndex.build(issues).to_dict(), events
+
+    def test_closing_dependency_unblocks_dependents(self):
+        issues, index = self.replay([
+            created("dp-001", "t1"),
+            created("dp-002", "t2", depends_on=["dp-001"]),
+            created("dp-003", "t3", depends_on=["dp-001", "dp-002"]),
+        ])
+        assert index.ready == {"dp-001"}
+        store._apply_event(issues, {"ts": "t4", "type": "closed", "id": "dp-001", "reason": "x"}, index)
+        assert index.ready == {"dp-002"}
+        assert index.is_blocked("dp-003")
+
+    def test_filter_ready_uses_index(self):
+        issues, index = self.replay([
+            created("dp-001", "t1"),
+            created("dp-002", "t2", depends_on=["dp-001"]),
+            created("dp-003", "t3", depends_on=["dp-999"]),  # unknown deps are satisfied
+        ])
+        assert set(store.filter_ready(issues, issues)) == {"dp-001", "dp-003"}
+        assert set(store.filter_ready(issues, issues, index)) == {"dp-001", "dp-003"}
+
+    def test_index_persisted_in_snapshot(self, project):
+        store.create_issue("one")
+        store.create_issue("two", depends_on=["dp-001"])
+        assert set(store.query_issues("ready")) == {"dp-001"}
+        store.close_issue("dp-001", "done")
+        _, index = store.load_projection()
+        assert index.ready == {"dp-002"}
+        assert set(store.query_issues("ready")) == {"dp-002"}
+
+
+class TestHeaders:
+    """Tests for the header-only projection and lazy detail loading."""
+
+    def test_headers_omit_bodies(self, project):
+        store.create_issue("one", description="long text")
+        store.add_note("dp-001", "a note")
+        headers, _ = store.load_headers()
+        header = headers["dp-001"]
+        assert header["title"] == "one"
+        assert "description" not in header
+        assert "notes" not in header
+        assert len(header.events) == 2
+
+    def test_detail_matches_full_projection(self, project):
+        write_events(project / ".issues" / "events-jb.jsonl", [
+            created("jb-001", "2025-01-02T00:00:00Z", description="d"),
+        ])
+        store.create_issue("one", description="long text", labels=["x"])
+        store.add_note("dp-001", "a note")
+        store.add_dependency("dp-001", ["jb-001"])
+        store.close_issue("dp-001", "done")
+        headers, index = store.load_headers()
+        full, full_index = store.load_projection()
+        for issue_id, header in headers.items():
+            assert store.load_issue_detail(header) == full[issue_id]
+        assert index.to_dict() == full_index.to_dict()
+
+    def test_detail_reads_each_users_file_without_replay(self, project):
+        write_events(project / ".issues" / "events-aa.jsonl", [created("aa-001", "2025-01-01T00:00:00Z")])
+        write_events(project / ".issues" / "events-bb.jsonl", [
+            created("bb-001", "2025-01-02T00:00:00Z", description="d"),
+        ])
+        headers, _ = store.load_headers()
+        assert headers["aa-001"].events[0][0] == "events-aa.jsonl"
+        assert headers["bb-001"].events[0][0] == "events-bb.jsonl"
+        with patch.object(store, "load_issues") as load_issues:
+            assert store.load_issue_detail(headers["aa-001"])["title"] == "Issue aa-001"
+            assert store.load_issue_detail(headers["bb-001"])["description"] == "d"
+        load_issues.assert_not_called()
+
+    def test_appended_events_extend_cached_headers(self, project):
+        store.create_issue("one")
+        store.load_headers()
+        store.add_note("dp-001", "later")
+        headers, _ = store.load_headers()
+        detail = store.load_issue_detail(headers["dp-001"])
+        assert [n["content"] for n in detail["notes"]] == ["later"]
+
+    def test_stale_offsets_fall_back_to_replay(self, project):
+        store.create_issue("one")
+        store.create_issue("two")
+        headers, _ = store.load_headers()
+        events_file = project / ".issues" / "events-dp.jsonl"
+        lines = events_file.read_text().splitlines()
+        events_file.write_text(lines[1] + "\n" + lines[0] + "\n")
+        assert store.load_issue_detail(headers["dp-001"])["title"] == "one"
+
+    def test_query_with_headers_matches_full_issues(self, project):
+        store.create_issue("one", labels=["x"], description="long text")
+        store.create_issue("two", depends_on=["dp-001"])
+        for view in ("all", "open", "ready"):
+            full = store.query_issues(view, label="x" if view == "all" else None)
+            headers = store.query_issues(view, label="x" if view == "all" else None, headers=True)
+            assert {k: v["title"] for k, v in headers.items()} == {k: v["title"] for k, v in full.items()}
+            assert all("description" not in v for v in headers.values())
+
+
+class TestLiveHeaders:
+    """Tests for LiveHeaders.refresh()."""
+
+    def test_applies_only_new_events(self, project):
+        store.create_issue("one")
+        store.create_issue("two", depends_on=["dp-001"])
+        live = store.LiveHeaders()
+        assert live.refresh() == set()
+
+        store.close_issue("dp-001", "done")
+        with patch.object(store, "_load_cached", side_effect=AssertionError):
+            assert live.refresh() == {"dp-001", "dp-002"}
+        assert live.headers["dp-001"]["status"] == "closed"
+        assert not live.index.is_blocked("dp-002")
+        headers, _ = store.load_headers()
+        assert {k: v.to_dict() for k, v in live.headers.items()} == {k: v.to_dict() for k, v in headers.items()}
+
+    def test_older_events_reload(self, project):
+        store.create_issue("one")
+        live = store.LiveHeaders()
+        write_events(project / ".issues" / "events-jb.jsonl", [created("jb-001", "2000-01-01T00:00:00Z")])
+        assert live.refresh() is None
+        assert "jb-001" in live.headers
+
+    def test_same_time_events_in_earlier_file_reload(self, project):
+        write_events(project / ".issues" / "events-dp.jsonl", [
+            created("dp-001", "2025-01-01T00:00:00Z"),
+            {"ts": "2025-01-03T00:00:00Z", "type": "updated", "id": "dp-001", "priority": 0},
+        ])
+        live = store.LiveHeaders()
+        write_events(project / ".issues" / "events-ab.jsonl", [
+            {"ts": "2025-01-03T00:00:00Z", "type": "updated", "id": "dp-001", "priority": 4},
+        ])
+        assert live.refresh() is None
+        assert live.headers["dp-001"].priority == 0
+
+
+class TestOffsetIndex:
+    """Tests for the event offset index behind single-issue lookups."""
+
+    def test_lookup_matches_full_projection(self, project):
+        write_events(project / ".issues" / "events-jb.jsonl", [
+            created("jb-001", "2025-01-02T00:00:00Z"),
+            {"ts": "2099-01-01T00:00:00Z", "type": "note", "id": "dp-001", "content": "from jb"},
+        ])
+        store.create_issue("one", description="text")
+        store.add_note("dp-001", "mine")
+        store.close_issue("dp-001", "done")
+        full = store.load_issues()
+        assert store.get_issues(["dp-001", "jb-001", "dp-999"]) == full
+        assert [n["content"] for n in full["dp-001"]["notes"]] == ["mine", "from jb"]
+
+    def test_lookup_does_not_replay(self, project):
+        store.create_issue("one", description="text")
+        with patch.object(store, "_replay_events", side_effect=AssertionError):
+            assert store.get_issue("dp-001")["description"] == "text"
+
+    def test_append_leaves_index_to_lookup(self, project):
+        store.create_issue("one")
+        store.get_issue("dp-001")
+        saved = store.get_offset_index_file().read_text()
+        store.add_note("dp-001", "hi")
+        assert store.get_offset_index_file().read_text() == saved
+        assert store.get_issue("dp-001")["notes"][0]["content"] == "hi"
+        index = json.loads(store.get_offset_index_file().read_text())
+        assert len(index["files"]["events-dp.jsonl"]["ids"]["dp-001"]) == 2
+
+    def test_catches_up_on_external_append(self, project):
+        store.create_issue("one")
+        store.get_issue("dp-001")
+        write_events(project / ".issues" / "events-dp.jsonl", [
+            {"ts": "2099-01-01T00:00:00Z", "type": "closed", "id": "dp-001", "reason": "x"},
+        ])
+        assert store.get_issue("dp-001")["status"] == "closed"
+
+    def test_rewritten_file_reindexed(self, project):
+        store.create_issue("one")
+        store.create_issue("two")
+        store.get_issue("dp-001")
+        events_file = project / ".issues" / "events-dp.jsonl"
+        lines = events_file.read_text().splitlines()
+        events_file.write_text(lines[1] + "\n")
+        assert store.get_issue("dp-001") is None
+        assert store.get_issue("dp-002")["title"] == "two"
+
+
+class TestBatch:
+    """Tests for IssueBatch and `issues batch`."""
+
+    def run(self, lines):
+        from skill_issues.batch import run_batch
+        from skill_issues.issues.cli import batch_handlers
+
+        batch = store.IssueBatch()
+        out = io.StringIO()
+        code = run_batch([json.dumps(line) for line in lines], batch_handlers(batch), batch.commit, out)
+        return code, [json.loads(line) for line in out.getvalue().splitlines()]
+
+    def test_commands_see_earlier_commands(self, project):
+        code, results = self.run([
+            {"op": "create", "title": "A"},
+            {"op": "create", "title": "B", "depends_on": "dp-001"},
+            {"op": "close", "id": "dp-001", "reason": "done"},
+            {"op": "remove-dep", "id": "dp-002", "dep_ids": ["dp-001"]},
+        ])
+        assert code == 0
+        assert results == [
+            {"created": "dp-001"},
+            {"created": "dp-002"},
+            {"closed": "dp-001"},
+            {"issue": "dp-002", "removed_deps": ["dp-001"]},
+        ]
+        issues = store.load_issues()
+        assert issues["dp-001"]["status"] == "closed"
+        assert issues["dp-002"]["depends_on"] == []
+
+    def test_single_append(self, project):
+        store.create_issue("existing")
+        with patch.object(store, "append_records", wraps=store.append_records) as append:
+            self.run([{"op": "note", "id": "dp-001", "content": str(i)} for i in range(5)])
+        assert append.call_count == 1
+        assert len(store.get_issue("dp-001")["notes"]) == 5
+
+    def test_failed_command_writes_nothing(self, project):
+        code, results = self.run([
+            {"op": "close", "id": "dp-404", "reason": "x"},
+            {"op": "create", "title": "A", "priority": 9},
+            {"op": "create"},
+            {"op": "frobnicate"},
+            {"op": "create", "title": "A"},
+        ])
+        assert code == 1
+        assert results[0] == {"error": "Issue dp-404 not found"}
+        assert all("error" in result for result in results[1:4])
+        assert results[4] == {"created": "dp-001"}
+        assert list(store.load_issues()) == ["dp-001"]
+
+
+class TestChangeFeed:
+    """Tests for changes_since() cursors."""
+
+    def test_returns_only_new_events(self, project):
+        store.create_issue("one")
+        first = store.changes_since("")
+        assert [e["type"] for e in first["events"]] == ["created"]
+
+        store.add_note("dp-001", "hi")
+        write_events(project / ".issues" / "events-jb.jsonl", [created("jb-001", "2025-01-01T00:00:00Z")])
+        changes = store.changes_since(first["cursor"])
+        assert changes["reset"] is False
+        # Byte order, not timestamps, decides what is new: jb's older event is still reported
+        assert [e["id"] for e in changes["events"]] == ["jb-001", "dp-001"]
+        assert [i["id"] for i in changes["issues"]] == ["dp-001", "jb-001"]
+        assert changes["issues"][0]["notes"][0]["content"] == "hi"
+
+        assert store.changes_since(changes["cursor"])["events"] == []
+
+    def test_rewritten_file_resets(self, project):
+        store.create_issue("one")
+        cursor = store.changes_since("")["cursor"]
+        events_file = project / ".issues" / "events-dp.jsonl"
+        events_file.write_text(events_file.read_text().replace('"one"', '"uno"'))
+        changes = store.changes_since(cursor)
+        assert changes["reset"] is True
+        assert changes["issues"][0]["title"] == "uno"
+
+    def test_malformed_cursor(self, project):
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            store.changes_since("not-a-cursor")
@@ -0,0 +1,45 @@
+"""Tests for list output options shared by the CLIs."""
+
+import argparse
+import io
+import json
+
+import pytest
+
+from skill_issues.output import add_output_arguments, write_items
+
+ITEMS = [{"id": f"dp-{n:03d}", "title": f"Issue {n}", "priority": n % 3} for n in range(1, 6)]
+
+
+def render(*argv):
+    parser = argparse.ArgumentParser()
+    add_output_arguments(parser)
+    out = io.StringIO()
+    write_items(iter(ITEMS), parser.parse_args(argv), out)
+    return out.getvalue()
+
+
+class TestWriteItems:
+    """Tests for write_items()."""
+
+    def test_default_is_indented_array(self):
+        assert render() == json.dumps(ITEMS, indent=2) + "\n"
+
+    def test_ndjson_one_compact_object_per_line(self):
+        lines = render("--format", "ndjson").splitlines()
+        assert [json.loads(line) for line in lines] == ITEMS
+        assert lines[0] == '{"id":"dp-001","title":"Issue 1","priority":1}'
+
+    def test_fields_in_requested_order(self):
+        assert json.loads(render("--fields", "priority,id,missing"))[0] == {"priority": 1, "id": "dp-001"}
+
+    def test_offset_and_limit(self):
+        page = json.loads(render("--offset", "1", "--limit", "2"))
+        assert [item["id"] for item in page] == ["dp-002", "dp-003"]
+        assert render("--format", "ndjson", "--offset", "9") == ""
+
+    def test_negative_offset_or_limit_rejected(self, capsys):
+        for argv in (["--offset", "-5", "--limit", "2"], ["--limit", "-1"]):
+            with pytest.raises(SystemExit):
+                render(*argv)
+        assert "must not be negative" in capsys.readouterr().err
@@ -0,0 +1,57 @@
+"""Tests for find_project_root() and its cache."""
+
+import pytest
+
+import skill_issues
+from skill_issues import find_project_root, set_project_root
+
+
+@pytest.fixture
+def tree(tmp_path, monkeypatch):
+    """A project with a nested working directory, and no overrides."""
+    monkeypatch.delenv("SKILL_ISSUES_ROOT", raising=False)
+    set_project_root(None)
+    (tmp_path / ".issues").mkdir()
+    nested = tmp_path / "src" / "pkg"
+    nested.mkdir(parents=True)
+    monkeypatch.chdir(nested)
+    yield tmp_path.resolve()
+    set_project_root(None)
+
+
+class TestFindProjectRoot:
+    """Tests for find_project_root()."""
+
+    def test_walks_up_to_data_dir(self, tree):
+        assert find_project_root() == tree
+
+    def test_second_call_makes_no_stat_calls(self, tree):
+        find_project_root()
+        before = skill_issues.root_stat_calls
+        assert find_project_root() == tree
+        assert skill_issues.root_stat_calls == before
+
+    def test_cwd_change_resolves_again(self, tree, tmp_path_factory, monkeypatch):
+        find_project_root()
+        other = tmp_path_factory.mktemp("other")
+        (other / ".sessions").mkdir()
+        monkeypatch.chdir(other)
+        assert find_project_root() == other.resolve()
+
+    def test_env_var_is_part_of_key(self, tree, tmp_path_factory, monkeypatch):
+        find_project_root()
+        other = tmp_path_factory.mktemp("env")
+        monkeypatch.setenv("SKILL_ISSUES_ROOT", str(other))
+        assert find_project_root() == other.resolve()
+
+    def test_set_project_root_clears_cache(self, tree):
+        find_project_root()
+        (tree / "src" / ".issues").mkdir()
+        assert find_project_root() == tree
+        set_project_root(None)
+        assert find_project_root() == tree / "src"
+
+    def test_override_wins(self, tree, tmp_path_factory):
+        other = tmp_path_factory.mktemp("override")
+        set_project_root(other)
+        assert find_project_root() == other.resolve()
@@ -0,0 +1,127 @@
+"""Tests for the optional SQLite read model."""
+
+import json
+from unittest.mock import patch
+
+from skill_issues import readmodel
+from skill_issues.issues import store as issues_store
+from skill_issues.sessions import store as sessions_store
+
+
+def write_events(path, events, mode="a"):
+    """Write events to a JSONL file."""
+    with open(path, mode) as f:
+        for event in events:
+            f.write(json.dumps(event) + "\n")
+
+
+class TestIssuesReadModel:
+    """Tests for IssuesReadModel and store queries backed by it."""
+
+    def test_not_used_until_built(self, project):
+        issues_store.create_issue("one")
+        assert not issues_store.get_read_model_file().exists()
+        assert list(issues_store.query_issues()) == ["dp-001"]
+
+    def test_queries_match_log_replay(self, project):
+        issues_store.create_issue("base", labels=["infra"])
+        issues_store.create_issue("blocked", depends_on=["dp-001"])
+        issues_store.create_issue("closed dep")
+        issues_store.create_issue("unblocked", depends_on=["dp-003"], labels=["infra"])
+        issues_store.close_issue("dp-003", "done")
+        expected = {
+            view: issues_store.query_issues(view) for view in ["all", "open", "closed", "ready"]
+        }
+        expected_label = issues_store.query_issues("open", label="infra")
+
+        assert readmodel.build_issues_model() == 4
+        for view, issues in expected.items():
+            assert issues_store.query_issues(view) == issues
+        assert issues_store.query_issues("open", label="infra") == expected_label
+        assert set(issues_store.query_issues("ready")) == {"dp-001", "dp-004"}
+
+    def test_syncs_appended_events(self, project):
+        issues_store.create_issue("one")
+        readmodel.build_issues_model()
+        issues_store.add_note("dp-001", "hello")
+        issues_store.close_issue("dp-001", "done")
+        issue = issues_store.get_issue("dp-001")
+        assert issue["status"] == "closed"
+        assert [n["content"] for n in issue["notes"]] == ["hello"]
+
+    def test_rebuilds_after_rewrite(self, project):
+        events_file = project / ".issues" / "events-dp.jsonl"
+        issues_store.create_issue("one")
+        issues_store.create_issue("two")
+        readmodel.build_issues_model()
+        lines = events_file.read_text().splitlines()
+        events_file.write_text(lines[1] + "\n")
+        assert list(issues_store.query_issues("all")) == ["dp-002"]
+
+    def test_rebuilds_when_older_events_arrive(self, project):
+        write_events(project / ".issues" / "events-dp.jsonl", [
+            {"ts": "2025-01-01T00:00:00Z", "type": "created", "id": "dp-001", "title": "one"},
+            {"ts": "2025-01-03T00:00:00Z", "type": "updated", "id": "dp-001", "priority": 0},
+        ])
+        readmodel.build_issues_model()
+        write_events(project / ".issues" / "events-jb.jsonl", [
+            {"ts": "2025-01-02T00:00:00Z", "type": "updated", "id": "dp-001", "priority": 4},
+        ])
+        assert issues_store.get_issue("dp-001")["priority"] == 0
+
+    def test_rebuilds_when_same_time_events_arrive_in_earlier_file(self, project):
+        write_events(project / ".issues" / "events-dp.jsonl", [
+            {"ts": "2025-01-01T00:00:00Z", "type": "created", "id": "dp-001", "title": "one"},
+            {"ts": "2025-01-03T00:00:00Z", "type": "updated", "id": "dp-001", "priority": 0},
+        ])
+        readmodel.build_issues_model()
+        write_events(project / ".issues" / "events-ab.jsonl", [
+            {"ts": "2025-01-03T00:00:00Z", "type": "updated", "id": "dp-001", "priority": 4},
+        ])
+        assert issues_store.get_issue("dp-001")["priority"] == 0
+
+
+class TestSessionsReadModel:
+    """Tests for SessionsReadModel and store queries backed by it."""
+
+    def test_queries_match_log_replay(self, project):
+        sessions_dir = project / ".sessions"
+        (sessions_dir / "events-jb.jsonl").write_text(
+            '{"id":"jb-s001","user":"jb","date":"2025-01-02","issues_worked":["dp-001"]}\n'
+        )
+        (sessions_dir / "events.jsonl").write_text('{"id":"dp-s000","date":"2024-12-31"}\n')
+        sessions_store.create_session("one", issues_worked=["dp-001"])
+        sessions_store.amend_session(learnings=["folded"], issues_worked=["dp-002"])
+        expected_all = sessions_store.query_sessions()
+        expected_dp = sessions_store.query_sessions("dp")
+        expected_issue = sessions_store.query_sessions(issue="dp-001")
+
+        assert readmodel.build_sessions_model() == 3
+        assert sessions_store.query_sessions() == expected_all
+        assert sessions_store.query_sessions("dp") == expected_dp
+        assert sessions_store.query_sessions(issue="dp-001") == expected_issue
+        assert sessions_store.query_sessions(issue="dp-002")[0]["learnings"] == ["folded"]
+
+    def test_syncs_amendments(self, project):
+        sessions_store.create_session("one")
+        readmodel.build_sessions_model()
+        sessions_store.amend_session(next_actions=["later"])
+        assert sessions_store.query_sessions("dp")[0]["next_actions"] == ["later"]
+
+    def test_sync_applies_only_the_pending_range(self, project):
+        sessions_store.create_session("one", learnings=["a"])
+        readmodel.build_sessions_model()
+        sessions_store.amend_session(learnings=["b"])
+        events_file = project / ".sessions" / "events-dp.jsonl"
+        pending = readmodel.SessionsReadModel._pending_ranges
+
+        def append_during_sync(model, files):
+            ranges = pending(model, files)
+            write_events(events_file, [{"type": "amended", "id": "dp-s001", "learnings": ["concurrent"]}])
+            return ranges
+
+        with patch.object(readmodel.SessionsReadModel, "_pending_ranges", append_during_sync):
+            readmodel.build_sessions_model()
+        expected = sessions_store.load_sessions()[0]["learnings"]
+        assert expected == ["a", "b", "concurrent"]
+        assert sessions_store.query_sessions("dp")[0]["learnings"] == expected
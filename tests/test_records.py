@@ -0,0 +1,60 @@
+"""Tests for the compact issue and session record types."""
+
+import json
+
+from skill_issues.records import Issue, Session, to_json
+
+ISSUE = {
+    "id": "dp-002",
+    "title": "Second",
+    "type": "bug",
+    "priority": 1,
+    "description": "",
+    "depends_on": ["dp-001"],
+    "labels": ["infra"],
+    "created": "2025-01-01T00:00:00Z",
+    "status": "closed",
+    "notes": [{"ts": "2025-01-02T00:00:00Z", "content": "hi"}],
+    "updates": [
+        {"ts": "2025-01-03T00:00:00Z", "priority": {"from": 2, "to": 1}},
+        {"ts": "2025-01-04T00:00:00Z", "reason": "why", "depends_on": {"from": [], "to": ["dp-001"]}},
+    ],
+    "closed_reason": "done",
+    "closed_at": "2025-01-05T00:00:00Z",
+}
+
+
+class TestIssue:
+    """Tests for Issue records."""
+
+    def test_round_trips_to_identical_json(self):
+        issue = Issue.from_dict(ISSUE)
+        assert json.dumps(issue, default=to_json) == json.dumps(ISSUE)
+        assert issue == ISSUE
+
+    def test_open_issue_has_no_closed_keys(self):
+        issue = Issue.from_dict({k: v for k, v in ISSUE.items() if not k.startswith("closed_")})
+        assert "closed_at" not in issue
+        assert issue.get("closed_reason", "") == ""
+        assert list(issue)[-1] == "updates"
+
+    def test_has_no_instance_dict(self):
+        issue = Issue.from_dict(ISSUE)
+        assert not hasattr(issue, "__dict__")
+        assert not hasattr(issue.notes[0], "__dict__")
+
+
+class TestSession:
+    """Tests for Session records."""
+
+    def test_preserves_key_order_and_unknown_keys(self):
+        raw = '{"id":"s001","date":"2025-01-01","topic":"t","extra":1,"learnings":["x"]}'
+        session = Session(json.loads(raw))
+        assert json.dumps(session.to_dict(), separators=(",", ":")) == raw
+        assert "user" not in session
+
+    def test_setting_new_key_appends_it(self):
+        session = Session({"id": "dp-s001", "date": "2025-01-01"})
+        session["learnings"] = ["x"]
+        session["learnings"] = session["learnings"] + ["y"]
+        assert session.to_dict() == {"id": "dp-s001", "date": "2025-01-01", "learnings": ["x", "y"]}
@@ -1,9 +1,12 @@
 """Tests for sessions store with multi-user support."""
 
+import io
+import json
 from unittest.mock import patch
 
 import pytest
 
+from skill_issues.sessions import store
 from skill_issues.sessions.store import (
     filter_by_user,
     next_session_id,
@@ -142,6 +145,26 @@ class TestFilterByUser:
         assert len(result) == 1
         assert result[0]["id"] == "dp-s001"
 
+    def test_group_by_user_matches_filter_by_user(self):
+        sessions = [
+            {"id": "dp-s001"},
+            {"id": "s001"},
+            {"id": "jb-s001", "user": "jb"},
+            {"id": "dp-s002", "user": "dp"},
+            {"id": "jb-s002", "user": "dp"},  # The user field wins over the ID
+        ]
+        groups = store.group_by_user(sessions)
+        assert list(groups) == ["dp", "jb"]
+        for user, group in groups.items():
+            assert group == filter_by_user(sessions, user=user)
+        assert [s["id"] for s in groups["dp"]] == ["dp-s001", "dp-s002", "jb-s002"]
+
+    def test_group_by_user_parses_each_legacy_id_once(self):
+        sessions = [{"id": "dp-s001"}, {"id": "jb-s001"}, {"id": "dp-s002", "user": "dp"}]
+        with patch.object(store, "parse_session_id", wraps=parse_session_id) as parse:
+            store.group_by_user(sessions)
+        assert parse.call_count == 2
+
 
 class TestSessionsCLIUserFlag:
     """Tests for --user flag in sessions CLI."""
@@ -206,3 +229,147 @@ class TestSessionsCLIUserFlag:
 
         assert len(last_one) == 1
         assert last_one[0]["id"] == "dp-s002"
+
+
+class TestAppendSession:
+    """Tests for append_session() and create_session()."""
+
+    def test_appends_without_rewriting(self, project):
+        events_file = project / ".sessions" / "events-dp.jsonl"
+        # Existing history without a trailing newline
+        events_file.write_text('{"id":"dp-s001","user":"dp","date":"2025-01-01","topic":"first"}')
+        session = store.create_session("second", learnings=["a"])
+        assert session["id"] == "dp-s002"
+        lines = events_file.read_text().splitlines()
+        assert [json.loads(line)["topic"] for line in lines] == ["first", "second"]
+
+
+class TestAmendSession:
+    """Tests for amend_session() and amendment folding."""
+
+    def test_amend_appends_event(self, project):
+        store.create_session("topic", learnings=["first"], issues_worked=["dp-001"])
+        events_file = project / ".sessions" / "events-dp.jsonl"
+        before = events_file.read_text()
+
+        session = store.amend_session(learnings=["second"], issues_worked=["dp-001", "dp-002"])
+
+        assert session["learnings"] == ["first", "second"]
+        assert session["issues_worked"] == ["dp-001", "dp-002"]
+        content = events_file.read_text()
+        assert content.startswith(before)
+        amendment = json.loads(content[len(before):])
+        assert amendment["type"] == "amended"
+        assert amendment["issues_worked"] == ["dp-002"]
+
+    def test_amendments_folded_on_load(self, project):
+        store.create_session("one")
+        store.create_session("two")
+        store.amend_session("dp-s001", open_questions=["why?"])
+        store.amend_session(next_actions=["do it"])
+
+        sessions = store.load_sessions()
+        assert [s["id"] for s in sessions] == ["dp-s001", "dp-s002"]
+        assert sessions[0]["open_questions"] == ["why?"]
+        assert sessions[1]["next_actions"] == ["do it"]
+
+    def test_unknown_session_returns_none(self, project):
+        store.create_session("one")
+        assert store.amend_session("dp-s999", learnings=["x"]) is None
+
+
+class TestLoadSessions:
+    """Tests for merging per-user session files."""
+
+    def test_files_merged_by_date_then_id(self, project):
+        sessions_dir = project / ".sessions"
+        (sessions_dir / "events-dp.jsonl").write_text(
+            '{"id":"dp-s001","user":"dp","date":"2025-01-01"}\n'
+            '{"id":"dp-s002","user":"dp","date":"2025-01-03"}\n'
+        )
+        (sessions_dir / "events-jb.jsonl").write_text(
+            '{"id":"jb-s002","user":"jb","date":"2025-01-02"}\n'
+            '{"id":"jb-s001","user":"jb","date":"2025-01-01"}\n'
+        )
+        ids = [s["id"] for s in store.load_sessions()]
+        assert ids == ["dp-s001", "jb-s001", "jb-s002", "dp-s002"]
+
+
+class TestAllocateSessionId:
+    """Tests for allocate_session_id()."""
+
+    def test_ignores_other_users_and_amendments(self, project):
+        sessions_dir = project / ".sessions"
+        (sessions_dir / "events-dp.jsonl").write_text(
+            '{"id":"dp-s003","user":"dp","date":"2025-01-01"}\n'
+            '{"type":"amended","id":"dp-s003","learnings":["x"]}\n'
+        )
+        (sessions_dir / "events-jb.jsonl").write_text('{"id":"jb-s009","user":"jb","date":"2025-01-01"}\n')
+        assert store.allocate_session_id() == "dp-s004"
+
+    def test_create_session_does_not_load_all_sessions(self, project):
+        with patch.object(store, "load_sessions") as load:
+            assert store.create_session("one")["id"] == "dp-s001"
+            assert store.create_session("two")["id"] == "dp-s002"
+        load.assert_not_called()
+
+
+class TestSessionBatch:
+    """Tests for SessionBatch and `sessions batch`."""
+
+    def test_create_then_amend_in_one_append(self, project):
+        from skill_issues.batch import run_batch
+        from skill_issues.sessions.cli import batch_handlers
+
+        store.create_session("earlier")
+        batch = store.SessionBatch()
+        out = io.StringIO()
+        lines = [
+            '{"op": "create", "topic": "one", "learnings": ["a"]}',
+            '{"op": "amend", "learnings": ["b"], "issues_worked": "dp-001"}',
+            '{"op": "amend", "id": "dp-s001", "next_actions": ["c"]}',
+            '{"op": "amend", "id": "dp-s404", "learnings": ["x"]}',
+        ]
+        with patch.object(store, "append_records", wraps=store.append_records) as append:
+            code = run_batch(lines, batch_handlers(batch), batch.commit, out)
+        assert code == 1
+        results = [json.loads(line) for line in out.getvalue().splitlines()]
+        assert results[0]["id"] == "dp-s002"
+        assert results[1:3] == [{"amended": "dp-s002"}, {"amended": "dp-s001"}]
+        assert "error" in results[3]
+        assert append.call_count == 1
+
+        sessions = store.load_sessions()
+        assert sessions[0]["next_actions"] == ["c"]
+        assert sessions[1]["learnings"] == ["a", "b"]
+        assert sessions[1]["issues_worked"] == ["dp-001"]
+
+
+class TestSessionSearch:
+    """Tests for the sessions browser's search index."""
+
+    SESSIONS = [
+        {"id": "dp-s001", "topic": "Board layout", "learnings": ["Cards need a fixed height"]},
+        {"id": "dp-s002", "topic": "Daemon", "open_questions": ["Socket path on macOS?"]},
+        {"id": "dp-s003", "topic": "Snapshots", "next_actions": ["Cache the board"]},
+    ]
+
+    def test_matches_topic_learnings_questions_and_actions(self):
+        from skill_issues.sessions.tui import SessionSearch
+
+        search = SessionSearch(self.SESSIONS)
+        assert [s["id"] for s in search.search("BOARD")] == ["dp-s001", "dp-s003"]
+        assert [s["id"] for s in search.search("socket")] == ["dp-s002"]
+        assert search.search("") == self.SESSIONS
+
+    def test_extended_query_narrows_previous_matches(self):
+        from skill_issues.sessions.tui import SessionSearch
+
+        search = SessionSearch(self.SESSIONS)
+        first = search.search("ca")
+        assert [s["id"] for s in first] == ["dp-s001", "dp-s003"]
+        # An extension that drops nothing returns the same list
+        assert search.search("ca ") is not first
+        assert [s["id"] for s in search.search("cac")] == ["dp-s003"]
+        assert search.search("cach") is search.search("cache")
+        assert [s["id"] for s in search.search("c")] == ["dp-s001", "dp-s002", "dp-s003"]
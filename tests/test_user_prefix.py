@@ -9,8 +9,11 @@ import pytest
 from skill_issues import (
     PrefixError,
     _derive_prefix_from_name,
+    _get_git_config,
     _validate_prefix,
     get_user_prefix,
+    gitconfig,
+    set_project_root,
 )
 
 
@@ -133,3 +136,105 @@ class TestGetUserPrefix:
                 mock.side_effect = lambda k: "x" if k == "skill-issues.prefix" else None
                 with pytest.raises(PrefixError, match="at least 2"):
                     get_user_prefix()
+
+
+@pytest.fixture
+def global_config(tmp_path, monkeypatch):
+    """Isolate git config to one global file in a project outside any repo."""
+    config = tmp_path / "gitconfig"
+    config.write_text("[user]\n\tname = David Page\n")
+    monkeypatch.setenv("GIT_CONFIG_GLOBAL", str(config))
+    monkeypatch.setenv("GIT_CONFIG_NOSYSTEM", "1")
+    monkeypatch.setenv("GIT_CEILING_DIRECTORIES", str(tmp_path.parent))
+    monkeypatch.delenv("GIT_DIR", raising=False)
+    project = tmp_path / "project"
+    (project / ".issues").mkdir(parents=True)
+    monkeypatch.chdir(project)
+    set_project_root(project)
+    gitconfig.clear_cache()
+    yield config
+    gitconfig.clear_cache()
+    set_project_root(None)
+
+
+class TestParseGitConfig:
+    """Tests for gitconfig._parse_config()."""
+
+    def test_last_value_wins(self):
+        text = "[user]\n  name = A B\n[User]\n  Name = C D\n"
+        assert gitconfig._parse_config(text, ("user.name",)) == {"user.name": "C D"}
+
+    def test_quotes_escapes_and_comments(self):
+        text = '[skill-issues]\nprefix = "d p" ; comment\n[user]\nname = "A \\"B\\"" # x\n'
+        assert gitconfig._parse_config(text, ("skill-issues.prefix", "user.name")) == {
+            "skill-issues.prefix": "d p",
+            "user.name": 'A "B"',
+        }
+
+    def test_subsections_do_not_match(self):
+        text = '[user "work"]\nname = A B\n'
+        assert gitconfig._parse_config(text, ("user.name",)) == {}
+
+    def test_include_is_unsupported(self):
+        with pytest.raises(gitconfig._UnsupportedConfig):
+            gitconfig._parse_config("[include]\npath = other\n", ("user.name",))
+
+
+class TestGitConfigCache:
+    """Tests for resolving git config without spawning git."""
+
+    def test_reads_files_without_git(self, global_config):
+        with patch("skill_issues.gitconfig._run_git_config") as run:
+            assert _get_git_config("user.name") == "David Page"
+            assert _get_git_config("skill-issues.prefix") is None
+        run.assert_not_called()
+
+    def test_matches_git(self, global_config):
+        global_config.write_text('[user]\n\tname = "Jean  Dupont"  # note\n[skill-issues]\n\tprefix = jd\n')
+        assert _get_git_config("user.name") == gitconfig._run_git_config("user.name")
+        assert _get_git_config("skill-issues.prefix") == "jd"
+
+    def test_resolves_once_per_process(self, global_config):
+        _get_git_config("user.name")
+        with patch("skill_issues.gitconfig._read_config_files") as read:
+            assert _get_git_config("user.name") == "David Page"
+        read.assert_not_called()
+
+    def test_reuses_disk_cache_until_config_changes(self, global_config):
+        _get_git_config("user.name")
+        assert (global_config.parent / "project" / ".issues" / ".cache" / "git-config.json").exists()
+        gitconfig.clear_cache()
+        with patch("skill_issues.gitconfig._read_config_files") as read:
+            assert _get_git_config("user.name") == "David Page"
+        read.assert_not_called()
+
+        global_config.write_text("[user]\n\tname = Alice Smith\n")
+        gitconfig.clear_cache()
+        assert _get_git_config("user.name") == "Alice Smith"
+
+    def test_includes_fall_back_to_git(self, global_config):
+        global_config.write_text(global_config.read_text() + "[include]\n\tpath = missing\n")
+        with patch("skill_issues.gitconfig._run_git_config", return_value="Git User") as run:
+            assert _get_git_config("user.name") == "Git User"
+        assert run.call_count == len(gitconfig.GIT_CONFIG_KEYS)
+
+    def test_included_files_are_reread_in_new_processes(self, global_config):
+        included = global_config.parent / "local.inc"
+        included.write_text("[user]\n\tname = Alice Smith\n")
+        global_config.write_text(f"[include]\n\tpath = {included}\n")
+        assert _get_git_config("user.name") == "Alice Smith"
+        assert not (global_config.parent / "project" / ".issues" / ".cache" / "git-config.json").exists()
+
+        included.write_text("[user]\n\tname = Bob Jones\n")
+        gitconfig.clear_cache()
+        assert _get_git_config("user.name") == "Bob Jones"
+
+    def test_switching_project_root_rereads_repo_config(self, global_config, monkeypatch):
+        for name in ["aa", "bb"]:
+            repo = global_config.parent / name
+            (repo / ".git").mkdir(parents=True)
+            (repo / ".git" / "config").write_text(f"[skill-issues]\n\tprefix = {name}\n")
+        for name in ["aa", "bb"]:
+            monkeypatch.chdir(global_config.parent / name)
+            set_project_root(global_config.parent / name)
+            assert _get_git_config("skill-issues.prefix") == name
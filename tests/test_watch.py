@@ -0,0 +1,38 @@
+"""Tests for DirectoryWatcher."""
+
+import pytest
+
+from skill_issues import watch
+from skill_issues.watch import DirectoryWatcher
+
+
+@pytest.fixture(params=["inotify", "polling"])
+def watcher(request, tmp_path, monkeypatch):
+    """A watcher on an empty directory, in each detection mode."""
+    if request.param == "polling":
+        monkeypatch.setattr(watch, "_inotify_fd", lambda directory: None)
+    w = DirectoryWatcher(tmp_path, "events*.jsonl")
+    if request.param == "inotify" and not w.uses_inotify:
+        pytest.skip("inotify not available")
+    yield w
+    w.close()
+
+
+class TestDirectoryWatcher:
+    """Tests for DirectoryWatcher.changed()."""
+
+    def test_reports_new_and_appended_files_once(self, watcher):
+        assert not watcher.changed()
+        events_file = watcher.directory / "events-dp.jsonl"
+        events_file.write_text("{}\n")
+        assert watcher.changed()
+        assert not watcher.changed()
+        with open(events_file, "a") as f:
+            f.write("{}\n")
+        assert watcher.changed()
+
+    def test_ignores_other_files(self, watcher):
+        (watcher.directory / "notes.txt").write_text("x")
+        (watcher.directory / ".cache").mkdir()
+        (watcher.directory / ".cache" / "events-snapshot.jsonl").write_text("x")
+        assert not watcher.changed()